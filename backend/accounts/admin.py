@@ -1,9 +1,24 @@
-from django.contrib import admin
+from django.contrib import admin, messages
 from .models import User
+from .services import bulk_update_users
 
 @admin.register(User)
 class UserAdmin(admin.ModelAdmin):
     list_display = ('username', 'email', 'first_name', 'last_name', 'role', 'is_active', 'is_staff')
     list_filter = ('role', 'is_active')
+    # Served by the trigram indexes on User
     search_fields = ('username', 'email', 'first_name', 'last_name')
-    ordering = ('username',)
\ No newline at end of file
+    ordering = ('username',)
+    # Skip the unfiltered COUNT(*) over the whole table on every search
+    show_full_result_count = False
+    actions = ('deactivate_users', 'reactivate_users')
+
+    @admin.action(description='Deactivate selected users')
+    def deactivate_users(self, request, queryset):
+        updated = bulk_update_users(request.user, queryset.values_list('pk', flat=True), 'deactivate')
+        self.message_user(request, f'Deactivated {updated} users.', messages.SUCCESS)
+
+    @admin.action(description='Reactivate selected users')
+    def reactivate_users(self, request, queryset):
+        updated = bulk_update_users(request.user, queryset.values_list('pk', flat=True), 'reactivate')
+        self.message_user(request, f'Reactivated {updated} users.', messages.SUCCESS)
@@ -0,0 +1,94 @@
+"""
+Claims-based JWT authentication.
+
+Tokens carry the user's id, username, role, company id and token version, so
+an authenticated request needs no `User` query: the user is rebuilt from the
+claims with every other field deferred (see `User.from_claims`), and views
+that need the full row load it on first access.
+
+Revocation works through the token version. Changing a user's role, company,
+active flag or password bumps it, and tokens with an older version are
+rejected. The current version is read from the cache and only falls back to
+the database on a miss. Changes write the new version to the cache when they
+commit, and a miss only fills the cache if nothing was written meanwhile.
+
+Refresh tokens are blacklisted on rotation and logout in the store from
+accounts.token_blacklist rather than in database tables.
+"""
+
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from core.utils.cache_keys import user_token_version_key
+
+from . import token_blacklist
+from .models import REVOKED, TOKEN_VERSION_TTL, User
+
+
+def current_token_version(user_id):
+    key = user_token_version_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        version = (
+            User.objects.filter(pk=user_id, is_active=True)
+            .values_list("token_version", flat=True)
+            .first()
+        )
+        if version is None:
+            version = REVOKED
+        # add, not set: a version published by a concurrent change wins
+        cache.add(key, version, TOKEN_VERSION_TTL)
+    return version
+
+
+class ClaimsRefreshToken(RefreshToken):
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        token["username"] = user.username
+        token["role"] = user.role
+        token["company_id"] = user.company_id
+        token["ver"] = user.token_version
+        return token
+
+    def verify(self, *args, **kwargs):
+        super().verify(*args, **kwargs)
+        self.check_blacklist()
+
+    def check_blacklist(self):
+        if token_blacklist.is_blacklisted(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_("Token is blacklisted"))
+
+    def blacklist(self):
+        """
+        Blacklist this token until it expires. Refuses tokens that already
+        were, so a refresh token can only be rotated once.
+        """
+        if not token_blacklist.blacklist(self.payload[api_settings.JTI_CLAIM], self.payload["exp"]):
+            raise TokenError(_("Token is blacklisted"))
+
+
+def check_token_version(token):
+    user_id = token[api_settings.USER_ID_CLAIM]
+    if token.get("ver") != current_token_version(user_id):
+        raise AuthenticationFailed(_("Token has been revoked"), code="token_revoked")
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    def get_user(self, validated_token):
+        if "ver" not in validated_token:
+            # Issued before claims were added; look the user up as before
+            return super().get_user(validated_token)
+
+        check_token_version(validated_token)
+        return User.from_claims(
+            user_id=validated_token[api_settings.USER_ID_CLAIM],
+            username=validated_token["username"],
+            role=validated_token["role"],
+            company_id=validated_token["company_id"],
+            token_version=validated_token["ver"],
+        )
@@ -0,0 +1,17 @@
+from django.core.mail import EmailMessage
+
+from core.mail import DEFAULT_FROM_EMAIL
+
+from .models import User
+
+
+def welcome_messages(user_ids):
+    return {
+        user.id: EmailMessage(
+            subject="Welcome to Job Board",
+            body=f"Hi {user.first_name}, welcome to Job Board!",
+            from_email=DEFAULT_FROM_EMAIL,
+            to=[user.email],
+        )
+        for user in User.objects.filter(id__in=user_ids).only("id", "first_name", "email")
+    }
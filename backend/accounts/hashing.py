@@ -0,0 +1,157 @@
+"""
+Password hashing on a bounded per-process pool.
+
+Password hashes are slow on purpose, so a login storm would otherwise pin
+every worker thread on hashing and stall unrelated requests. Credentials are
+verified on a small thread pool instead: LOGIN_HASHING_WORKERS hashes run at
+once, up to LOGIN_HASHING_QUEUE more wait for a thread, and logins beyond
+that are refused at once with HashingBusy rather than queueing behind them.
+
+Only the hashing runs on the pool; the user lookup and the save of an
+upgraded hash stay on the request thread and its database connection.
+
+Bulk jobs that hash many new passwords at once use `hash_passwords`, which
+spreads them across a process pool instead.
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import get_hasher, make_password, verify_password
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+# Below this many passwords a process pool costs more than it saves
+MIN_PARALLEL_PASSWORDS = 8
+
+
+class HashingBusy(Exception):
+    """
+    Raised when the hashing pool and its queue are full.
+    """
+
+
+class BoundedExecutor:
+    def __init__(self, workers, queue_size):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hashing")
+        self.slots = threading.BoundedSemaphore(workers + queue_size)
+
+    def submit(self, fn, *args):
+        if not self.slots.acquire(blocking=False):
+            raise HashingBusy
+        try:
+            future = self.executor.submit(fn, *args)
+        except BaseException:
+            self.slots.release()
+            raise
+        future.add_done_callback(lambda _: self.slots.release())
+        return future
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = BoundedExecutor(
+                settings.LOGIN_HASHING_WORKERS, settings.LOGIN_HASHING_QUEUE
+            )
+        return _executor
+
+
+def reset_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown()
+        _executor = None
+
+
+@receiver(setting_changed)
+def hashing_settings_changed(setting, **kwargs):
+    if setting in ("LOGIN_HASHING_WORKERS", "LOGIN_HASHING_QUEUE"):
+        reset_executor()
+
+
+def _reset_after_fork():
+    # Pool threads do not survive a fork (e.g. gunicorn --preload)
+    global _executor, _executor_lock
+    _executor = None
+    _executor_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def run_hashing(fn, *args):
+    """
+    Run `fn` on the hashing pool and wait for its result.
+    """
+    return get_executor().submit(fn, *args).result()
+
+
+def check_credentials(username, password):
+    """
+    Return the active user with these credentials, or None.
+
+    Mirrors ModelBackend.authenticate with the hashing moved to the pool. A
+    hash made with an outdated hasher or work factor is replaced with one
+    from the preferred hasher.
+    """
+    User = get_user_model()
+    try:
+        user = User._default_manager.get_by_natural_key(username)
+    except User.DoesNotExist:
+        # Hash anyway so unknown usernames take as long as wrong passwords
+        run_hashing(make_password, password)
+        return None
+
+    is_correct, must_update = run_hashing(verify_password, password, user.password)
+    if not is_correct:
+        return None
+    if must_update:
+        # Assigning the hash directly keeps the token version: the password
+        # itself has not changed
+        user.password = run_hashing(make_password, password)
+        user.save(update_fields=["password"])
+    return user if user.is_active else None
+
+
+def _encode(hasher_path, password):
+    # Runs in a pool process: the hasher is passed by path so the process
+    # needs neither Django settings nor app loading
+    hasher = import_string(hasher_path)()
+    return hasher.encode(password, hasher.salt())
+
+
+def hash_passwords(passwords, processes=None):
+    """
+    Hash `passwords` with the preferred hasher across a process pool.
+
+    A None password gives an unusable password, as with make_password.
+    With `processes=1` they are hashed in the calling process.
+    """
+    if processes == 1 or len(passwords) < MIN_PARALLEL_PASSWORDS:
+        return [make_password(password) for password in passwords]
+
+    hasher = get_hasher()
+    encode = partial(_encode, f"{type(hasher).__module__}.{type(hasher).__qualname__}")
+    usable = [password for password in passwords if password is not None]
+    # Spawned rather than forked: the caller may be a threaded web worker
+    with ProcessPoolExecutor(
+        max_workers=processes, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        hashed = iter(list(pool.map(encode, usable, chunksize=max(len(usable) // 32, 1))))
+    return [make_password(None) if password is None else next(hashed) for password in passwords]
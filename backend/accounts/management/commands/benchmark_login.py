@@ -0,0 +1,100 @@
+import statistics
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth import authenticate, get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from accounts.hashing import HashingBusy, check_credentials, reset_executor
+
+PASSWORD = "Benchmark-Passw0rd!"
+
+
+class Command(BaseCommand):
+    help = (
+        "Simulate a login storm on one worker process and compare hashing "
+        "passwords inline with the bounded hashing pool. Reports login "
+        "outcomes and the latency of unrelated requests served meanwhile."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--logins", type=int, default=200)
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=8,
+            help="Request threads of the simulated worker (gunicorn --threads).",
+        )
+        parser.add_argument(
+            "--probe-interval",
+            type=float,
+            default=0.01,
+            help="Seconds between unrelated requests sent during the storm.",
+        )
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        username = f"benchmark-{uuid.uuid4().hex[:12]}"
+        user = User.objects.create_user(
+            username=username, email=f"{username}@example.com", password=PASSWORD
+        )
+        try:
+            self.stdout.write(
+                f"{'mode':<8} {'ok':>5} {'503':>5} {'login p50':>10} {'login p95':>10} "
+                f"{'other p50':>10} {'other p95':>10} {'total':>8}"
+            )
+            for mode, login in (
+                ("inline", lambda: authenticate(username=username, password=PASSWORD)),
+                ("pool", lambda: check_credentials(username, PASSWORD)),
+            ):
+                reset_executor()
+                self._report(mode, self._storm(login, user.pk, **options))
+        finally:
+            user.delete()
+
+    def _storm(self, login, user_id, logins, threads, probe_interval, **options):
+        login_times, probe_times, outcomes = [], [], {"ok": 0, "busy": 0}
+        lock = threading.Lock()
+
+        def run_login():
+            started = time.perf_counter()
+            try:
+                outcome = "ok" if login() else "failed"
+            except HashingBusy:
+                outcome = "busy"
+            finally:
+                connection.close()
+            with lock:
+                login_times.append(time.perf_counter() - started)
+                outcomes[outcome] = outcomes.get(outcome, 0) + 1
+
+        def run_probe(submitted):
+            get_user_model().objects.filter(pk=user_id).exists()
+            connection.close()
+            with lock:
+                probe_times.append(time.perf_counter() - submitted)
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as worker:
+            storm = [worker.submit(run_login) for _ in range(logins)]
+            while not all(future.done() for future in storm):
+                worker.submit(run_probe, time.perf_counter())
+                time.sleep(probe_interval)
+        return outcomes, login_times, probe_times, time.perf_counter() - started
+
+    def _report(self, mode, result):
+        outcomes, login_times, probe_times, total = result
+        self.stdout.write(
+            f"{mode:<8} {outcomes['ok']:>5} {outcomes['busy']:>5} "
+            f"{self._ms(login_times, 50):>10} {self._ms(login_times, 95):>10} "
+            f"{self._ms(probe_times, 50):>10} {self._ms(probe_times, 95):>10} "
+            f"{total:>7.2f}s"
+        )
+
+    def _ms(self, values, percentile):
+        if len(values) < 2:
+            return "-"
+        return f"{statistics.quantiles(values, n=100)[percentile - 1] * 1000:.1f}ms"
@@ -0,0 +1,53 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from accounts.token_blacklist import blacklist
+
+BLACKLIST_APP = "rest_framework_simplejwt.token_blacklist"
+
+
+class Command(BaseCommand):
+    help = (
+        "Copy unexpired blacklisted refresh tokens from the simplejwt "
+        "token_blacklist tables into the token blacklist store."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Rows fetched per query.",
+        )
+        parser.add_argument(
+            "--delete",
+            action="store_true",
+            help="Delete the outstanding and blacklisted token rows afterwards.",
+        )
+
+    def handle(self, *args, **options):
+        if not apps.is_installed(BLACKLIST_APP):
+            raise CommandError(
+                f"{BLACKLIST_APP} is not in INSTALLED_APPS; there are no tables to migrate."
+            )
+        from rest_framework_simplejwt.token_blacklist.models import (
+            BlacklistedToken,
+            OutstandingToken,
+        )
+
+        rows = (
+            BlacklistedToken.objects.filter(token__expires_at__gt=timezone.now())
+            .values_list("token__jti", "token__expires_at")
+            .iterator(chunk_size=options["batch_size"])
+        )
+        migrated = 0
+        for jti, expires_at in rows:
+            blacklist(jti, expires_at.timestamp())
+            migrated += 1
+        self.stdout.write(f"Migrated {migrated} blacklisted tokens.")
+
+        if options["delete"]:
+            # Blacklisted rows cascade with their outstanding token
+            deleted, _ = OutstandingToken.objects.all().delete()
+            self.stdout.write(f"Deleted {deleted} token rows.")
@@ -0,0 +1,51 @@
+import csv
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.provisioning import provision_employers
+from accounts.serializers import EmployerProvisionSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "Create EMPLOYER accounts for a company from a CSV file with columns "
+        "username, email and optionally first_name, last_name, password."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("company_id", type=int)
+        parser.add_argument("csv_file", help="Path to the CSV file, or - for stdin.")
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=None,
+            help="Password hashing processes (default: one per CPU).",
+        )
+
+    def handle(self, *args, **options):
+        if options["csv_file"] == "-":
+            members = self._read(sys.stdin)
+        else:
+            with open(options["csv_file"], newline="") as f:
+                members = self._read(f)
+
+        serializer = EmployerProvisionSerializer(
+            data={"company": options["company_id"], "members": members}
+        )
+        if not serializer.is_valid():
+            raise CommandError(serializer.errors)
+
+        users = provision_employers(
+            serializer.validated_data["company"],
+            serializer.validated_data["members"],
+            processes=options["processes"],
+        )
+        self.stdout.write(f"Created {len(users)} employer accounts.")
+
+    def _read(self, f):
+        # Empty cells mean "not given", e.g. no password
+        return [
+            {key: value for key, value in row.items() if value}
+            for row in csv.DictReader(f)
+        ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.10 on 2026-10-19 02:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_rename_company_name_user_company'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='application_digest',
+            field=models.CharField(choices=[('NEVER', 'Never'), ('HOURLY', 'Hourly'), ('DAILY', 'Daily')], default='DAILY', max_length=10),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='application_digest_sent_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
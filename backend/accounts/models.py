@@ -1,5 +1,33 @@
 from django.contrib.auth.models import AbstractUser
-from django.db import models
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.core.cache import cache
+from django.db import models, router, transaction
+from django.db.models.functions import Upper
+
+from core.utils.cache_keys import user_token_version_key
+
+# Fields carried as JWT claims (see accounts.authentication). Changing any of
+# these, or the password, revokes the user's tokens.
+REVOKING_FIELDS = ("role", "company_id", "is_active")
+
+TOKEN_VERSION_TTL = 60 * 60  # 1 hour; rewritten whenever the version changes
+
+# Cached for users that no longer exist or were deactivated
+REVOKED = -1
+
+
+def publish_token_versions(versions):
+    """
+    Write `versions` ({user id: token version}) to the cache once the current
+    transaction commits.
+
+    The new value is written rather than the key deleted: cache fills only
+    add missing keys (see accounts.authentication.current_token_version), so
+    a request that read the old version just before the commit cannot put it
+    back afterwards.
+    """
+    entries = {user_token_version_key(pk): version for pk, version in versions.items()}
+    transaction.on_commit(lambda: cache.set_many(entries, TOKEN_VERSION_TTL))
 
 
 class User(AbstractUser):
@@ -12,6 +40,11 @@ class User(AbstractUser):
         EMPLOYER = "EMPLOYER", "Employer"
         JOB_SEEKER = "JOB_SEEKER", "Job Seeker"
 
+    class DigestFrequency(models.TextChoices):
+        NEVER = "NEVER", "Never"
+        HOURLY = "HOURLY", "Hourly"
+        DAILY = "DAILY", "Daily"
+
     role = models.CharField(
         max_length=20,
         choices=Role.choices,
@@ -26,6 +59,92 @@ class User(AbstractUser):
         related_name="users",
     )
 
+    # How often employers are emailed a summary of new applications
+    application_digest = models.CharField(
+        max_length=10,
+        choices=DigestFrequency.choices,
+        default=DigestFrequency.DAILY,
+    )
+    # Applications created up to this time have been included in a digest
+    application_digest_sent_at = models.DateTimeField(null=True, blank=True)
+
+    # Tokens carrying another version are rejected
+    token_version = models.PositiveIntegerField(default=0, editable=False)
+
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Admin search matches substrings case-insensitively, which Django
+            # compiles to UPPER(column) LIKE UPPER('%term%'); trigram indexes
+            # on the same expressions serve it without a table scan.
+            GinIndex(OpClass(Upper("username"), name="gin_trgm_ops"), name="user_username_trgm"),
+            GinIndex(OpClass(Upper("email"), name="gin_trgm_ops"), name="user_email_trgm"),
+            GinIndex(OpClass(Upper("first_name"), name="gin_trgm_ops"), name="user_first_name_trgm"),
+            GinIndex(OpClass(Upper("last_name"), name="gin_trgm_ops"), name="user_last_name_trgm"),
+            # Cursor pagination of the admin user list
+            models.Index(fields=["date_joined"], name="user_date_joined_idx"),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_claims = {
+            field: instance.__dict__[field]
+            for field in REVOKING_FIELDS
+            if field in instance.__dict__
+        }
+        return instance
+
+    @classmethod
+    def from_claims(cls, user_id, username, role, company_id, token_version):
+        """
+        Build an authenticated user from verified JWT claims without a query.
+
+        Every other field is deferred; touching one loads them all at once.
+        """
+        claims = {
+            "id": cls._meta.pk.to_python(user_id),
+            "username": username,
+            "role": role,
+            "company_id": company_id,
+            "is_active": True,
+            "token_version": token_version,
+        }
+        # from_db expects values in concrete field order
+        field_names = [
+            field.attname for field in cls._meta.concrete_fields if field.attname in claims
+        ]
+        return cls.from_db(
+            router.db_for_read(cls),
+            field_names,
+            [claims[name] for name in field_names],
+        )
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        # Load every deferred field together instead of one query per field
+        if fields is not None:
+            deferred = self.get_deferred_fields()
+            if deferred.intersection(fields):
+                fields = deferred.union(fields)
+        super().refresh_from_db(using, fields, **kwargs)
+
+    def save(self, *args, **kwargs):
+        loaded = getattr(self, "_loaded_claims", {})
+        revoke = not self._state.adding and (
+            self._password is not None
+            or any(self.__dict__.get(field) != value for field, value in loaded.items())
+        )
+        if revoke:
+            self.token_version += 1
+            if kwargs.get("update_fields") is not None:
+                kwargs["update_fields"] = {*kwargs["update_fields"], "token_version"}
+
+        super().save(*args, **kwargs)
+        if revoke:
+            # A deferred is_active means a claims user, who is active
+            active = self.__dict__.get("is_active", True)
+            publish_token_versions({self.pk: self.token_version if active else REVOKED})
+        self._loaded_claims = {field: self.__dict__.get(field) for field in REVOKING_FIELDS}
+
     def is_admin(self):
         return self.role == self.Role.ADMIN
 
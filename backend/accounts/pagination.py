@@ -0,0 +1,15 @@
+from rest_framework.pagination import CursorPagination
+
+
+class UserCursorPagination(CursorPagination):
+    """
+    Cursor pagination for the admin user list.
+
+    Cursors seek on the indexed ordering column instead of using OFFSET, so
+    deep pages cost the same as the first one.
+    """
+
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
+    ordering = "-date_joined"
@@ -0,0 +1,59 @@
+"""
+Bulk provisioning of employer accounts for a company.
+
+Creating a team one user at a time hashes each password serially and sends a
+welcome email per save. Here the passwords are hashed in parallel on a
+process pool (for the management command; the API only takes small batches
+and hashes them in the web worker), the users are inserted with bulk_create,
+and one welcome message per user is queued together so the batched mail
+flush sends them over a single connection (bulk_create bypasses the
+post_save signal).
+"""
+
+from django.db import IntegrityError, transaction
+from rest_framework.exceptions import ValidationError
+
+from core.mail import queue_email
+
+from .hashing import hash_passwords
+from .models import User
+
+BATCH_SIZE = 500
+
+# Members per API request. The API hashes passwords in the web worker, one at
+# a time, so a request stays well within the worker timeout; larger teams go
+# through the provision_employers command, which uses a process pool.
+API_MAX_MEMBERS = 20
+
+
+def provision_employers(company, members, processes=None):
+    """
+    Create EMPLOYER users linked to `company`.
+
+    `members` are dicts with username, email and optionally first_name,
+    last_name and password; members without a password get an unusable
+    one. Passwords are hashed on `processes` processes (see hash_passwords).
+    Returns the created users.
+    """
+    passwords = hash_passwords([member.get("password") for member in members], processes)
+    users = [
+        User(
+            username=member["username"],
+            email=member["email"],
+            first_name=member.get("first_name", ""),
+            last_name=member.get("last_name", ""),
+            role=User.Role.EMPLOYER,
+            company=company,
+            password=password,
+        )
+        for member, password in zip(members, passwords)
+    ]
+
+    try:
+        with transaction.atomic():
+            created = User.objects.bulk_create(users, batch_size=BATCH_SIZE)
+            queue_email("accounts.emails.welcome_messages", *(user.pk for user in created))
+    except IntegrityError:
+        # Lost a race with another signup for one of the usernames or emails
+        raise ValidationError({"members": ["A username or email is already registered."]})
+    return created
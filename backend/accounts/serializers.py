@@ -1,8 +1,23 @@
 from django.contrib.auth import get_user_model
+from django.contrib.auth.models import update_last_login
 from django.contrib.auth.password_validation import validate_password
+from django.contrib.auth.validators import UnicodeUsernameValidator
 from django.core.exceptions import ValidationError
+from django.db.models import Q
+from jobs.models import Company
 from jobs.serializers import CompanySerializer
-from rest_framework import serializers
+from rest_framework import exceptions, serializers
+from rest_framework_simplejwt.serializers import (
+    TokenBlacklistSerializer,
+    TokenObtainPairSerializer,
+    TokenRefreshSerializer,
+)
+from rest_framework_simplejwt.settings import api_settings
+
+from .authentication import ClaimsRefreshToken, check_token_version
+from .exceptions import LoginBusy
+from .hashing import HashingBusy, check_credentials
+from .provisioning import API_MAX_MEMBERS
 
 User = get_user_model()
 
@@ -24,6 +39,7 @@ class UserSerializer(serializers.ModelSerializer):
             "last_name",
             "role",
             "company",
+            "application_digest",
         )
         read_only_fields = ("role", "company")
 
@@ -73,7 +89,7 @@ class ProfileUpdateSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = User
-        fields = ("first_name", "last_name", "email")
+        fields = ("first_name", "last_name", "email", "application_digest")
 
 
 class AdminUserSerializer(serializers.ModelSerializer):
@@ -105,6 +121,70 @@ class AdminUserSerializer(serializers.ModelSerializer):
         return value
 
 
+class AdminUserBulkActionSerializer(serializers.Serializer):
+    user_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=10000,
+    )
+    action = serializers.ChoiceField(choices=["deactivate", "reactivate", "set_role"])
+    role = serializers.ChoiceField(choices=User.Role.choices, required=False)
+
+    def validate(self, attrs):
+        if attrs["action"] == "set_role" and "role" not in attrs:
+            raise serializers.ValidationError({"role": "This field is required for set_role."})
+        return attrs
+
+
+class EmployerMemberSerializer(serializers.Serializer):
+    username = serializers.CharField(max_length=150, validators=[UnicodeUsernameValidator()])
+    email = serializers.EmailField()
+    first_name = serializers.CharField(max_length=150, required=False, default="")
+    last_name = serializers.CharField(max_length=150, required=False, default="")
+    password = serializers.CharField(write_only=True, required=False)
+
+    def validate_password(self, value):
+        try:
+            validate_password(value)
+        except ValidationError as e:
+            raise serializers.ValidationError(e.messages)
+        return value
+
+
+class EmployerProvisionSerializer(serializers.Serializer):
+    """
+    A company and the employer accounts to create for it.
+    """
+
+    company = serializers.PrimaryKeyRelatedField(queryset=Company.objects.all())
+    members = EmployerMemberSerializer(many=True, allow_empty=False, max_length=5000)
+
+    def validate_members(self, members):
+        usernames = [member["username"] for member in members]
+        emails = [member["email"] for member in members]
+        if len(set(usernames)) < len(usernames) or len(set(emails)) < len(emails):
+            raise serializers.ValidationError("Usernames and emails must be unique.")
+
+        taken = set()
+        for username, email in User.objects.filter(
+            Q(username__in=usernames) | Q(email__in=emails)
+        ).values_list("username", "email"):
+            taken.update({username, email}.intersection(usernames + emails))
+        if taken:
+            raise serializers.ValidationError(
+                f"Already registered: {', '.join(sorted(taken)[:20])}"
+            )
+        return members
+
+
+class EmployerProvisionRequestSerializer(EmployerProvisionSerializer):
+    """
+    Provisioning through the API, limited to API_MAX_MEMBERS members.
+    """
+
+    members = EmployerMemberSerializer(many=True, allow_empty=False, max_length=API_MAX_MEMBERS)
+
+
 class ChangePasswordSerializer(serializers.Serializer):
     """
     Password change serializer.
@@ -119,3 +199,53 @@ class ChangePasswordSerializer(serializers.Serializer):
         except ValidationError as e:
             raise serializers.ValidationError(e.messages)
         return value
+
+
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """
+    Issues tokens carrying the claims ClaimsJWTAuthentication relies on.
+
+    Credentials are checked on the bounded hashing pool (accounts.hashing);
+    when it is saturated the login fails fast with 503.
+    """
+
+    token_class = ClaimsRefreshToken
+
+    def validate(self, attrs):
+        try:
+            self.user = check_credentials(attrs[self.username_field], attrs["password"])
+        except HashingBusy:
+            raise LoginBusy()
+
+        if not api_settings.USER_AUTHENTICATION_RULE(self.user):
+            raise exceptions.AuthenticationFailed(
+                self.error_messages["no_active_account"],
+                "no_active_account",
+            )
+
+        refresh = self.get_token(self.user)
+        if api_settings.UPDATE_LAST_LOGIN:
+            update_last_login(None, self.user)
+        return {"refresh": str(refresh), "access": str(refresh.access_token)}
+
+
+class ClaimsTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Refuses to refresh tokens revoked by a token version bump.
+    """
+
+    token_class = ClaimsRefreshToken
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs["refresh"])
+        if "ver" in refresh:
+            check_token_version(refresh)
+        return super().validate(attrs)
+
+
+class ClaimsTokenBlacklistSerializer(TokenBlacklistSerializer):
+    """
+    Blacklists refresh tokens in accounts.token_blacklist on logout.
+    """
+
+    token_class = ClaimsRefreshToken
@@ -2,9 +2,50 @@
 Accounts services module providing user-related business logic.
 """
 
-from .models import User
+from django.db import transaction
+from django.db.models import F
+
+from .models import REVOKED, User, publish_token_versions
+
+BULK_CHUNK_SIZE = 1000
 
 
 def deactivate_user(user: User):
     user.is_active = False
     user.save(update_fields=["is_active"])
+
+
+def bulk_update_users(acting_user: User, user_ids, action, role=None):
+    """
+    Apply a bulk admin action to many users (Admin).
+
+    Runs one UPDATE per BULK_CHUNK_SIZE ids, each committed on its own so
+    row locks are held briefly. Users already in the target state are left
+    alone, and so is the acting admin, who cannot lock themselves out. As
+    User.save would, the update bumps each user's token version, revoking
+    their tokens. Returns the number of users updated.
+    """
+    if action == "set_role":
+        changes = {"role": role}
+    else:
+        changes = {"is_active": action == "reactivate"}
+    ids = sorted(set(user_ids) - {acting_user.pk})
+
+    updated = 0
+    for start in range(0, len(ids), BULK_CHUNK_SIZE):
+        chunk = ids[start : start + BULK_CHUNK_SIZE]
+        with transaction.atomic():
+            updated += (
+                User.objects.filter(pk__in=chunk)
+                .exclude(**changes)
+                .update(**changes, token_version=F("token_version") + 1)
+            )
+            publish_token_versions(
+                {
+                    pk: version if is_active else REVOKED
+                    for pk, version, is_active in User.objects.filter(
+                        pk__in=chunk
+                    ).values_list("pk", "token_version", "is_active")
+                }
+            )
+    return updated
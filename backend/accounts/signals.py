@@ -1,11 +1,17 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from .models import User
-from .tasks import send_welcome_email
+from core.mail import queue_email
+
+from .models import REVOKED, User, publish_token_versions
 
 
 @receiver(post_save, sender=User)
 def user_created(sender, instance, created, **kwargs):
     if created:
-        send_welcome_email.delay(instance.id)
+        queue_email("accounts.emails.welcome_messages", instance.id)
+
+
+@receiver(post_delete, sender=User)
+def user_deleted(sender, instance, **kwargs):
+    publish_token_versions({instance.pk: REVOKED})
@@ -0,0 +1,129 @@
+import pytest
+from django.db import connection
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from accounts.authentication import ClaimsRefreshToken, current_token_version
+from accounts.models import User
+from accounts.tests.factories import AdminUserFactory, JobSeekerUserFactory
+
+
+@pytest.fixture
+def admin_user(db):
+    return AdminUserFactory()
+
+
+@pytest.fixture
+def admin_client(admin_user):
+    api_client = APIClient()
+    api_client.force_authenticate(user=admin_user)
+    return api_client
+
+
+@pytest.mark.django_db
+class TestAdminUserSearch:
+    def test_substring_search_uses_trigram_index(self):
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            plan = User.objects.filter(username__icontains="smith").explain()
+
+        assert "user_username_trgm" in plan
+
+    def test_search_matches_any_field(self, admin_client):
+        match = JobSeekerUserFactory(last_name="Lovelace")
+        JobSeekerUserFactory(last_name="Hopper")
+
+        response = admin_client.get(reverse("admin-user-list-create"), {"search": "velac"})
+
+        assert [user["id"] for user in response.data["results"]] == [match.pk]
+
+    def test_list_is_cursor_paginated(self, admin_client):
+        JobSeekerUserFactory.create_batch(3)
+
+        first = admin_client.get(reverse("admin-user-list-create"), {"page_size": 2})
+        second = admin_client.get(first.data["next"])
+
+        assert first.status_code == status.HTTP_200_OK
+        assert len(first.data["results"]) == 2
+        assert len(second.data["results"]) == 2  # 3 users + the admin
+        assert second.data["next"] is None
+        ids = [u["id"] for u in first.data["results"] + second.data["results"]]
+        assert len(set(ids)) == 4
+
+    def test_last_login_ordering_skips_users_who_never_logged_in(self, admin_client):
+        JobSeekerUserFactory()
+
+        response = admin_client.get(reverse("admin-user-list-create"), {"ordering": "-last_login"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["results"] == []
+
+
+@pytest.mark.django_db
+class TestAdminUserBulkAction:
+    def test_deactivate_revokes_tokens(self, admin_client, admin_user, django_capture_on_commit_callbacks):
+        users = JobSeekerUserFactory.create_batch(3)
+        token = ClaimsRefreshToken.for_user(users[0])
+        assert current_token_version(users[0].pk) == token["ver"]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = admin_client.post(
+                reverse("admin-user-bulk"),
+                {"user_ids": [u.pk for u in users] + [admin_user.pk], "action": "deactivate"},
+                format="json",
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {"action": "deactivate", "updated": 3}
+        assert not User.objects.filter(pk__in=[u.pk for u in users], is_active=True).exists()
+        admin_user.refresh_from_db()
+        assert admin_user.is_active
+        assert current_token_version(users[0].pk) != token["ver"]
+
+    def test_reactivate_skips_users_already_active(self, admin_client):
+        inactive = JobSeekerUserFactory(is_active=False)
+        active = JobSeekerUserFactory()
+
+        response = admin_client.post(
+            reverse("admin-user-bulk"),
+            {"user_ids": [inactive.pk, active.pk], "action": "reactivate"},
+            format="json",
+        )
+
+        assert response.data["updated"] == 1
+        version = active.token_version
+        active.refresh_from_db()
+        assert active.token_version == version
+
+    def test_set_role_in_chunks(self, admin_client, monkeypatch):
+        monkeypatch.setattr("accounts.services.BULK_CHUNK_SIZE", 2)
+        users = JobSeekerUserFactory.create_batch(5)
+
+        response = admin_client.post(
+            reverse("admin-user-bulk"),
+            {"user_ids": [u.pk for u in users], "action": "set_role", "role": "EMPLOYER"},
+            format="json",
+        )
+
+        assert response.data["updated"] == 5
+        assert User.objects.filter(role=User.Role.EMPLOYER).count() == 5
+
+    def test_set_role_requires_role(self, admin_client):
+        response = admin_client.post(
+            reverse("admin-user-bulk"),
+            {"user_ids": [1], "action": "set_role"},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_non_admin_is_forbidden(self):
+        api_client = APIClient()
+        api_client.force_authenticate(user=JobSeekerUserFactory())
+
+        response = api_client.post(
+            reverse("admin-user-bulk"), {"user_ids": [1], "action": "deactivate"}, format="json"
+        )
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -0,0 +1,168 @@
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.authentication import (
+    ClaimsJWTAuthentication,
+    ClaimsRefreshToken,
+    current_token_version,
+)
+from accounts.tests.factories import EmployerUserFactory, JobSeekerUserFactory
+from jobs.tests.factories import CompanyFactory
+
+PROFILE_URL = "/api/v1/accounts/profile/"
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+
+
+def authenticate(token):
+    request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+    return ClaimsJWTAuthentication().authenticate(request)
+
+
+@pytest.mark.django_db
+class TestClaimsJWTAuthentication:
+    def test_tokens_carry_role_and_company(self):
+        company = CompanyFactory()
+        employer = EmployerUserFactory(company=company)
+
+        access = ClaimsRefreshToken.for_user(employer).access_token
+
+        assert access["role"] == employer.role
+        assert access["company_id"] == company.pk
+        assert access["ver"] == employer.token_version
+
+    def test_authenticated_request_makes_no_user_query(self, django_assert_num_queries):
+        employer = EmployerUserFactory(company=CompanyFactory())
+        access = ClaimsRefreshToken.for_user(employer).access_token
+        authenticate(access)  # warms the token version cache
+
+        with django_assert_num_queries(0):
+            user, _ = authenticate(access)
+
+        assert user.pk == employer.pk
+        assert user.role == employer.role
+        assert user.company_id == employer.company_id
+        assert user.is_authenticated
+
+    def test_deferred_fields_load_on_access(self):
+        employer = EmployerUserFactory(first_name="Ada")
+        user, _ = authenticate(ClaimsRefreshToken.for_user(employer).access_token)
+
+        assert user.first_name == "Ada"
+        assert user.email == employer.email
+
+    def test_role_change_revokes_tokens(self, django_capture_on_commit_callbacks):
+        user = JobSeekerUserFactory()
+        access = ClaimsRefreshToken.for_user(user).access_token
+        authenticate(access)
+
+        user.role = user.Role.EMPLOYER
+        with django_capture_on_commit_callbacks(execute=True):
+            user.save()
+
+        with pytest.raises(AuthenticationFailed):
+            authenticate(access)
+        assert authenticate(ClaimsRefreshToken.for_user(user).access_token)[0].role == user.role
+
+    def test_deactivation_revokes_tokens(self, django_capture_on_commit_callbacks):
+        user = JobSeekerUserFactory()
+        access = ClaimsRefreshToken.for_user(user).access_token
+        authenticate(access)
+
+        user.is_active = False
+        with django_capture_on_commit_callbacks(execute=True):
+            user.save(update_fields=["is_active"])
+
+        with pytest.raises(AuthenticationFailed):
+            authenticate(access)
+
+    def test_deleted_user_is_rejected(self, django_capture_on_commit_callbacks):
+        user = JobSeekerUserFactory()
+        access = ClaimsRefreshToken.for_user(user).access_token
+        authenticate(access)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            user.delete()
+
+        with pytest.raises(AuthenticationFailed):
+            authenticate(access)
+
+    def test_stale_read_does_not_outlive_revocation(self, django_capture_on_commit_callbacks):
+        user = JobSeekerUserFactory()
+        access = ClaimsRefreshToken.for_user(user).access_token
+        stale_version = user.token_version
+
+        user.role = user.Role.EMPLOYER
+        with django_capture_on_commit_callbacks() as callbacks:
+            user.save()
+
+        # A request reads the old version from the database, then the
+        # change commits before that request fills the cache.
+        def read_before_commit():
+            for callback in callbacks:
+                callback()
+            return stale_version
+
+        with mock.patch("accounts.authentication.User.objects") as objects:
+            objects.filter.return_value.values_list.return_value.first.side_effect = (
+                read_before_commit
+            )
+            assert current_token_version(user.pk) == stale_version
+
+        assert current_token_version(user.pk) == user.token_version
+        with pytest.raises(AuthenticationFailed):
+            authenticate(access)
+
+    def test_profile_edits_keep_tokens_valid(self):
+        user = JobSeekerUserFactory()
+        access = ClaimsRefreshToken.for_user(user).access_token
+
+        user.first_name = "Grace"
+        user.save()
+
+        assert authenticate(access)[0].pk == user.pk
+
+    def test_tokens_without_claims_still_work(self):
+        user = JobSeekerUserFactory()
+        access = RefreshToken.for_user(user).access_token
+
+        assert authenticate(access)[0] == user
+
+
+@pytest.mark.django_db
+class TestClaimsTokenEndpoints:
+    def test_password_change_revokes_refresh_token(self, django_capture_on_commit_callbacks):
+        user = JobSeekerUserFactory()
+        api_client = APIClient()
+        response = api_client.post(
+            "/api/v1/accounts/login/",
+            {"username": user.username, "password": "password123"},
+        )
+        refresh = response.data["refresh"]
+
+        user.set_password("N3wStrongPass!")
+        with django_capture_on_commit_callbacks(execute=True):
+            user.save()
+
+        response = api_client.post("/api/v1/accounts/token/refresh/", {"refresh": refresh})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_profile_is_served_with_claims_token(self):
+        employer = EmployerUserFactory(company=CompanyFactory())
+        api_client = APIClient()
+        access = ClaimsRefreshToken.for_user(employer).access_token
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+
+        response = api_client.get(PROFILE_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["email"] == employer.email
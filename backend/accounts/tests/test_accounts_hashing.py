@@ -0,0 +1,94 @@
+import threading
+
+import pytest
+from django.contrib.auth.hashers import make_password
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from accounts.hashing import BoundedExecutor, HashingBusy, check_credentials
+from accounts.tests.factories import JobSeekerUserFactory
+
+LOGIN_URL = "/api/v1/accounts/login/"
+
+
+class TestBoundedExecutor:
+    def test_submissions_beyond_the_queue_are_refused(self):
+        executor = BoundedExecutor(workers=1, queue_size=1)
+        release = threading.Event()
+        try:
+            running = executor.submit(release.wait)
+            queued = executor.submit(lambda: "queued")
+
+            with pytest.raises(HashingBusy):
+                executor.submit(lambda: "refused")
+
+            release.set()
+            running.result(timeout=5)
+            assert queued.result(timeout=5) == "queued"
+            assert executor.submit(lambda: "accepted").result(timeout=5) == "accepted"
+        finally:
+            release.set()
+            executor.shutdown()
+
+
+@pytest.mark.django_db
+class TestCheckCredentials:
+    def test_valid_credentials(self):
+        user = JobSeekerUserFactory()
+        assert check_credentials(user.username, "password123") == user
+
+    def test_invalid_credentials(self):
+        user = JobSeekerUserFactory()
+        assert check_credentials(user.username, "wrong") is None
+        assert check_credentials("nobody", "password123") is None
+
+    def test_inactive_user_is_refused(self):
+        user = JobSeekerUserFactory(is_active=False)
+        assert check_credentials(user.username, "password123") is None
+
+    def test_outdated_hash_is_upgraded_without_revoking_tokens(self, settings):
+        settings.PASSWORD_HASHERS = [
+            "django.contrib.auth.hashers.MD5PasswordHasher",
+            "django.contrib.auth.hashers.ScryptPasswordHasher",
+        ]
+        user = JobSeekerUserFactory()
+        user.password = make_password("password123", hasher="scrypt")
+        user.save(update_fields=["password"])
+        version = user.token_version
+
+        check_credentials(user.username, "password123")
+
+        user.refresh_from_db()
+        assert user.password.startswith("md5$")
+        assert user.token_version == version
+
+
+@pytest.mark.django_db
+class TestLoginBackpressure:
+    def test_login_returns_503_when_hashing_is_saturated(self, settings, monkeypatch):
+        settings.LOGIN_HASHING_WORKERS = 1
+        settings.LOGIN_HASHING_QUEUE = 0
+        user = JobSeekerUserFactory()
+        release = threading.Event()
+
+        from accounts.hashing import get_executor
+
+        get_executor().submit(release.wait)
+        try:
+            response = APIClient().post(
+                LOGIN_URL, {"username": user.username, "password": "password123"}
+            )
+        finally:
+            release.set()
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response["Retry-After"] == "1"
+
+    def test_login_succeeds(self):
+        user = JobSeekerUserFactory()
+        response = APIClient().post(
+            LOGIN_URL, {"username": user.username, "password": "password123"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "access" in response.data
@@ -0,0 +1,147 @@
+from unittest import mock
+
+import pytest
+from django.contrib.auth.hashers import check_password
+from django.core.management import CommandError, call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from accounts.hashing import MIN_PARALLEL_PASSWORDS, hash_passwords
+from accounts.models import User
+from accounts.provisioning import API_MAX_MEMBERS, provision_employers
+from accounts.tests.factories import AdminUserFactory, JobSeekerUserFactory
+from core.models import QueuedEmail
+from jobs.tests.factories import CompanyFactory
+
+
+def members(count, prefix="member"):
+    return [
+        {"username": f"{prefix}{i}", "email": f"{prefix}{i}@acme.com", "password": f"Passw0rd-{i}!"}
+        for i in range(count)
+    ]
+
+
+class TestHashPasswords:
+    def test_passwords_are_hashed_across_processes(self):
+        passwords = [f"Passw0rd-{i}!" for i in range(10)] + [None]
+
+        hashed = hash_passwords(passwords, processes=2)
+
+        assert all(check_password(p, h) for p, h in zip(passwords[:-1], hashed))
+        assert hashed[-1].startswith("!")
+        assert len(set(hashed)) == len(hashed)
+
+
+@pytest.mark.django_db
+class TestProvisionEmployers:
+    def test_users_are_created_with_one_batched_welcome(self, django_assert_max_num_queries):
+        company = CompanyFactory()
+        QueuedEmail.objects.all().delete()
+
+        with django_assert_max_num_queries(5):
+            users = provision_employers(company, members(20))
+
+        assert len(users) == 20
+        created = User.objects.filter(company=company, role=User.Role.EMPLOYER)
+        assert created.count() == 20
+        assert created.get(username="member3").check_password("Passw0rd-3!")
+        assert set(QueuedEmail.objects.values_list("object_id", flat=True)) == {
+            user.pk for user in users
+        }
+
+    def test_members_without_password_cannot_log_in(self):
+        (user,) = provision_employers(
+            CompanyFactory(), [{"username": "invitee", "email": "invitee@acme.com"}]
+        )
+        user.refresh_from_db()
+        assert not user.has_usable_password()
+
+
+@pytest.mark.django_db
+class TestEmployerProvisionView:
+    def test_admin_provisions_team(self):
+        company = CompanyFactory()
+        api_client = APIClient()
+        api_client.force_authenticate(user=AdminUserFactory())
+
+        with mock.patch("accounts.hashing.ProcessPoolExecutor") as pool:
+            response = api_client.post(
+                reverse("admin-employer-provision"),
+                {"company": company.pk, "members": members(MIN_PARALLEL_PASSWORDS)},
+                format="json",
+            )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert len(response.data["created"]) == MIN_PARALLEL_PASSWORDS
+        assert response.data["created"][0]["username"] == "member0"
+        # Hashed in the web worker, without spawning processes
+        pool.assert_not_called()
+
+    def test_large_teams_are_rejected(self):
+        api_client = APIClient()
+        api_client.force_authenticate(user=AdminUserFactory())
+
+        response = api_client.post(
+            reverse("admin-employer-provision"),
+            {"company": CompanyFactory().pk, "members": members(API_MAX_MEMBERS + 1)},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "members" in response.data
+
+    def test_taken_and_duplicate_usernames_are_rejected(self):
+        existing = JobSeekerUserFactory()
+        api_client = APIClient()
+        api_client.force_authenticate(user=AdminUserFactory())
+        url = reverse("admin-employer-provision")
+        company = CompanyFactory()
+
+        taken = api_client.post(
+            url,
+            {"company": company.pk, "members": [{"username": existing.username, "email": "new@acme.com"}]},
+            format="json",
+        )
+        duplicate = api_client.post(
+            url, {"company": company.pk, "members": members(1) * 2}, format="json"
+        )
+
+        assert taken.status_code == status.HTTP_400_BAD_REQUEST
+        assert existing.username in str(taken.data)
+        assert duplicate.status_code == status.HTTP_400_BAD_REQUEST
+        assert not User.objects.filter(company=company).exists()
+
+    def test_non_admin_is_forbidden(self):
+        api_client = APIClient()
+        api_client.force_authenticate(user=JobSeekerUserFactory())
+
+        response = api_client.post(reverse("admin-employer-provision"), {}, format="json")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+class TestProvisionEmployersCommand:
+    def test_creates_users_from_csv(self, tmp_path):
+        company = CompanyFactory()
+        path = tmp_path / "team.csv"
+        path.write_text(
+            "username,email,first_name,password\n"
+            "ada,ada@acme.com,Ada,Passw0rd-ada!\n"
+            "grace,grace@acme.com,Grace,\n"
+        )
+
+        call_command("provision_employers", company.pk, str(path))
+
+        assert set(User.objects.filter(company=company).values_list("username", flat=True)) == {
+            "ada",
+            "grace",
+        }
+
+    def test_invalid_rows_abort(self, tmp_path):
+        path = tmp_path / "team.csv"
+        path.write_text("username,email\nada,not-an-email\n")
+
+        with pytest.raises(CommandError):
+            call_command("provision_employers", CompanyFactory().pk, str(path))
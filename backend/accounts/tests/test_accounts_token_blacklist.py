@@ -0,0 +1,104 @@
+import time
+
+import pytest
+from django.core.management import CommandError, call_command
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.exceptions import TokenError
+
+from accounts.authentication import ClaimsRefreshToken
+from accounts.tests.factories import JobSeekerUserFactory
+from accounts.token_blacklist import (
+    BloomFilter,
+    LocalTokenBlacklist,
+    blacklist,
+    get_token_blacklist,
+    is_blacklisted,
+)
+
+
+class TestBloomFilter:
+    def test_added_items_are_found(self):
+        bloom = BloomFilter(bits=2**12, hashes=5)
+        items = [f"jti-{i}" for i in range(100)]
+        for item in items:
+            bloom.add(item)
+
+        assert all(item in bloom for item in items)
+
+    def test_false_positive_rate_is_low(self):
+        bloom = BloomFilter()
+        for i in range(10_000):
+            bloom.add(f"blacklisted-{i}")
+
+        false_positives = sum(f"fresh-{i}" in bloom for i in range(10_000))
+        assert false_positives < 10
+
+    def test_matches_redis_bit_order(self):
+        bloom = BloomFilter(bits=16, hashes=1)
+        (position,) = BloomFilter.positions("jti", bits=16, hashes=1)
+        data = bytearray(2)
+        data[position // 8] |= 1 << (7 - position % 8)  # SETBIT offset semantics
+
+        assert "jti" in BloomFilter(bytes(data), bits=16, hashes=1)
+        bloom.add("jti")
+        assert bloom.data == data
+
+
+class TestLocalTokenBlacklist:
+    def test_add_is_atomic_and_expires(self):
+        store = LocalTokenBlacklist()
+
+        assert store.add("a", time.time() + 60)
+        assert not store.add("a", time.time() + 60)
+        assert "a" in store
+
+        store.add("b", time.time() - 1)
+        assert "b" not in store
+
+    def test_store_follows_setting(self, settings):
+        blacklist("a", time.time() + 60)
+        assert is_blacklisted("a")
+
+        settings.TOKEN_BLACKLIST_URL = "memory://other"
+        assert isinstance(get_token_blacklist(), LocalTokenBlacklist)
+        assert not is_blacklisted("a")
+
+
+@pytest.mark.django_db
+class TestRefreshTokenBlacklist:
+    def test_rotated_refresh_token_cannot_be_reused(self):
+        refresh = str(ClaimsRefreshToken.for_user(JobSeekerUserFactory()))
+        api_client = APIClient()
+
+        first = api_client.post("/api/v1/accounts/token/refresh/", {"refresh": refresh})
+        replay = api_client.post("/api/v1/accounts/token/refresh/", {"refresh": refresh})
+
+        assert first.status_code == status.HTTP_200_OK
+        assert replay.status_code == status.HTTP_401_UNAUTHORIZED
+        rotated = first.data["refresh"]
+        assert ClaimsRefreshToken(rotated)["jti"] != ClaimsRefreshToken(refresh, verify=False)["jti"]
+
+    def test_logout_blacklists_refresh_token(self):
+        user = JobSeekerUserFactory()
+        refresh = ClaimsRefreshToken.for_user(user)
+        api_client = APIClient()
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {refresh.access_token}")
+
+        response = api_client.post("/api/v1/accounts/logout/", {"refresh": str(refresh)})
+
+        assert response.status_code == status.HTTP_200_OK
+        with pytest.raises(TokenError):
+            ClaimsRefreshToken(str(refresh))
+
+    def test_blacklisting_twice_is_refused(self):
+        refresh = ClaimsRefreshToken.for_user(JobSeekerUserFactory())
+        refresh.blacklist()
+
+        with pytest.raises(TokenError):
+            refresh.blacklist()
+
+
+def test_migrate_command_requires_blacklist_app():
+    with pytest.raises(CommandError):
+        call_command("migrate_token_blacklist")
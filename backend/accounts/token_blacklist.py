@@ -0,0 +1,193 @@
+"""
+Refresh-token blacklist kept in Redis.
+
+Blacklisted jtis are Redis keys that expire together with their token, so the
+blacklist only ever holds tokens that could still be presented.
+
+Most refresh tokens checked were never blacklisted. To answer those without a
+network call, every blacklisted jti is also added to a Bloom filter: one Redis
+bitmap per day, kept for as long as a refresh token lives. Each process keeps
+a copy of the bitmaps, re-fetched at most every BLOOM_SYNC_INTERVAL seconds
+and only when their counters show new entries, and asks Redis about a jti only
+when the copy cannot rule it out.
+
+The copy may lag behind other processes by up to BLOOM_SYNC_INTERVAL.
+Rotation does not depend on it: blacklisting is an atomic SET NX, so a
+refresh token can be rotated once, whichever process sees it.
+
+TOKEN_BLACKLIST_URL selects the store. "memory://" keeps the blacklist in
+the process, for tests and single-process development.
+"""
+
+import hashlib
+import math
+import threading
+import time
+from datetime import timedelta
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from rest_framework_simplejwt.settings import api_settings
+
+from core.utils.cache_keys import (
+    token_blacklist_bloom_key,
+    token_blacklist_count_key,
+    token_blacklist_key,
+)
+
+BLOOM_BITS = 2**20  # 128 KiB per day; ~1% false positives at 100k tokens
+BLOOM_HASHES = 7
+BLOOM_SYNC_INTERVAL = 5  # seconds
+
+DAY = 24 * 60 * 60
+
+
+class BloomFilter:
+    """
+    Bloom filter over a bitmap laid out like a Redis SETBIT bitmap.
+    """
+
+    def __init__(self, data=b"", bits=BLOOM_BITS, hashes=BLOOM_HASHES):
+        self.bits = bits
+        self.hashes = hashes
+        # Redis returns bitmaps truncated after the last set byte
+        self.data = bytearray(data).ljust(bits // 8, b"\0")
+
+    @classmethod
+    def positions(cls, item, bits=BLOOM_BITS, hashes=BLOOM_HASHES):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "big")
+        step = int.from_bytes(digest[8:], "big") | 1
+        return [(first + i * step) % bits for i in range(hashes)]
+
+    def add(self, item):
+        for position in self.positions(item, self.bits, self.hashes):
+            self.data[position >> 3] |= 0x80 >> (position & 7)
+
+    def __contains__(self, item):
+        return all(
+            self.data[position >> 3] & (0x80 >> (position & 7))
+            for position in self.positions(item, self.bits, self.hashes)
+        )
+
+
+def bloom_days(now):
+    """
+    Days whose filters can hold a token that has not expired by `now`.
+    """
+    today = int(now // DAY)
+    lifetime = math.ceil(api_settings.REFRESH_TOKEN_LIFETIME / timedelta(days=1))
+    return list(range(today - lifetime, today + 1))
+
+
+class RedisTokenBlacklist:
+    def __init__(self, url):
+        import redis
+
+        self.client = redis.Redis.from_url(url)
+        self.lock = threading.Lock()
+        self.filters = {}  # day -> (count, BloomFilter)
+        self.synced_at = None
+
+    def add(self, jti, expires_at):
+        """
+        Blacklist `jti` until `expires_at` (epoch seconds).
+
+        Returns False if it already was blacklisted.
+        """
+        now = time.time()
+        day = int(now // DAY)
+        retention = (len(bloom_days(now)) + 1) * DAY
+        pipe = self.client.pipeline()
+        pipe.set(token_blacklist_key(jti), 1, ex=max(math.ceil(expires_at - now), 1), nx=True)
+        for position in BloomFilter.positions(jti):
+            pipe.setbit(token_blacklist_bloom_key(day), position, 1)
+        pipe.incr(token_blacklist_count_key(day))
+        pipe.expire(token_blacklist_bloom_key(day), retention)
+        pipe.expire(token_blacklist_count_key(day), retention)
+        added = pipe.execute()[0]
+
+        with self.lock:
+            if day in self.filters:
+                self.filters[day][1].add(jti)
+        return bool(added)
+
+    def __contains__(self, jti):
+        if not any(jti in bloom for bloom in self.sync()):
+            return False
+        return bool(self.client.exists(token_blacklist_key(jti)))
+
+    def sync(self):
+        """
+        Return the local filters, re-fetching those that changed in Redis
+        if the last sync is older than BLOOM_SYNC_INTERVAL.
+        """
+        with self.lock:
+            now = time.monotonic()
+            if self.synced_at is None or now - self.synced_at >= BLOOM_SYNC_INTERVAL:
+                days = bloom_days(time.time())
+                counts = self.client.mget([token_blacklist_count_key(day) for day in days])
+                filters = {}
+                for day, count in zip(days, counts):
+                    if day in self.filters and self.filters[day][0] == count:
+                        filters[day] = self.filters[day]
+                    else:
+                        data = self.client.get(token_blacklist_bloom_key(day)) or b""
+                        filters[day] = (count, BloomFilter(data))
+                self.filters = filters
+                self.synced_at = now
+            return [bloom for _, bloom in self.filters.values()]
+
+
+class LocalTokenBlacklist:
+    """
+    In-process stand-in for RedisTokenBlacklist.
+    """
+
+    PRUNE_EVERY = 1000
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = {}  # jti -> expires_at
+        self.added = 0
+
+    def add(self, jti, expires_at):
+        now = time.time()
+        with self.lock:
+            if self.entries.get(jti, 0) > now:
+                return False
+            self.entries[jti] = expires_at
+            self.added += 1
+            if self.added % self.PRUNE_EVERY == 0:
+                self.entries = {k: v for k, v in self.entries.items() if v > now}
+            return True
+
+    def __contains__(self, jti):
+        return self.entries.get(jti, 0) > time.time()
+
+
+@lru_cache(maxsize=None)
+def get_token_blacklist():
+    url = settings.TOKEN_BLACKLIST_URL
+    if url.startswith("memory://"):
+        return LocalTokenBlacklist()
+    return RedisTokenBlacklist(url)
+
+
+@receiver(setting_changed)
+def reset_token_blacklist(setting, **kwargs):
+    if setting == "TOKEN_BLACKLIST_URL":
+        get_token_blacklist.cache_clear()
+
+
+def blacklist(jti, expires_at):
+    """
+    Blacklist a token id until it expires. Returns False if it already was.
+    """
+    return get_token_blacklist().add(jti, expires_at)
+
+
+def is_blacklisted(jti):
+    return jti in get_token_blacklist()
@@ -6,11 +6,13 @@ login, token refresh, and profile management.
 from django.urls import path
 
 from .views import (
+    AdminUserBulkActionView,
     AdminUserListCreateView,
     AdminUserRetrieveUpdateDestroyView,
     ChangePasswordView,
     CustomTokenObtainPairView,
     CustomTokenRefreshView,
+    EmployerProvisionView,
     LogoutView,
     ProfileView,
     RegisterView,
@@ -26,6 +28,14 @@ urlpatterns = [
     path(
         "admin/users/", AdminUserListCreateView.as_view(), name="admin-user-list-create"
     ),
+    path(
+        "admin/users/bulk/", AdminUserBulkActionView.as_view(), name="admin-user-bulk"
+    ),
+    path(
+        "admin/employers/provision/",
+        EmployerProvisionView.as_view(),
+        name="admin-employer-provision",
+    ),
     path(
         "admin/users/<int:pk>/",
         AdminUserRetrieveUpdateDestroyView.as_view(),
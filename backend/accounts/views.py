@@ -9,14 +9,22 @@ from rest_framework_simplejwt.views import (
     TokenRefreshView,
 )
 
+from core.throttling import LoginThrottle, RegisterThrottle
+
+from .authentication import ClaimsJWTAuthentication
+from .pagination import UserCursorPagination
+from .provisioning import API_MAX_MEMBERS, provision_employers
 from .permissions import IsAdmin
 from .serializers import (
+    AdminUserBulkActionSerializer,
     AdminUserSerializer,
     ChangePasswordSerializer,
+    EmployerProvisionRequestSerializer,
     ProfileUpdateSerializer,
     RegisterSerializer,
     UserSerializer,
 )
+from .services import bulk_update_users
 
 User = get_user_model()
 
@@ -34,6 +42,9 @@ User = get_user_model()
         "### ⏱ Token Lifetime\n"
         "- **Access token**: short-lived (~5 minutes)\n"
         "- **Refresh token**: longer-lived (~24 hours)\n\n"
+        "### 🎫 Claims\n"
+        "- Tokens carry `username`, `role`, `company_id` and a token version `ver`\n"
+        "- Changing role, company, active status or password revokes existing tokens\n\n"
         "### 📥 Example Request Body\n"
         "```json\n"
         "{\n"
@@ -55,10 +66,12 @@ User = get_user_model()
             },
         },
         401: {"description": "Invalid username or password"},
+        429: {"description": "Too many attempts for this IP or username; see `Retry-After`"},
+        503: {"description": "Too many logins in progress; retry after `Retry-After` seconds"},
     },
 )
 class CustomTokenObtainPairView(TokenObtainPairView):
-    pass
+    throttle_classes = (LoginThrottle,)
 
 
 @extend_schema(
@@ -118,6 +131,8 @@ class CustomTokenRefreshView(TokenRefreshView):
     },
 )
 class LogoutView(TokenBlacklistView):
+    # TokenViewBase disables authentication; the access token is required here
+    authentication_classes = (ClaimsJWTAuthentication,)
     permission_classes = (permissions.IsAuthenticated,)
 
 
@@ -168,12 +183,14 @@ class LogoutView(TokenBlacklistView):
         400: {
             "description": "Validation error (duplicate username/email, weak password)"
         },
+        429: {"description": "Too many registrations from this IP; see `Retry-After`"},
     },
 )
 class RegisterView(generics.CreateAPIView):
     queryset = User.objects.all()
     serializer_class = RegisterSerializer
     permission_classes = [permissions.AllowAny]
+    throttle_classes = [RegisterThrottle]
 
 
 # =========================
@@ -221,8 +238,13 @@ class ProfileView(generics.RetrieveUpdateDestroyAPIView):
         return ProfileUpdateSerializer
 
     def get_object(self):
-        """Always return the current authenticated user."""
-        return self.request.user
+        """
+        Always return the current authenticated user.
+
+        request.user is built from token claims; load the full row (and
+        company) in one query since every operation here needs it.
+        """
+        return User.objects.select_related("company").get(pk=self.request.user.pk)
 
     @extend_schema(
         summary="Retrieve Authenticated User Profile",
@@ -249,7 +271,8 @@ class ProfileView(generics.RetrieveUpdateDestroyAPIView):
             "### ✏️ Updatable Fields\n"
             "- first_name\n"
             "- last_name\n"
-            "- email (must remain unique)\n\n"
+            "- email (must remain unique)\n"
+            "- application_digest (employers: `HOURLY`, `DAILY` or `NEVER` summary of new applications)\n\n"
             "### 🚫 Restricted Fields\n"
             "- username\n"
             "- role\n"
@@ -361,7 +384,10 @@ class ChangePasswordView(generics.UpdateAPIView):
         "- Create users with any role\n"
         "- List all users\n"
         "- Update or delete accounts\n"
-        "- Reactivate deactivated users"
+        "- Reactivate deactivated users\n\n"
+        "### 🔎 Search & Pagination\n"
+        "- `?search=` matches substrings of username, email, first and last name (trigram-indexed)\n"
+        "- Cursor-paginated, newest first; follow `next`/`previous` links"
     ),
     responses={
         401: {"description": "Authentication required"},
@@ -380,6 +406,54 @@ class AdminUserListCreateView(generics.ListCreateAPIView):
     filterset_fields = ["role", "is_active"]
     search_fields = ["username", "email", "first_name", "last_name"]
     ordering_fields = ["date_joined", "last_login"]
+    pagination_class = UserCursorPagination
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        # Cursors cannot seek past NULLs; order by last login only among
+        # users who have logged in.
+        if "last_login" in self.request.query_params.get("ordering", ""):
+            queryset = queryset.filter(last_login__isnull=False)
+        return queryset
+
+
+@extend_schema(
+    tags=["Admin Management"],
+    summary="Bulk Deactivate, Reactivate or Change Role of Users",
+    description=(
+        "Apply one action to many users at once.\n\n"
+        "### 🔐 Access\n"
+        "- Requires **ADMIN** role\n\n"
+        "### 🛠 Actions\n"
+        "- `deactivate`, `reactivate`, or `set_role` (with `role`)\n"
+        "- Up to 10,000 `user_ids`, applied in chunks of 1,000 per update\n"
+        "- Your own account and users already in the target state are skipped\n"
+        "- Updated users' existing tokens are revoked\n\n"
+        "### 📥 Example Request Body\n"
+        "```json\n"
+        "{\n"
+        '  "user_ids": [12, 15, 18],\n'
+        '  "action": "set_role",\n'
+        '  "role": "EMPLOYER"\n'
+        "}\n"
+        "```"
+    ),
+    responses={
+        200: {"description": "Number of users updated"},
+        400: {"description": "Validation error"},
+        403: {"description": "Admin privileges required"},
+    },
+)
+class AdminUserBulkActionView(generics.GenericAPIView):
+    serializer_class = AdminUserBulkActionSerializer
+    permission_classes = [permissions.IsAuthenticated, IsAdmin]
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        updated = bulk_update_users(request.user, **serializer.validated_data)
+        return Response({"action": serializer.validated_data["action"], "updated": updated})
 
 
 @extend_schema(
@@ -398,3 +472,54 @@ class AdminUserRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
     queryset = User.objects.all()
     serializer_class = AdminUserSerializer
     permission_classes = [permissions.IsAuthenticated, IsAdmin]
+
+
+@extend_schema(
+    tags=["Admin Management"],
+    summary="Bulk Provision Employer Accounts for a Company",
+    description=(
+        "Create many **EMPLOYER** accounts linked to one company.\n\n"
+        "### 🔐 Access\n"
+        "- Requires **ADMIN** role\n\n"
+        "### ⚙️ Behavior\n"
+        f"- Up to {API_MAX_MEMBERS} members per request; all are created or none\n"
+        "- Larger teams are imported with `manage.py provision_employers`\n"
+        "- Members without a password get an unusable password\n"
+        "- Welcome emails are sent together in one batch\n\n"
+        "### 📥 Example Request Body\n"
+        "```json\n"
+        "{\n"
+        '  "company": 3,\n'
+        '  "members": [\n'
+        '    {"username": "ada", "email": "ada@acme.com", "first_name": "Ada", "password": "S3cure-pass!"}\n'
+        "  ]\n"
+        "}\n"
+        "```"
+    ),
+    responses={
+        201: {"description": "Accounts created"},
+        400: {"description": "Validation error (duplicate or taken usernames/emails, weak passwords)"},
+        403: {"description": "Admin privileges required"},
+    },
+)
+class EmployerProvisionView(generics.GenericAPIView):
+    serializer_class = EmployerProvisionRequestSerializer
+    permission_classes = [permissions.IsAuthenticated, IsAdmin]
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        company = serializer.validated_data["company"]
+        # No process pool inside a web worker
+        users = provision_employers(company, serializer.validated_data["members"], processes=1)
+        return Response(
+            {
+                "company": company.pk,
+                "created": [
+                    {"id": user.pk, "username": user.username, "email": user.email}
+                    for user in users
+                ],
+            },
+            status=status.HTTP_201_CREATED,
+        )
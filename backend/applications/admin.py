@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Application
+from .models import Application, ArchivedApplication, ResumeBlob
 
 
 @admin.register(Application)
@@ -13,3 +13,29 @@ class ApplicationAdmin(admin.ModelAdmin):
     )
     list_filter = ("status",)
     search_fields = ("applicant__username", "job__title")
+
+
+@admin.register(ResumeBlob)
+class ResumeBlobAdmin(admin.ModelAdmin):
+    list_display = (
+        "sha256",
+        "size",
+        "ref_count",
+        "created_at",
+    )
+    search_fields = ("sha256",)
+
+
+@admin.register(ArchivedApplication)
+class ArchivedApplicationAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "applicant",
+        "job",
+        "status",
+        "created_at",
+        "archived_at",
+    )
+    list_filter = ("status",)
+    search_fields = ("applicant__username", "job__title")
+    raw_id_fields = ("applicant", "job", "resume_blob")
@@ -0,0 +1,215 @@
+"""
+Incremental funnel rollups over the application status event log.
+
+`rollup_status_events` folds new ApplicationStatusEvent rows into
+ApplicationStatusRollup, starting after a stored high-water mark, so each run
+only reads events it has not seen. `job_funnel` answers analytics queries
+from the rollups alone.
+
+Event ids are allocated when a row is inserted, not when it commits, so a
+long transaction can commit an id below the high-water mark. The ids that
+were skipped when the mark moved are kept as gaps on the watermark and
+re-checked on every run until GAP_TIMEOUT, after which they are assumed to
+belong to rolled back transactions.
+"""
+
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import F, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .models import (
+    Application,
+    ApplicationStatusEvent,
+    ApplicationStatusRollup,
+    RollupWatermark,
+)
+
+WATERMARK_NAME = "application_status_rollup"
+
+BATCH_SIZE = 5000
+
+# Events younger than this are left for the next run, so transactions that
+# committed out of id order are not skipped by the high-water mark.
+SETTLE_DELAY = timedelta(seconds=30)
+
+# Skipped ids are re-checked for this long before they are given up on
+GAP_TIMEOUT = timedelta(hours=1)
+
+FUNNEL_STAGES = [
+    Application.Status.APPLIED,
+    Application.Status.REVIEWED,
+    Application.Status.SHORTLISTED,
+    Application.Status.ACCEPTED,
+    Application.Status.REJECTED,
+    Application.Status.WITHDRAWN,
+]
+
+
+def rollup_status_events(batch_size=BATCH_SIZE):
+    """
+    Fold the next batch of events into the rollups.
+    Returns the number of events processed.
+    """
+    with transaction.atomic():
+        # Locking the watermark serialises concurrent rollup runs.
+        watermark, _ = RollupWatermark.objects.select_for_update().get_or_create(
+            name=WATERMARK_NAME
+        )
+
+        previous_event_at = (
+            ApplicationStatusEvent.objects.filter(
+                application=OuterRef("application"), id__lt=OuterRef("id")
+            )
+            .order_by("-id")
+            .values("created_at")[:1]
+        )
+        events = ApplicationStatusEvent.objects.annotate(
+            entered_previous_at=Coalesce(
+                Subquery(previous_event_at), F("application__created_at")
+            )
+        ).values_list(
+            "id",
+            "job_id",
+            "from_status",
+            "to_status",
+            "created_at",
+            "entered_previous_at",
+        )
+        new_events = list(
+            events.filter(
+                id__gt=watermark.last_event_id,
+                created_at__lt=timezone.now() - SETTLE_DELAY,
+            ).order_by("id")[:batch_size]
+        )
+        late_events = []
+        if watermark.gaps:
+            in_gaps = Q()
+            for low, high, _ in watermark.gaps:
+                in_gaps |= Q(id__range=(low, high))
+            late_events = list(events.filter(in_gaps).order_by("id")[:batch_size])
+        if not new_events and not late_events:
+            return 0
+
+        deltas = defaultdict(
+            lambda: {"entered": 0, "exited": 0, "seconds_in_status": 0}
+        )
+        for _, job_id, from_status, to_status, created_at, previous_at in (
+            *late_events,
+            *new_events,
+        ):
+            day = created_at.date()
+            deltas[(job_id, day, to_status)]["entered"] += 1
+            if from_status:
+                exit_delta = deltas[(job_id, day, from_status)]
+                exit_delta["exited"] += 1
+                exit_delta["seconds_in_status"] += max(
+                    int((created_at - previous_at).total_seconds()), 0
+                )
+
+        _apply_deltas(deltas)
+
+        now = timezone.now().timestamp()
+        gaps = _remove_ids(watermark.gaps, {event[0] for event in late_events})
+        if new_events:
+            gaps += _missing_ranges(
+                watermark.last_event_id, [event[0] for event in new_events], now
+            )
+            watermark.last_event_id = new_events[-1][0]
+        expired = now - GAP_TIMEOUT.total_seconds()
+        watermark.gaps = [gap for gap in gaps if gap[2] > expired]
+        watermark.save(update_fields=["last_event_id", "gaps", "updated_at"])
+
+    return len(late_events) + len(new_events)
+
+
+def _missing_ranges(after, ids, seen_at):
+    """
+    [low, high, seen_at] for every run of ids missing from sorted `ids`,
+    which follow `after`.
+    """
+    ranges = []
+    expected = after + 1
+    for event_id in ids:
+        if event_id > expected:
+            ranges.append([expected, event_id - 1, seen_at])
+        expected = event_id + 1
+    return ranges
+
+
+def _remove_ids(gaps, found):
+    remaining = []
+    for low, high, seen_at in gaps:
+        ids = sorted(event_id for event_id in found if low <= event_id <= high)
+        remaining += _missing_ranges(low - 1, [*ids, high + 1], seen_at)
+    return remaining
+
+
+def _apply_deltas(deltas):
+    job_ids = {job_id for job_id, _, _ in deltas}
+    days = {day for _, day, _ in deltas}
+    existing = {
+        (rollup.job_id, rollup.day, rollup.status): rollup
+        for rollup in ApplicationStatusRollup.objects.filter(
+            job_id__in=job_ids, day__in=days
+        )
+    }
+
+    to_create, to_update = [], []
+    for key, delta in deltas.items():
+        rollup = existing.get(key)
+        if rollup is None:
+            job_id, day, status = key
+            to_create.append(
+                ApplicationStatusRollup(job_id=job_id, day=day, status=status, **delta)
+            )
+            continue
+        for field, value in delta.items():
+            setattr(rollup, field, getattr(rollup, field) + value)
+        to_update.append(rollup)
+
+    ApplicationStatusRollup.objects.bulk_create(to_create)
+    ApplicationStatusRollup.objects.bulk_update(
+        to_update, ["entered", "exited", "seconds_in_status"]
+    )
+
+
+def job_funnel(job_id, since=None, until=None):
+    """
+    Conversion funnel and average time in each status for a job.
+    """
+    rollups = ApplicationStatusRollup.objects.filter(job_id=job_id)
+    if since:
+        rollups = rollups.filter(day__gte=since)
+    if until:
+        rollups = rollups.filter(day__lte=until)
+
+    totals = {
+        row["status"]: row
+        for row in rollups.values("status").annotate(
+            entered=Sum("entered"),
+            exited=Sum("exited"),
+            seconds_in_status=Sum("seconds_in_status"),
+        )
+    }
+    applied = totals.get(Application.Status.APPLIED, {}).get("entered", 0)
+
+    funnel = []
+    for status in FUNNEL_STAGES:
+        row = totals.get(status, {})
+        entered = row.get("entered", 0)
+        exited = row.get("exited", 0)
+        funnel.append(
+            {
+                "status": status,
+                "entered": entered,
+                "conversion": round(entered / applied, 4) if applied else None,
+                "avg_seconds_in_status": (
+                    round(row["seconds_in_status"] / exited) if exited else None
+                ),
+            }
+        )
+    return funnel
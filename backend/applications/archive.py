@@ -0,0 +1,122 @@
+"""
+Cold-storage archival of settled applications.
+
+Withdrawn and rejected applications, and every application of a closed job,
+are moved to ArchivedApplication once they have not changed for
+ARCHIVE_AFTER. Each batch is a single statement that deletes the rows (and
+their status events) from the hot tables and inserts what they returned into
+the archive, so the hot table and its indexes only hold live applications.
+
+Rows are picked with FOR UPDATE SKIP LOCKED and each batch commits on its
+own, so an application being updated concurrently is simply left for the
+next run and no lock is held for longer than one batch.
+"""
+
+from datetime import timedelta
+
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import Application, ApplicationStatusEvent, ArchivedApplication
+
+ARCHIVE_AFTER = timedelta(days=365)
+BATCH_SIZE = 1000
+
+ARCHIVABLE_STATUSES = (Application.Status.WITHDRAWN, Application.Status.REJECTED)
+
+# Columns copied verbatim from the hot table
+COLUMNS = (
+    "id",
+    "applicant_id",
+    "job_id",
+    "cover_letter",
+    "resume",
+    "resume_blob_id",
+    "status",
+    "created_at",
+    "updated_at",
+    "reviewed_at",
+    "withdrawn_at",
+)
+
+MOVE_SQL = """
+WITH batch AS ({batch}),
+events AS (
+    DELETE FROM {events} e USING batch
+    WHERE e.application_id = batch.id
+    RETURNING e.id, e.application_id, e.from_status, e.to_status, e.created_at
+),
+moved AS (
+    DELETE FROM {applications} a USING batch
+    WHERE a.id = batch.id
+    RETURNING {moved_columns}
+)
+INSERT INTO {archive} ({columns}, status_history, archived_at)
+SELECT {columns},
+    COALESCE(
+        (
+            SELECT jsonb_agg(
+                jsonb_build_object(
+                    'from_status', ev.from_status,
+                    'to_status', ev.to_status,
+                    'created_at', ev.created_at
+                )
+                ORDER BY ev.id
+            )
+            FROM events ev
+            WHERE ev.application_id = moved.id
+        ),
+        '[]'::jsonb
+    ),
+    %s
+FROM moved
+"""
+
+
+def archivable_applications(cutoff):
+    return Application.objects.filter(
+        Q(status__in=ARCHIVABLE_STATUSES) | Q(job__is_active=False),
+        updated_at__lt=cutoff,
+    )
+
+
+def archive_batch(cutoff=None, batch_size=BATCH_SIZE):
+    """
+    Move up to `batch_size` archivable applications to the archive.
+
+    Returns the number of applications moved.
+    """
+    if cutoff is None:
+        cutoff = timezone.now() - ARCHIVE_AFTER
+
+    quote = connection.ops.quote_name
+    with transaction.atomic():
+        batch = (
+            archivable_applications(cutoff)
+            .select_for_update(skip_locked=True, of=("self",))
+            .order_by("id")
+            .values("id")[:batch_size]
+        )
+        batch_sql, batch_params = batch.query.sql_with_params()
+        sql = MOVE_SQL.format(
+            batch=batch_sql,
+            events=quote(ApplicationStatusEvent._meta.db_table),
+            applications=quote(Application._meta.db_table),
+            archive=quote(ArchivedApplication._meta.db_table),
+            columns=", ".join(quote(column) for column in COLUMNS),
+            moved_columns=", ".join(f"a.{quote(column)}" for column in COLUMNS),
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, (*batch_params, timezone.now()))
+            return cursor.rowcount
+
+
+def archive_applications(cutoff=None, batch_size=BATCH_SIZE):
+    """
+    Archive everything past the retention threshold, one batch at a time.
+    """
+    total = 0
+    while moved := archive_batch(cutoff, batch_size):
+        total += moved
+    return total
@@ -0,0 +1,109 @@
+"""
+Periodic digests of new applications for employers.
+
+Employers are not notified per application. Instead, a scheduled task
+collects the applications created since each employer's last digest with one
+grouped query (employer x job -> count) and sends one summary message per
+employer over a single connection. An employer's watermark only moves when
+their digest was sent, so failed digests are folded into the next run.
+
+`created_at` is set before an application's transaction commits, so the
+newest applications may not be visible yet. Each run only counts
+applications older than SETTLE_DELAY and moves the watermark to that
+cutoff; later applications are left for the next digest.
+"""
+
+import logging
+from datetime import timedelta
+from itertools import groupby
+
+from django.core.mail import EmailMessage, get_connection
+from django.db.models import Count, DateTimeField, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from accounts.models import User
+from core.mail import DEFAULT_FROM_EMAIL
+
+from .models import Application
+
+logger = logging.getLogger(__name__)
+
+DIGEST_PERIODS = {
+    User.DigestFrequency.HOURLY: timedelta(hours=1),
+    User.DigestFrequency.DAILY: timedelta(days=1),
+}
+
+# Applications older than this are never included, which keeps the scan
+# bounded by the created_at index even for long-failing mailboxes.
+MAX_LOOKBACK = timedelta(days=7)
+
+# Applications younger than this may still be committing
+SETTLE_DELAY = timedelta(minutes=5)
+
+
+def new_application_counts(frequency, until):
+    """
+    Count applications per (employer, job) created after the employer's last
+    digest and up to `until`, for employers on the given digest frequency.
+    """
+    since_last_digest = Coalesce(
+        "job__created_by__application_digest_sent_at",
+        Value(until - DIGEST_PERIODS[frequency]),
+        output_field=DateTimeField(),
+    )
+    return (
+        Application.objects.filter(
+            created_at__gt=until - MAX_LOOKBACK,
+            created_at__lte=until,
+            job__created_by__role=User.Role.EMPLOYER,
+            job__created_by__is_active=True,
+            job__created_by__application_digest=frequency,
+        )
+        .filter(created_at__gt=since_last_digest)
+        .values(
+            "job__created_by",
+            "job__created_by__email",
+            "job__created_by__first_name",
+            "job_id",
+            "job__title",
+        )
+        .annotate(count=Count("id"))
+        .order_by("job__created_by", "-count", "job_id")
+    )
+
+
+def digest_message(rows, frequency):
+    total = sum(row["count"] for row in rows)
+    lines = "\n".join(f"- {row['job__title']}: {row['count']}" for row in rows)
+    period = "hour" if frequency == User.DigestFrequency.HOURLY else "day"
+    return EmailMessage(
+        subject=f"{total} new application{'s' if total != 1 else ''} in the last {period}",
+        body=(
+            f"Hi {rows[0]['job__created_by__first_name']},\n\n"
+            f"Your jobs received new applications:\n\n{lines}"
+        ),
+        from_email=DEFAULT_FROM_EMAIL,
+        to=[rows[0]["job__created_by__email"]],
+    )
+
+
+def send_digests(frequency):
+    """
+    Send one digest per employer on `frequency`. Returns the number sent.
+    """
+    until = timezone.now() - SETTLE_DELAY
+    rows = new_application_counts(frequency, until)
+
+    sent = []
+    with get_connection() as connection:
+        for employer_id, employer_rows in groupby(rows, key=lambda row: row["job__created_by"]):
+            try:
+                connection.send_messages([digest_message(list(employer_rows), frequency)])
+            except Exception:
+                logger.exception("Failed to send application digest to user %s", employer_id)
+            else:
+                sent.append(employer_id)
+
+    User.objects.filter(pk__in=sent).update(application_digest_sent_at=until)
+    return len(sent)
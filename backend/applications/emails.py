@@ -0,0 +1,42 @@
+from django.core.mail import EmailMessage
+
+from core.mail import DEFAULT_FROM_EMAIL
+
+from .models import Application
+
+
+def _applications(application_ids):
+    return Application.objects.select_related("job", "applicant").filter(
+        id__in=application_ids
+    )
+
+
+def confirmation_messages(application_ids):
+    return {
+        application.id: EmailMessage(
+            subject=f"Application submitted for {application.job.title}",
+            body=(
+                f"Hi {application.applicant.first_name},\n\n"
+                f"You successfully applied for '{application.job.title}'."
+            ),
+            from_email=DEFAULT_FROM_EMAIL,
+            to=[application.applicant.email],
+        )
+        for application in _applications(application_ids)
+    }
+
+
+def status_update_messages(application_ids):
+    return {
+        application.id: EmailMessage(
+            subject=f"Application update for {application.job.title}",
+            body=(
+                f"Hi {application.applicant.first_name},\n\n"
+                f"Your application for '{application.job.title}' is now "
+                f"{application.get_status_display()}."
+            ),
+            from_email=DEFAULT_FROM_EMAIL,
+            to=[application.applicant.email],
+        )
+        for application in _applications(application_ids)
+    }
@@ -0,0 +1,8 @@
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class ApplicationConflict(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = "You have already applied to this job."
+    default_code = "already_applied"
@@ -0,0 +1,71 @@
+"""
+Plain-text extraction for uploaded resumes (PDF, DOCX and TXT).
+
+These functions are CPU bound and are only called from Celery tasks running
+on the dedicated `resumes` queue, never from a request.
+"""
+
+import os
+import zipfile
+from xml.etree import ElementTree
+
+# Files larger than this are not parsed at all.
+MAX_RESUME_SIZE = 10 * 1024 * 1024  # 10 MB
+
+# Extracted text is truncated to this many characters.
+MAX_TEXT_LENGTH = 100_000
+
+WORD_NAMESPACE = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+class UnsupportedResumeFormat(Exception):
+    pass
+
+
+def _extract_pdf(file):
+    # Imported lazily so only resume workers need the PDF parser loaded.
+    from pypdf import PdfReader
+
+    reader = PdfReader(file)
+    return "\n".join(page.extract_text() or "" for page in reader.pages)
+
+
+def _extract_docx(file):
+    with zipfile.ZipFile(file) as archive:
+        with archive.open("word/document.xml") as document:
+            paragraphs = []
+            for _, element in ElementTree.iterparse(document):
+                if element.tag == f"{WORD_NAMESPACE}p":
+                    paragraphs.append(
+                        "".join(
+                            node.text or ""
+                            for node in element.iter(f"{WORD_NAMESPACE}t")
+                        )
+                    )
+                    element.clear()
+    return "\n".join(paragraphs)
+
+
+def _extract_txt(file):
+    return file.read(MAX_TEXT_LENGTH * 4).decode("utf-8", errors="replace")
+
+
+EXTRACTORS = {
+    ".pdf": _extract_pdf,
+    ".docx": _extract_docx,
+    ".txt": _extract_txt,
+}
+
+
+def extract_text(file, filename):
+    """
+    Return the plain text of a resume file, normalised and truncated.
+    """
+    extension = os.path.splitext(filename)[1].lower()
+    extractor = EXTRACTORS.get(extension)
+    if extractor is None:
+        raise UnsupportedResumeFormat(extension)
+
+    text = " ".join(extractor(file).split())
+    # PostgreSQL text columns cannot store NUL characters.
+    return text.replace("\x00", "")[:MAX_TEXT_LENGTH]
@@ -0,0 +1,66 @@
+import django_filters
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank
+from django.db.models import F, FloatField, TextField, Value
+from django.db.models.functions import Cast, Coalesce, Concat
+from rest_framework.filters import BaseFilterBackend
+
+from .models import Application
+from .search import SEARCH_CONFIG
+
+
+class ApplicationFilter(django_filters.FilterSet):
+    """
+    Filters for the employer applicant review queue.
+    """
+
+    created_after = django_filters.IsoDateTimeFilter(
+        field_name="created_at", lookup_expr="gte"
+    )
+    created_before = django_filters.IsoDateTimeFilter(
+        field_name="created_at", lookup_expr="lte"
+    )
+
+    class Meta:
+        model = Application
+        fields = ["status", "created_after", "created_before"]
+
+
+class ApplicationSearchFilter(BaseFilterBackend):
+    """
+    Full-text search over cover letters and resume text via `?q=`.
+
+    Matches use the GIN-indexed `search_vector`; results are annotated with
+    a `rank` and a highlighted `snippet`.
+    """
+
+    search_param = "q"
+
+    def get_search_query(self, request):
+        terms = request.query_params.get(self.search_param, "").strip()
+        if not terms:
+            return None
+        return SearchQuery(terms, search_type="websearch", config=SEARCH_CONFIG)
+
+    def filter_queryset(self, request, queryset, view):
+        query = self.get_search_query(request)
+        if query is None:
+            return queryset
+
+        document = Concat(
+            "cover_letter",
+            Value(" "),
+            Coalesce("resume_blob__text", Value(""), output_field=TextField()),
+            output_field=TextField(),
+        )
+        return queryset.filter(search_vector=query).annotate(
+            # Cast to double precision so cursor positions round-trip exactly.
+            rank=Cast(SearchRank(F("search_vector"), query), FloatField()),
+            snippet=SearchHeadline(
+                document,
+                query,
+                config=SEARCH_CONFIG,
+                max_words=35,
+                min_words=15,
+                max_fragments=2,
+            ),
+        )
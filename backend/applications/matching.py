@@ -0,0 +1,134 @@
+"""
+Candidate-to-job match scoring.
+
+Texts are embedded as L2-normalised, hashed term-frequency vectors, so the
+match score of an application is the cosine similarity between the job
+(title and description) and the candidate (cover letter and resume text).
+Candidate vectors are kept sparse (only the buckets a text uses), and
+scoring all applicants of a job is a single sparse matrix-vector product.
+"""
+
+import re
+import zlib
+
+import numpy as np
+from django.db.models import TextField, Value
+from django.db.models.functions import Coalesce
+from jobs.models import Job
+
+from .models import Application
+
+# Number of hash buckets; large enough that collisions are rare for
+# resume-sized vocabularies. Only the job vector is stored densely.
+DIMENSIONS = 2**14
+
+BATCH_SIZE = 1000
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]")
+
+STOP_WORDS = frozenset(
+    """
+    a about an and are as at be by for from has have i in is it its me my of
+    on or our that the this to we will with you your
+    """.split()
+)
+
+
+def tokenize(text):
+    return [
+        token
+        for token in TOKEN_PATTERN.findall(text.lower())
+        if token not in STOP_WORDS
+    ]
+
+
+def embed(texts):
+    """
+    Return L2-normalised term vectors as sparse (rows, buckets, weights)
+    arrays: text rows[i] has weight weights[i] in bucket buckets[i].
+    """
+    rows, buckets, weights = [], [], []
+    for row, text in enumerate(texts):
+        tokens = tokenize(text)
+        if not tokens:
+            continue
+        used, counts = np.unique(
+            [zlib.crc32(token.encode()) % DIMENSIONS for token in tokens],
+            return_counts=True,
+        )
+        # Sublinear term frequency keeps keyword stuffing from dominating.
+        weight = np.log1p(counts.astype(np.float32))
+        weight /= np.linalg.norm(weight)
+        rows.append(np.full(len(used), row))
+        buckets.append(used)
+        weights.append(weight)
+
+    if not rows:
+        return np.zeros(0, dtype=int), np.zeros(0, dtype=int), np.zeros(0, dtype=np.float32)
+    return np.concatenate(rows), np.concatenate(buckets), np.concatenate(weights)
+
+
+def job_text(job):
+    return f"{job.title}\n{job.description}"
+
+
+def score(job, candidate_texts):
+    """
+    Return the match score (0-1) of each candidate text against a job.
+    """
+    if not candidate_texts:
+        return np.zeros(0, dtype=np.float32)
+    _, job_buckets, job_weights = embed([job_text(job)])
+    job_vector = np.zeros(DIMENSIONS, dtype=np.float32)
+    job_vector[job_buckets] = job_weights
+
+    rows, buckets, weights = embed(candidate_texts)
+    return np.bincount(
+        rows, weights=weights * job_vector[buckets], minlength=len(candidate_texts)
+    ).astype(np.float32)
+
+
+def score_job_applications(job, queryset=None):
+    """
+    Score applications of a job in batches, one matrix product and one bulk
+    UPDATE per batch. Returns the number of applications scored.
+    """
+    if queryset is None:
+        queryset = job.applications.all()
+
+    rows = (
+        queryset.annotate(
+            resume_text=Coalesce("resume_blob__text", Value(""), output_field=TextField())
+        )
+        .order_by("pk")
+        .values_list("pk", "cover_letter", "resume_text")
+    )
+
+    scored = 0
+    last_pk = 0
+    while batch := list(rows.filter(pk__gt=last_pk)[:BATCH_SIZE]):
+        _score_batch(job, batch)
+        scored += len(batch)
+        last_pk = batch[-1][0]
+    return scored
+
+
+def score_resume_applications(blob):
+    """
+    Rescore every application using a resume blob, e.g. once its text is known.
+    """
+    for job in Job.objects.filter(applications__resume_blob=blob).distinct():
+        score_job_applications(job, blob.applications.filter(job=job))
+
+
+def _score_batch(job, batch):
+    scores = score(
+        job, [f"{cover_letter}\n{resume_text}" for _, cover_letter, resume_text in batch]
+    )
+    Application.objects.bulk_update(
+        [
+            Application(pk=pk, match_score=float(value))
+            for (pk, _, _), value in zip(batch, scores)
+        ],
+        ["match_score"],
+    )
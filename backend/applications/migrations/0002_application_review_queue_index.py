@@ -0,0 +1,32 @@
+# Generated by Django 5.2.10 on 2026-10-19 01:50
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0001_initial'),
+        ('jobs', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='application',
+            name='application_job_id_2b6ae2_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='application',
+            name='application_applica_a7c7c2_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='application',
+            name='application_status_1508e0_idx',
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['job', 'status', 'created_at'], name='application_job_id_408c41_idx'),
+        ),
+    ]
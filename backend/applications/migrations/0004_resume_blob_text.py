@@ -0,0 +1,23 @@
+# Generated by Django 5.2.10 on 2026-10-19 02:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0003_resume_blob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resumeblob',
+            name='text',
+            field=models.TextField(blank=True),
+        ),
+        migrations.AddField(
+            model_name='resumeblob',
+            name='text_status',
+            field=models.CharField(choices=[('PENDING', 'Pending'), ('EXTRACTED', 'Extracted'), ('SKIPPED', 'Skipped'), ('FAILED', 'Failed')], default='PENDING', max_length=20),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.10 on 2026-10-19 02:11
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+from django.db.models import Value
+
+
+def backfill_search_vectors(apps, schema_editor):
+    Application = apps.get_model('applications', 'Application')
+    ResumeBlob = apps.get_model('applications', 'ResumeBlob')
+
+    cover_letter = SearchVector('cover_letter', weight='A', config='english')
+
+    Application.objects.update(search_vector=cover_letter)
+    for blob in ResumeBlob.objects.exclude(text='').iterator():
+        Application.objects.filter(resume_blob=blob).update(
+            search_vector=cover_letter
+            + SearchVector(Value(blob.text), weight='B', config='english')
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0004_resume_blob_text'),
+        ('jobs', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='application_search__1546be_gin'),
+        ),
+        migrations.RunPython(backfill_search_vectors, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.10 on 2026-10-19 02:31
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0008_archived_application'),
+        ('jobs', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=django.contrib.postgres.indexes.BrinIndex(fields=['created_at'], name='application_created_fd7432_brin'),
+        ),
+    ]
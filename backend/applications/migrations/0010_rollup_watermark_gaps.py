@@ -0,0 +1,18 @@
+# Generated by Django 5.2.10 on 2026-10-19 03:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0009_application_created_at_brin'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='rollupwatermark',
+            name='gaps',
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
@@ -1,8 +1,51 @@
-from django.db import models
 from django.conf import settings
+from django.contrib.postgres.indexes import BrinIndex, GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models
+from django.utils import timezone
 from jobs.models import Job
 
 
+class ResumeBlob(models.Model):
+    """
+    A resume file stored once per unique content, addressed by its SHA-256.
+
+    Applications reference blobs instead of owning a copy of the upload;
+    `ref_count` tracks how many applications point at a blob so that orphaned
+    blobs can be garbage collected. Extracted plain text is stored on the
+    blob, so each unique file is parsed only once.
+    """
+
+    class TextStatus(models.TextChoices):
+        PENDING = "PENDING", "Pending"
+        EXTRACTED = "EXTRACTED", "Extracted"
+        SKIPPED = "SKIPPED", "Skipped"
+        FAILED = "FAILED", "Failed"
+
+    sha256 = models.CharField(max_length=64, unique=True)
+    file = models.FileField(upload_to="resumes/")
+    size = models.PositiveBigIntegerField()
+    ref_count = models.PositiveIntegerField(default=0)
+
+    text = models.TextField(blank=True)
+    text_status = models.CharField(
+        max_length=20,
+        choices=TextStatus.choices,
+        default=TextStatus.PENDING,
+    )
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["ref_count", "updated_at"]),
+        ]
+
+    def __str__(self):
+        return self.sha256
+
+
 class Application(models.Model):
     class Status(models.TextChoices):
         APPLIED = "APPLIED", "Applied"
@@ -26,6 +69,13 @@ class Application(models.Model):
 
     cover_letter = models.TextField()
     resume = models.FileField(upload_to="resumes/")
+    resume_blob = models.ForeignKey(
+        ResumeBlob,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="applications",
+    )
 
     status = models.CharField(
         max_length=20,
@@ -39,13 +89,153 @@ class Application(models.Model):
     reviewed_at = models.DateTimeField(null=True, blank=True)
     withdrawn_at = models.DateTimeField(null=True, blank=True)
 
+    # Cover letter and resume text, maintained by applications.search
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    # Similarity to the job posting (0-1), computed by applications.matching
+    match_score = models.FloatField(null=True, blank=True, editable=False)
+
     class Meta:
         unique_together = ("applicant", "job")
         indexes = [
-            models.Index(fields=["job"]),
-            models.Index(fields=["applicant"]),
-            models.Index(fields=["status"]),
+            # Serves the employer review queue: applications of one job,
+            # optionally narrowed by status, ordered by submission time.
+            # Lookups by applicant use the foreign key's own index.
+            models.Index(fields=["job", "status", "created_at"]),
+            GinIndex(fields=["search_vector"]),
+            models.Index(fields=["job", "match_score"]),
+            # Time-range scans across all jobs (employer digests); rows are
+            # appended in created_at order, so a BRIN index stays tiny.
+            BrinIndex(fields=["created_at"]),
         ]
 
     def __str__(self):
         return f"{self.applicant} → {self.job}"
+
+
+class ArchivedApplication(models.Model):
+    """
+    Application moved out of the hot table by applications.archive.
+
+    Keeps the original primary key, and the application's status events as
+    `status_history`. The resume blob reference moves here with the row, so
+    the file is not collected while the archived application exists.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    applicant = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="archived_applications",
+    )
+    job = models.ForeignKey(
+        Job,
+        on_delete=models.CASCADE,
+        related_name="archived_applications",
+    )
+
+    cover_letter = models.TextField()
+    resume = models.FileField(upload_to="resumes/")
+    resume_blob = models.ForeignKey(
+        ResumeBlob,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="archived_applications",
+    )
+    status = models.CharField(max_length=20, choices=Application.Status.choices)
+
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    reviewed_at = models.DateTimeField(null=True, blank=True)
+    withdrawn_at = models.DateTimeField(null=True, blank=True)
+
+    # [{"from_status", "to_status", "created_at"}, ...] oldest first
+    status_history = models.JSONField(default=list)
+    archived_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["job", "created_at"]),
+            models.Index(fields=["applicant", "created_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.applicant} → {self.job} (archived)"
+
+
+class ApplicationStatusEvent(models.Model):
+    """
+    Append-only log of application status transitions.
+
+    Written in the same transaction as the status change itself (see
+    applications.services); `from_status` is empty for the initial APPLIED
+    event. `job` is denormalised so rollups never join applications.
+    """
+
+    application = models.ForeignKey(
+        Application,
+        on_delete=models.CASCADE,
+        related_name="status_events",
+    )
+    job = models.ForeignKey(
+        Job,
+        on_delete=models.CASCADE,
+        related_name="application_status_events",
+    )
+    from_status = models.CharField(
+        max_length=20, choices=Application.Status.choices, blank=True
+    )
+    to_status = models.CharField(max_length=20, choices=Application.Status.choices)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["application", "id"]),
+        ]
+
+    def __str__(self):
+        return f"{self.application_id}: {self.from_status or '-'} → {self.to_status}"
+
+
+class ApplicationStatusRollup(models.Model):
+    """
+    Per job, per day, per status totals derived from ApplicationStatusEvent.
+
+    `entered` counts transitions into the status; `exited` and
+    `seconds_in_status` count transitions out of it and the time spent there.
+    """
+
+    job = models.ForeignKey(
+        Job,
+        on_delete=models.CASCADE,
+        related_name="application_status_rollups",
+    )
+    day = models.DateField()
+    status = models.CharField(max_length=20, choices=Application.Status.choices)
+    entered = models.PositiveIntegerField(default=0)
+    exited = models.PositiveIntegerField(default=0)
+    seconds_in_status = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        unique_together = ("job", "day", "status")
+
+    def __str__(self):
+        return f"{self.job_id} {self.day} {self.status}"
+
+
+class RollupWatermark(models.Model):
+    """
+    Id of the last event folded into a rollup, so each run is incremental.
+
+    `gaps` holds [low, high, first seen] ranges of ids below the mark that
+    were not visible when it moved past them (see applications.analytics).
+    """
+
+    name = models.CharField(max_length=100, unique=True)
+    last_event_id = models.BigIntegerField(default=0)
+    gaps = models.JSONField(default=list, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name}: {self.last_event_id}"
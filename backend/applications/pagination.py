@@ -0,0 +1,15 @@
+from rest_framework.pagination import CursorPagination
+
+
+class ApplicationCursorPagination(CursorPagination):
+    """
+    Cursor pagination for application lists.
+
+    Cursors seek on the ordering column instead of using OFFSET, so deep pages
+    of a popular job cost the same as the first one.
+    """
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = "-created_at"
@@ -1,6 +1,6 @@
 from rest_framework.permissions import BasePermission
 
-from jobs.models import Job
+from jobs.services.ownership import is_job_owner, is_owner
 
 
 class IsApplicantOwner(BasePermission):
@@ -9,7 +9,7 @@ class IsApplicantOwner(BasePermission):
     """
 
     def has_object_permission(self, request, view, obj):
-        return obj.applicant == request.user
+        return is_owner(request, obj, field="applicant")
 
 
 class IsJobSeeker(BasePermission):
@@ -40,12 +40,7 @@ class IsJobOwner(BasePermission):
 
         # Check for job_pk for list views (e.g., /jobs/{job_pk}/applications/)
         if "job_pk" in view.kwargs:
-            job_pk = view.kwargs["job_pk"]
-            try:
-                job = Job.objects.get(pk=job_pk)
-                return job.created_by == request.user
-            except Job.DoesNotExist:
-                return False
+            return is_job_owner(request, view.kwargs["job_pk"])
 
         # Defer to has_object_permission for detail views where there's no job_pk in the URL kwargs
         return True
@@ -55,4 +50,4 @@ class IsJobOwner(BasePermission):
         if not request.user.is_authenticated or not request.user.is_employer():
             return False
 
-        return obj.job.created_by == request.user
+        return is_job_owner(request, obj.job_id)
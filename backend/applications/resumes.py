@@ -0,0 +1,255 @@
+"""
+Content-addressed resume storage.
+
+Uploads are stored once per unique content under `resumes/<aa>/<sha256><ext>`
+and shared by every application that uses the same file.
+
+Files are written before the ResumeBlob row that refers to them commits.
+Callers wrap the transaction in `discard_resumes_on_error()`, which deletes
+the files it wrote if the transaction fails, so a rolled back application
+does not leave an unreferenced resume behind.
+"""
+
+import hashlib
+import logging
+import mimetypes
+import os
+import zipfile
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import timedelta
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F
+from django.http import FileResponse, HttpResponse
+from django.utils import timezone
+from django.utils.http import content_disposition_header
+
+from .models import ResumeBlob
+
+logger = logging.getLogger(__name__)
+
+# Orphaned blobs are kept for a while so a seeker re-applying shortly after
+# a deletion does not have to upload the file again.
+ORPHAN_GRACE_PERIOD = timedelta(hours=24)
+
+# (digest, name) of the files written within discard_resumes_on_error()
+_written_files = ContextVar("written_resume_files", default=None)
+
+
+def resume_digest(uploaded_file):
+    """
+    Return the SHA-256 of an uploaded file.
+
+    Uploads handled by the hashing upload handlers already carry the digest;
+    anything else is hashed chunk by chunk.
+    """
+    digest = getattr(uploaded_file, "sha256", None)
+    if digest:
+        return digest
+
+    sha256 = hashlib.sha256()
+    for chunk in uploaded_file.chunks():
+        sha256.update(chunk)
+    uploaded_file.seek(0)
+    return sha256.hexdigest()
+
+
+def resume_blob_name(digest, filename):
+    extension = os.path.splitext(filename)[1].lower()
+    return f"resumes/{digest[:2]}/{digest}{extension}"
+
+
+def store_resume(uploaded_file):
+    """
+    Return the ResumeBlob for an upload, writing the file only if its content
+    has not been stored before, and take a reference on it.
+    """
+    digest = resume_digest(uploaded_file)
+
+    with transaction.atomic():
+        _lock_digest(digest)
+        blob = ResumeBlob.objects.select_for_update().filter(sha256=digest).first()
+        if blob is None:
+            name = resume_blob_name(digest, uploaded_file.name)
+            if not default_storage.exists(name):
+                name = default_storage.save(name, uploaded_file)
+                written = _written_files.get()
+                if written is not None:
+                    written.append((digest, name))
+            try:
+                with transaction.atomic():
+                    return ResumeBlob.objects.create(
+                        sha256=digest, file=name, size=uploaded_file.size, ref_count=1
+                    )
+            except IntegrityError:
+                # Another request stored the same content concurrently.
+                blob = ResumeBlob.objects.select_for_update().get(sha256=digest)
+
+        blob.ref_count = F("ref_count") + 1
+        blob.save(update_fields=["ref_count", "updated_at"])
+        blob.refresh_from_db(fields=["ref_count"])
+        return blob
+
+
+@contextmanager
+def discard_resumes_on_error():
+    """
+    Delete the files `store_resume` writes within the block if it raises.
+
+    Wrap the whole transaction, so the files are only deleted once it has
+    been rolled back. A file is kept if a concurrent upload of the same
+    content committed a blob for it meanwhile.
+    """
+    written = []
+    token = _written_files.set(written)
+    try:
+        yield
+    except BaseException:
+        for digest, name in written:
+            with transaction.atomic():
+                _lock_digest(digest)
+                if not ResumeBlob.objects.filter(sha256=digest).exists():
+                    default_storage.delete(name)
+        raise
+    finally:
+        _written_files.reset(token)
+
+
+def _lock_digest(digest):
+    # Serializes storing and discarding files with the same content until
+    # the transaction ends; the row lock alone cannot cover a blob that does
+    # not exist yet.
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_advisory_xact_lock(%s)", [int(digest[:15], 16)])
+
+
+def release_resume(blob_id):
+    """
+    Drop one reference on a blob; unreferenced blobs are collected later.
+    """
+    ResumeBlob.objects.filter(pk=blob_id, ref_count__gt=0).update(
+        ref_count=F("ref_count") - 1, updated_at=timezone.now()
+    )
+
+
+def collect_orphaned_resumes(batch_size=500):
+    """
+    Delete blobs that have been unreferenced for longer than the grace period.
+
+    Rows are locked with SKIP LOCKED, so blobs being re-referenced by a
+    concurrent `store_resume` are left alone. Returns the number collected.
+    """
+    cutoff = timezone.now() - ORPHAN_GRACE_PERIOD
+
+    with transaction.atomic():
+        blobs = dict(
+            ResumeBlob.objects.select_for_update(skip_locked=True, of=("self",))
+            .filter(
+                ref_count=0,
+                updated_at__lt=cutoff,
+                applications__isnull=True,
+                archived_applications__isnull=True,
+            )
+            .values_list("pk", "file")[:batch_size]
+        )
+        ResumeBlob.objects.filter(pk__in=blobs.keys()).delete()
+        transaction.on_commit(lambda: _delete_files(blobs.values()))
+
+    return len(blobs)
+
+
+def _delete_files(names):
+    for name in names:
+        default_storage.delete(name)
+
+
+def resume_response(field_file, filename):
+    """
+    Build a response that sends a stored resume as an attachment.
+
+    With `MEDIA_SENDFILE_BACKEND` set, the response only carries headers and
+    the front proxy streams the file itself ("nginx": X-Accel-Redirect to
+    `PROTECTED_MEDIA_URL`, "apache": X-Sendfile with the file path), so no
+    worker is held for the transfer. Otherwise the file is returned as a
+    FileResponse, which the WSGI server can hand to sendfile().
+
+    Raises FileNotFoundError when serving locally and the file is missing.
+    """
+    content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+    backend = settings.MEDIA_SENDFILE_BACKEND
+
+    if backend == "nginx":
+        response = HttpResponse(content_type=content_type)
+        response["X-Accel-Redirect"] = settings.PROTECTED_MEDIA_URL + quote(field_file.name)
+    elif backend == "apache":
+        response = HttpResponse(content_type=content_type)
+        response["X-Sendfile"] = field_file.path
+    else:
+        response = FileResponse(
+            field_file.open("rb"),
+            as_attachment=True,
+            filename=filename,
+            content_type=content_type,
+        )
+
+    response["Content-Disposition"] = content_disposition_header(True, filename)
+    response["Cache-Control"] = "private"
+    return response
+
+
+class _ZipStreamBuffer:
+    """
+    Write-only file object that hands written bytes back to a generator.
+
+    It is not seekable, so zipfile writes data descriptors after each entry
+    instead of seeking back to patch local headers.
+    """
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def stream_resumes_zip(entries):
+    """
+    Yield a ZIP archive of resumes chunk by chunk.
+
+    `entries` is an iterable of (archive name, FieldFile) pairs. Files are
+    read in storage-sized chunks and stored uncompressed (resumes are mostly
+    already-compressed PDF/DOCX), so neither the archive nor any single file
+    is ever held in memory.
+    """
+    buffer = _ZipStreamBuffer()
+    with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_STORED) as archive:
+        for name, field_file in entries:
+            try:
+                field_file.open("rb")
+            except OSError:
+                logger.warning("Skipping missing resume file %s", field_file.name)
+                continue
+
+            try:
+                with archive.open(name, mode="w", force_zip64=True) as entry:
+                    for chunk in field_file.chunks():
+                        entry.write(chunk)
+                        yield buffer.drain()
+            finally:
+                field_file.close()
+            yield buffer.drain()
+
+    yield buffer.drain()
@@ -0,0 +1,42 @@
+"""
+Full-text search over applications.
+
+Each application carries a precomputed `search_vector` built from its cover
+letter (weight A) and the extracted text of its resume (weight B), indexed
+with GIN so employer searches never scan the table.
+"""
+
+from django.contrib.postgres.search import SearchVector
+from django.db.models import Value
+
+SEARCH_CONFIG = "english"
+
+
+def cover_letter_vector(cover_letter=None):
+    """
+    Search vector for a cover letter, either a literal or the row's column.
+    """
+    expression = "cover_letter" if cover_letter is None else Value(cover_letter)
+    return SearchVector(expression, weight="A", config=SEARCH_CONFIG)
+
+
+def resume_text_vector(text):
+    return SearchVector(Value(text), weight="B", config=SEARCH_CONFIG)
+
+
+def application_search_vector(cover_letter, resume_text):
+    """
+    Expression computing the search vector of a new application, so it can
+    be written by the INSERT itself.
+    """
+    return cover_letter_vector(cover_letter) + resume_text_vector(resume_text)
+
+
+def refresh_resume_search_vectors(blob):
+    """
+    Rebuild the search vectors of every application using a resume blob once
+    its text is known, in a single UPDATE.
+    """
+    blob.applications.update(
+        search_vector=cover_letter_vector() + resume_text_vector(blob.text)
+    )
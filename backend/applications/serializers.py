@@ -1,6 +1,10 @@
 from rest_framework import serializers
+from rest_framework.reverse import reverse
 
-from .models import Application
+from .models import Application, ArchivedApplication
+from .resumes import store_resume
+from .search import application_search_vector
+from .services import log_status_change
 
 
 class ApplicationCreateSerializer(serializers.ModelSerializer):
@@ -11,30 +15,92 @@ class ApplicationCreateSerializer(serializers.ModelSerializer):
         model = Application
         fields = ["id", "applicant", "job", "cover_letter", "resume"]
         read_only_fields = ["applicant", "job"]
+        extra_kwargs = {"resume": {"write_only": True}}
 
     def validate(self, attrs):
         user = self.context["request"].user
-        job = self.context["view"].kwargs.get("job_pk")
 
         if not user.is_job_seeker():
             raise serializers.ValidationError("Only job seekers can apply.")
 
-        if Application.objects.filter(applicant=user, job_id=job).exists():
-            raise serializers.ValidationError("You have already applied to this job.")
-
+        # Duplicate applications are rejected by the (applicant, job) unique
+        # constraint when the row is inserted; see JobApplicationListCreateView.
         return attrs
 
+    def create(self, validated_data):
+        # Identical resumes share one stored file instead of a copy per job.
+        blob = store_resume(validated_data.pop("resume"))
+        validated_data["resume_blob"] = blob
+        validated_data["resume"] = blob.file.name
+        # Computed by the INSERT itself; if the resume has not been parsed
+        # yet, the vector is refreshed once its text is extracted.
+        validated_data["search_vector"] = application_search_vector(
+            validated_data["cover_letter"], blob.text
+        )
+        application = super().create(validated_data)
+        log_status_change(application)
+        return application
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        # Resumes are not public media; link to the permission-checked download
+        data["resume"] = reverse(
+            "application-resume-download",
+            kwargs={"pk": instance.pk},
+            request=self.context.get("request"),
+        )
+        return data
+
 
 class ApplicationReadSerializer(serializers.ModelSerializer):
     applicant = serializers.StringRelatedField()
     job = serializers.StringRelatedField()
+    # Resumes are not public media; link to the permission-checked download
+    resume = serializers.HyperlinkedIdentityField(view_name="application-resume-download")
 
     class Meta:
         model = Application
-        fields = "__all__"
+        exclude = ["resume_blob", "search_vector"]
+
+
+class ArchivedApplicationSerializer(serializers.ModelSerializer):
+    applicant = serializers.StringRelatedField()
+    job = serializers.StringRelatedField()
+
+    class Meta:
+        model = ArchivedApplication
+        exclude = ["resume", "resume_blob"]
+
+
+class ApplicationSearchResultSerializer(ApplicationReadSerializer):
+    rank = serializers.FloatField(read_only=True)
+    snippet = serializers.CharField(read_only=True)
+
+    class Meta(ApplicationReadSerializer.Meta):
+        pass
 
 
 class ApplicationStatusUpdateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Application
         fields = ["status"]
+
+
+class ApplicationBulkStatusUpdateSerializer(serializers.Serializer):
+    application_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=1000,
+    )
+    status = serializers.ChoiceField(
+        choices=[
+            choice
+            for choice in Application.Status.choices
+            if choice[0] != Application.Status.WITHDRAWN
+        ]
+    )
+
+
+class ApplicationAnalyticsQuerySerializer(serializers.Serializer):
+    since = serializers.DateField(required=False)
+    until = serializers.DateField(required=False)
@@ -1,6 +1,48 @@
+from core.mail import queue_email
+from core.utils.cache_keys import application_idempotency_key
+from django.core.cache import cache
+from django.core.exceptions import PermissionDenied
+from django.db import transaction
 from django.utils import timezone
 
-from .models import Application
+from .models import Application, ApplicationStatusEvent
+
+IDEMPOTENCY_TTL = 60 * 10  # 10 minutes
+
+
+def get_idempotent_response(user_id, job_id, key):
+    """
+    Return the response data stored for a previous submission with this key.
+    """
+    return cache.get(application_idempotency_key(user_id, job_id, key))
+
+
+def set_idempotent_response(user_id, job_id, key, data):
+    cache.set(application_idempotency_key(user_id, job_id, key), data, IDEMPOTENCY_TTL)
+
+
+def log_status_change(application, from_status=""):
+    """
+    Append a status transition to the event log.
+    Must be called in the transaction that changes the status.
+    """
+    ApplicationStatusEvent.objects.create(
+        application=application,
+        job_id=application.job_id,
+        from_status=from_status,
+        to_status=application.status,
+    )
+
+
+def _change_status(application, new_status, timestamp_field):
+    previous_status = application.status
+    application.status = new_status
+    setattr(application, timestamp_field, timezone.now())
+
+    with transaction.atomic():
+        application.save(update_fields=["status", timestamp_field])
+        if new_status != previous_status:
+            log_status_change(application, previous_status)
 
 
 def withdraw_application(application):
@@ -11,9 +53,7 @@ def withdraw_application(application):
     if application.status != Application.Status.APPLIED:
         raise ValueError("Only APPLIED applications can be withdrawn.")
 
-    application.status = Application.Status.WITHDRAWN
-    application.withdrawn_at = timezone.now()
-    application.save(update_fields=["status", "withdrawn_at"])
+    _change_status(application, Application.Status.WITHDRAWN, "withdrawn_at")
 
 
 def update_application_status(application, new_status):
@@ -23,6 +63,52 @@ def update_application_status(application, new_status):
     if application.status == Application.Status.WITHDRAWN:
         raise ValueError("Withdrawn applications cannot be updated.")
 
-    application.status = new_status
-    application.reviewed_at = timezone.now()
-    application.save(update_fields=["status", "reviewed_at"])
+    _change_status(application, new_status, "reviewed_at")
+
+
+def bulk_update_application_status(user, application_ids, new_status):
+    """
+    Update the status of many applications at once (Employer/Admin).
+
+    Ownership of the whole batch is checked with one query and the transition
+    is applied with one conditional UPDATE, following the same rules as
+    `update_application_status`. Returns the updated and skipped ids.
+    """
+    requested = set(application_ids)
+
+    with transaction.atomic():
+        queryset = Application.objects.select_for_update(of=("self",)).filter(
+            pk__in=requested
+        )
+        if not user.is_admin():
+            queryset = queryset.filter(job__created_by=user)
+
+        current = {
+            pk: (status, job_id)
+            for pk, status, job_id in queryset.values_list("pk", "status", "job_id")
+        }
+        if current.keys() != requested:
+            raise PermissionDenied("You can only update applications for your own jobs.")
+
+        updated = sorted(
+            pk for pk, (status, _) in current.items()
+            if status != Application.Status.WITHDRAWN
+        )
+        Application.objects.filter(pk__in=updated).exclude(
+            status=Application.Status.WITHDRAWN
+        ).update(status=new_status, reviewed_at=timezone.now())
+        ApplicationStatusEvent.objects.bulk_create(
+            ApplicationStatusEvent(
+                application_id=pk,
+                job_id=current[pk][1],
+                from_status=current[pk][0],
+                to_status=new_status,
+            )
+            for pk in updated
+            if current[pk][0] != new_status
+        )
+
+        queue_email("applications.emails.status_update_messages", *updated)
+
+    skipped = sorted(requested.difference(updated))
+    return updated, skipped
@@ -1,11 +1,45 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from .models import Application
-from .tasks import send_application_confirmation
+from core.debounce import debounce
+from core.mail import queue_email
+from core.outbox import publish
+from jobs.models import Job
+
+from .models import Application, ArchivedApplication, ResumeBlob
+from .resumes import release_resume
+
+# Job fields that feed the match score
+MATCH_FIELDS = {"title", "description"}
+# Rescore a job at most once per burst of edits
+RESCORE_DELAY = 30  # seconds
 
 
 @receiver(post_save, sender=Application)
 def application_created(sender, instance, created, **kwargs):
     if created:
-        send_application_confirmation.delay(instance.id)
+        queue_email("applications.emails.confirmation_messages", instance.id)
+        publish("applications.tasks.score_application", instance.id)
+
+
+@receiver(post_save, sender=Job)
+def job_updated(sender, instance, created, update_fields=None, **kwargs):
+    if created:
+        return
+    if update_fields is not None and not MATCH_FIELDS.intersection(update_fields):
+        return
+    debounce("applications.tasks.rescore_job_applications", instance.id, delay=RESCORE_DELAY)
+
+
+@receiver(post_delete, sender=Application)
+@receiver(post_delete, sender=ArchivedApplication)
+def application_deleted(sender, instance, **kwargs):
+    if instance.resume_blob_id:
+        release_resume(instance.resume_blob_id)
+
+
+@receiver(post_save, sender=ResumeBlob)
+def resume_blob_created(sender, instance, created, **kwargs):
+    # Only new content needs parsing; re-uploads reuse the existing blob.
+    if created:
+        publish("applications.tasks.extract_resume_text", instance.pk)
@@ -1,22 +1,106 @@
+import logging
+
 from celery import shared_task
-from django.core.mail import send_mail
+from celery.exceptions import SoftTimeLimitExceeded
+from core.task_routing import BULK, RESUMES
+from jobs.models import Job
+
+from .analytics import rollup_status_events
+from .archive import archive_applications
+from .digests import send_digests
+from .extraction import MAX_RESUME_SIZE, UnsupportedResumeFormat, extract_text
+from .matching import score_job_applications, score_resume_applications
+from .models import Application, ResumeBlob
+from .resumes import collect_orphaned_resumes
+from .search import refresh_resume_search_vectors
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(queue=BULK)
+def send_application_digests(frequency):
+    return send_digests(frequency)
+
+
+@shared_task(queue=BULK)
+def collect_orphaned_resume_blobs():
+    return collect_orphaned_resumes()
+
+
+@shared_task(queue=RESUMES, rate_limit="120/m", soft_time_limit=30, time_limit=60)
+def extract_resume_text(blob_id):
+    """
+    Extract and store the plain text of a resume blob.
+
+    Blobs are content addressed, so a file is parsed at most once no matter
+    how many applications use it; already processed blobs are skipped.
+    """
+    blob = ResumeBlob.objects.filter(
+        pk=blob_id, text_status=ResumeBlob.TextStatus.PENDING
+    ).first()
+    if blob is None:
+        return
 
-from .models import Application
+    text = ""
+    if blob.size > MAX_RESUME_SIZE:
+        text_status = ResumeBlob.TextStatus.SKIPPED
+    else:
+        try:
+            with blob.file.open("rb") as file:
+                text = extract_text(file, blob.file.name)
+            text_status = ResumeBlob.TextStatus.EXTRACTED
+        except UnsupportedResumeFormat:
+            text_status = ResumeBlob.TextStatus.SKIPPED
+        except SoftTimeLimitExceeded:
+            logger.warning("Timed out extracting text from resume blob %s", blob_id)
+            text_status = ResumeBlob.TextStatus.FAILED
+        except Exception:
+            logger.exception("Failed to extract text from resume blob %s", blob_id)
+            text_status = ResumeBlob.TextStatus.FAILED
+
+    updated = ResumeBlob.objects.filter(
+        pk=blob_id, text_status=ResumeBlob.TextStatus.PENDING
+    ).update(text=text, text_status=text_status)
+
+    if updated and text:
+        blob.text = text
+        refresh_resume_search_vectors(blob)
+        score_resume_applications(blob)
 
 
 @shared_task
-def send_application_confirmation(application_id):
-    application = Application.objects.select_related("job", "applicant").get(
-        id=application_id
+def score_application(application_id):
+    application = (
+        Application.objects.select_related("job").filter(id=application_id).first()
     )
+    if application is None:
+        return
 
-    send_mail(
-        subject=f"Application submitted for {application.job.title}",
-        message=(
-            f"Hi {application.applicant.first_name},\n\n"
-            f"You successfully applied for '{application.job.title}'."
-        ),
-        from_email="noreply@jobboard.com",
-        recipient_list=[application.applicant.email],
-        fail_silently=True,
+    score_job_applications(
+        application.job, Application.objects.filter(id=application_id)
     )
+
+
+@shared_task(queue=BULK, rate_limit="10/m")
+def rescore_job_applications(job_id):
+    job = Job.objects.filter(id=job_id).first()
+    if job is None:
+        return 0
+
+    return score_job_applications(job)
+
+
+@shared_task(queue=BULK)
+def rollup_application_status_events():
+    processed = 0
+    while batch := rollup_status_events():
+        processed += batch
+    return processed
+
+
+@shared_task(queue=BULK)
+def archive_old_applications():
+    archived = archive_applications()
+    if archived:
+        logger.info("Archived %d applications", archived)
+    return archived
@@ -0,0 +1,158 @@
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from accounts.tests.factories import EmployerUserFactory
+from applications.analytics import GAP_TIMEOUT, rollup_status_events
+from applications.models import (
+    Application,
+    ApplicationStatusEvent,
+    ApplicationStatusRollup,
+    RollupWatermark,
+)
+from applications.services import (
+    bulk_update_application_status,
+    log_status_change,
+    update_application_status,
+    withdraw_application,
+)
+from applications.tests.factories import ApplicationFactory
+from jobs.tests.factories import JobFactory
+
+
+def age_events(**delta):
+    ApplicationStatusEvent.objects.update(created_at=timezone.now() - timedelta(**delta))
+
+
+@pytest.mark.django_db
+class TestStatusEventLog:
+    def test_status_update_is_logged(self):
+        application = ApplicationFactory()
+        update_application_status(application, Application.Status.SHORTLISTED)
+        event = ApplicationStatusEvent.objects.get(application=application)
+        assert event.job_id == application.job_id
+        assert event.from_status == Application.Status.APPLIED
+        assert event.to_status == Application.Status.SHORTLISTED
+
+    def test_withdrawal_is_logged(self):
+        application = ApplicationFactory()
+        withdraw_application(application)
+        event = ApplicationStatusEvent.objects.get(application=application)
+        assert event.to_status == Application.Status.WITHDRAWN
+
+    def test_bulk_update_logs_one_event_per_application(self):
+        employer = EmployerUserFactory()
+        job = JobFactory(created_by=employer)
+        applications = ApplicationFactory.create_batch(3, job=job)
+        bulk_update_application_status(
+            employer, [app.pk for app in applications], Application.Status.REJECTED
+        )
+        assert ApplicationStatusEvent.objects.filter(
+            to_status=Application.Status.REJECTED
+        ).count() == 3
+
+
+@pytest.mark.django_db
+class TestStatusRollups:
+    def test_rollup_is_incremental(self):
+        application = ApplicationFactory()
+        log_status_change(application)
+        update_application_status(application, Application.Status.REVIEWED)
+        age_events(minutes=5)
+
+        assert rollup_status_events() == 2
+        assert rollup_status_events() == 0
+
+        update_application_status(application, Application.Status.ACCEPTED)
+        age_events(minutes=1)
+        assert rollup_status_events() == 1
+
+        reviewed = ApplicationStatusRollup.objects.get(
+            status=Application.Status.REVIEWED
+        )
+        assert reviewed.entered == 1
+        assert reviewed.exited == 1
+
+    def test_recent_events_wait_for_the_next_run(self):
+        application = ApplicationFactory()
+        log_status_change(application)
+        assert rollup_status_events() == 0
+
+    def test_late_commits_below_the_watermark_are_rolled_up(self):
+        applications = ApplicationFactory.create_batch(3)
+        for application in applications:
+            log_status_change(application)
+        age_events(minutes=5)
+        # The middle event's transaction has not committed yet
+        in_flight = ApplicationStatusEvent.objects.order_by("id")[1]
+        in_flight_id = in_flight.id
+        in_flight.delete()
+
+        assert rollup_status_events() == 2
+        assert RollupWatermark.objects.get().last_event_id > in_flight_id
+
+        in_flight.id = in_flight_id
+        in_flight.save(force_insert=True)  # commits, below the watermark
+        assert rollup_status_events() == 1
+        assert rollup_status_events() == 0
+
+        applied = ApplicationStatusRollup.objects.filter(status=Application.Status.APPLIED)
+        assert sum(rollup.entered for rollup in applied) == 3
+        gaps = RollupWatermark.objects.get().gaps
+        assert not any(low <= in_flight_id <= high for low, high, _ in gaps)
+
+    def test_gaps_are_given_up_after_timeout(self):
+        applications = ApplicationFactory.create_batch(2)
+        for application in applications:
+            log_status_change(application)
+        age_events(minutes=5)
+        ApplicationStatusEvent.objects.order_by("id").first().delete()
+        rollup_status_events()
+
+        watermark = RollupWatermark.objects.get()
+        assert watermark.gaps
+        expired = (timezone.now() - GAP_TIMEOUT).timestamp() - 1
+        watermark.gaps = [[low, high, expired] for low, high, _ in watermark.gaps]
+        watermark.save()
+
+        log_status_change(ApplicationFactory())
+        age_events(minutes=5)
+        assert rollup_status_events() == 1
+        assert RollupWatermark.objects.get().gaps == []
+
+    def test_funnel_endpoint(self):
+        job = JobFactory()
+        applications = ApplicationFactory.create_batch(4, job=job)
+        for application in applications:
+            log_status_change(application)
+        for application in applications[:2]:
+            update_application_status(application, Application.Status.SHORTLISTED)
+        ApplicationStatusEvent.objects.filter(from_status="").update(
+            created_at=timezone.now() - timedelta(hours=3)
+        )
+        ApplicationStatusEvent.objects.exclude(from_status="").update(
+            created_at=timezone.now() - timedelta(hours=1)
+        )
+        rollup_status_events()
+
+        api_client = APIClient()
+        api_client.force_authenticate(user=job.created_by)
+        url = reverse("job-application-analytics", kwargs={"job_pk": job.pk})
+        response = api_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        funnel = {stage["status"]: stage for stage in response.data["funnel"]}
+        assert funnel["APPLIED"]["entered"] == 4
+        assert funnel["APPLIED"]["avg_seconds_in_status"] == 2 * 60 * 60
+        assert funnel["SHORTLISTED"]["entered"] == 2
+        assert funnel["SHORTLISTED"]["conversion"] == 0.5
+
+    def test_funnel_is_owner_only(self):
+        job = JobFactory()
+        api_client = APIClient()
+        api_client.force_authenticate(user=EmployerUserFactory())
+        url = reverse("job-application-analytics", kwargs={"job_pk": job.pk})
+        assert api_client.get(url).status_code == status.HTTP_403_FORBIDDEN
@@ -0,0 +1,134 @@
+from datetime import timedelta
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from accounts.tests.factories import EmployerUserFactory
+from applications.archive import archive_applications, archive_batch
+from applications.models import (
+    Application,
+    ApplicationStatusEvent,
+    ArchivedApplication,
+    ResumeBlob,
+)
+from applications.resumes import collect_orphaned_resumes, store_resume
+from applications.services import log_status_change, update_application_status
+from applications.tests.factories import ApplicationFactory
+from jobs.tests.factories import JobFactory
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+
+
+def age(*applications, days=400):
+    Application.objects.filter(pk__in=[a.pk for a in applications]).update(
+        updated_at=timezone.now() - timedelta(days=days)
+    )
+
+
+@pytest.mark.django_db
+class TestArchiveApplications:
+    def test_settled_applications_are_moved(self):
+        rejected = ApplicationFactory(status=Application.Status.REJECTED)
+        closed = ApplicationFactory(job=JobFactory(is_active=False))
+        active = ApplicationFactory()
+        recent = ApplicationFactory(status=Application.Status.WITHDRAWN)
+        age(rejected, closed, active)
+
+        assert archive_applications() == 2
+
+        assert set(Application.objects.values_list("pk", flat=True)) == {active.pk, recent.pk}
+        archived = ArchivedApplication.objects.get(pk=rejected.pk)
+        assert archived.applicant_id == rejected.applicant_id
+        assert archived.job_id == rejected.job_id
+        assert archived.status == Application.Status.REJECTED
+        assert archived.cover_letter == rejected.cover_letter
+        assert archived.resume.name == rejected.resume.name
+        assert ArchivedApplication.objects.filter(pk=closed.pk).exists()
+
+    def test_status_history_moves_with_the_application(self):
+        application = ApplicationFactory()
+        log_status_change(application)
+        update_application_status(application, Application.Status.REJECTED)
+        age(application)
+
+        archive_applications()
+
+        assert not ApplicationStatusEvent.objects.exists()
+        history = ArchivedApplication.objects.get(pk=application.pk).status_history
+        assert [(e["from_status"], e["to_status"]) for e in history] == [
+            ("", "APPLIED"),
+            ("APPLIED", "REJECTED"),
+        ]
+
+    def test_batches_are_bounded(self):
+        applications = ApplicationFactory.create_batch(3, status=Application.Status.WITHDRAWN)
+        age(*applications)
+
+        assert archive_batch(batch_size=2) == 2
+        assert archive_batch(batch_size=2) == 1
+        assert archive_batch(batch_size=2) == 0
+
+    def test_archived_resumes_are_kept(self):
+        blob = store_resume(SimpleUploadedFile("cv.pdf", b"%PDF resume"))
+        application = ApplicationFactory(
+            resume=blob.file.name, resume_blob=blob, status=Application.Status.REJECTED
+        )
+        age(application)
+        archive_applications()
+        ResumeBlob.objects.filter(pk=blob.pk).update(
+            updated_at=timezone.now() - timedelta(days=2)
+        )
+
+        assert collect_orphaned_resumes() == 0
+        blob.refresh_from_db()
+        assert blob.ref_count == 1
+
+        ArchivedApplication.objects.get().delete()
+        blob.refresh_from_db()
+        assert blob.ref_count == 0
+
+
+@pytest.mark.django_db
+class TestArchivedApplicationListView:
+    def test_job_owner_lists_archived_applications(self):
+        employer = EmployerUserFactory()
+        job = JobFactory(created_by=employer, is_active=False)
+        application = ApplicationFactory(job=job)
+        ApplicationFactory(job=JobFactory(is_active=False))
+        age(*Application.objects.all())
+        archive_applications()
+
+        api_client = APIClient()
+        api_client.force_authenticate(user=employer)
+        url = reverse("job-archived-application-list", kwargs={"job_pk": job.pk})
+        response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response.data["results"]] == [application.pk]
+        assert "resume" not in response.data["results"][0]
+
+    def test_applicant_lists_own_archived_applications(self):
+        application = ApplicationFactory(status=Application.Status.WITHDRAWN)
+        ApplicationFactory(status=Application.Status.WITHDRAWN)
+        age(*Application.objects.all())
+        archive_applications()
+
+        api_client = APIClient()
+        api_client.force_authenticate(user=application.applicant)
+        response = api_client.get(reverse("my-archived-application-list"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response.data["results"]] == [application.pk]
+
+    def test_other_employer_is_forbidden(self):
+        api_client = APIClient()
+        api_client.force_authenticate(user=EmployerUserFactory())
+        url = reverse("job-archived-application-list", kwargs={"job_pk": JobFactory().pk})
+        assert api_client.get(url).status_code == status.HTTP_403_FORBIDDEN
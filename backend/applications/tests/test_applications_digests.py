@@ -0,0 +1,96 @@
+from datetime import timedelta
+
+import pytest
+from django.core import mail
+from django.utils import timezone
+
+from accounts.models import User
+from accounts.tests.factories import EmployerUserFactory
+from applications import digests
+from applications.digests import SETTLE_DELAY, send_digests
+from applications.models import Application
+from applications.tests.factories import ApplicationFactory
+from jobs.tests.factories import JobFactory
+
+
+@pytest.fixture
+def no_settle_delay(monkeypatch):
+    monkeypatch.setattr(digests, "SETTLE_DELAY", timedelta(0))
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("no_settle_delay")
+class TestApplicationDigests:
+    def test_one_digest_per_employer(self, django_assert_num_queries):
+        employer = EmployerUserFactory(first_name="Ada")
+        backend, frontend = JobFactory.create_batch(2, created_by=employer)
+        ApplicationFactory.create_batch(2, job=backend)
+        ApplicationFactory(job=frontend)
+        ApplicationFactory(job=JobFactory(created_by=EmployerUserFactory()))
+        mail.outbox.clear()
+
+        # grouped counts, watermark update
+        with django_assert_num_queries(2):
+            assert send_digests(User.DigestFrequency.DAILY) == 2
+
+        assert len(mail.outbox) == 2
+        digest = next(m for m in mail.outbox if m.to == [employer.email])
+        assert digest.subject == "3 new applications in the last day"
+        assert f"- {backend.title}: 2\n- {frontend.title}: 1" in digest.body
+        employer.refresh_from_db()
+        assert employer.application_digest_sent_at is not None
+
+    def test_applications_are_only_included_once(self):
+        employer = EmployerUserFactory()
+        job = JobFactory(created_by=employer)
+        ApplicationFactory(job=job)
+        send_digests(User.DigestFrequency.DAILY)
+        mail.outbox.clear()
+
+        assert send_digests(User.DigestFrequency.DAILY) == 0
+
+        ApplicationFactory(job=job)
+        mail.outbox.clear()
+        assert send_digests(User.DigestFrequency.DAILY) == 1
+        assert mail.outbox[0].subject == "1 new application in the last day"
+
+    def test_only_employers_on_the_frequency_are_included(self):
+        hourly = EmployerUserFactory(application_digest=User.DigestFrequency.HOURLY)
+        never = EmployerUserFactory(application_digest=User.DigestFrequency.NEVER)
+        ApplicationFactory(job=JobFactory(created_by=hourly))
+        ApplicationFactory(job=JobFactory(created_by=never))
+        mail.outbox.clear()
+
+        assert send_digests(User.DigestFrequency.DAILY) == 0
+        assert send_digests(User.DigestFrequency.HOURLY) == 1
+        assert mail.outbox[0].to == [hourly.email]
+
+    def test_first_digest_covers_one_period(self):
+        employer = EmployerUserFactory(application_digest=User.DigestFrequency.HOURLY)
+        application = ApplicationFactory(job=JobFactory(created_by=employer))
+        Application.objects.filter(pk=application.pk).update(
+            created_at=timezone.now() - timedelta(hours=2)
+        )
+
+        assert send_digests(User.DigestFrequency.HOURLY) == 0
+
+
+@pytest.mark.django_db
+class TestDigestSettleDelay:
+    def test_recent_applications_wait_for_the_next_digest(self, monkeypatch):
+        employer = EmployerUserFactory()
+        job = JobFactory(created_by=employer)
+        settled = ApplicationFactory(job=job)
+        Application.objects.filter(pk=settled.pk).update(
+            created_at=timezone.now() - SETTLE_DELAY - timedelta(minutes=1)
+        )
+        ApplicationFactory(job=job)  # may not have committed yet
+        mail.outbox.clear()
+
+        assert send_digests(User.DigestFrequency.DAILY) == 1
+        assert mail.outbox[0].subject == "1 new application in the last day"
+
+        monkeypatch.setattr(digests, "SETTLE_DELAY", timedelta(0))
+        mail.outbox.clear()
+        assert send_digests(User.DigestFrequency.DAILY) == 1
+        assert mail.outbox[0].subject == "1 new application in the last day"
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from applications.matching import embed, score, score_job_applications
+from applications.models import Application
+from applications.tasks import rescore_job_applications
+from applications.tests.factories import ApplicationFactory
+from jobs.tests.factories import JobFactory
+
+
+class TestMatchScoring:
+    def test_embeddings_are_normalised(self):
+        rows, buckets, weights = embed(["Python and Django developer", ""])
+        assert np.isclose(np.linalg.norm(weights[rows == 0]), 1.0)
+        assert len(set(buckets)) == len(buckets)
+        assert not (rows == 1).any()
+
+    def test_relevant_candidates_score_higher(self):
+        job = JobFactory.build(
+            title="Backend Engineer",
+            description="Build REST APIs with Python, Django and PostgreSQL.",
+        )
+        scores = score(
+            job,
+            [
+                "Backend engineer shipping Django REST APIs on PostgreSQL.",
+                "Illustrator with a passion for watercolour and typography.",
+            ],
+        )
+        assert scores[0] > scores[1]
+        assert 0 <= scores[1] < scores[0] <= 1
+
+
+@pytest.mark.django_db
+class TestScoreJobApplications:
+    def test_all_applications_of_a_job_are_scored(self, monkeypatch):
+        monkeypatch.setattr("applications.matching.BATCH_SIZE", 2)
+        job = JobFactory(title="Data Engineer", description="Spark and Airflow pipelines")
+        strong = ApplicationFactory(
+            job=job, cover_letter="I build Spark and Airflow pipelines"
+        )
+        weak = ApplicationFactory(job=job, cover_letter="I bake bread")
+        other = ApplicationFactory(job=job, cover_letter="Data engineer")
+
+        assert score_job_applications(job) == 3
+        strong.refresh_from_db()
+        weak.refresh_from_db()
+        other.refresh_from_db()
+        assert strong.match_score > other.match_score > weak.match_score
+
+    def test_editing_a_job_rescores_its_applicants(self):
+        job = JobFactory(title="Chef", description="Cook pasta")
+        application = ApplicationFactory(job=job, cover_letter="Senior Go developer")
+        rescore_job_applications(job.pk)
+        application.refresh_from_db()
+        before = application.match_score
+
+        job.title = "Go developer"
+        job.description = "Senior Go developer for our platform team"
+        job.save()
+        rescore_job_applications(job.pk)
+        application.refresh_from_db()
+        assert application.match_score > before
+
+    def test_order_applicants_by_match_score(self):
+        job = JobFactory(title="Data Engineer", description="Spark and Airflow pipelines")
+        weak = ApplicationFactory(job=job, cover_letter="I bake bread")
+        strong = ApplicationFactory(job=job, cover_letter="Spark and Airflow pipelines")
+        unscored = ApplicationFactory(job=job)
+        score_job_applications(job, Application.objects.exclude(pk=unscored.pk))
+
+        api_client = APIClient()
+        api_client.force_authenticate(user=job.created_by)
+        url = reverse("job-application-list-create", kwargs={"job_pk": job.pk})
+        response = api_client.get(url, {"ordering": "-match_score"})
+        assert response.status_code == status.HTTP_200_OK
+        assert [app["id"] for app in response.data["results"]] == [strong.pk, weak.pk]
@@ -136,3 +136,17 @@ class TestIsJobOwnerPermission:
         request.user = employer
         permission = IsJobOwner()
         assert permission.has_object_permission(request, None, application) is False
+
+    def test_job_lookup_is_memoized_for_the_request(
+        self, request_factory, django_assert_num_queries
+    ):
+        employer = EmployerUserFactory()
+        job = JobFactory(created_by=employer)
+        application = ApplicationFactory(job=job)
+        request = request_factory.get("/")
+        request.user = employer
+        view = type("View", (object,), {"kwargs": {"job_pk": job.pk}})()
+        permission = (IsJobSeeker | IsJobOwner | IsAdmin)()
+        with django_assert_num_queries(1):
+            assert permission.has_permission(request, view) is True
+            assert permission.has_object_permission(request, view, application) is True
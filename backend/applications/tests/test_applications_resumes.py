@@ -0,0 +1,281 @@
+import hashlib
+import importlib
+import io
+import zipfile
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import clear_url_caches, reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from accounts.tests.factories import EmployerUserFactory, JobSeekerUserFactory
+from applications.models import Application, ResumeBlob
+from applications.extraction import extract_text
+from applications.resumes import collect_orphaned_resumes, store_resume
+from applications.tasks import extract_resume_text
+from applications.tests.factories import ApplicationFactory
+from job_board import urls as root_urls
+from jobs.tests.factories import JobFactory
+
+RESUME = b"%PDF-1.4 the same resume for every job"
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+
+
+@pytest.mark.django_db
+class TestResumeStorage:
+    def test_identical_resumes_share_one_blob(self):
+        first = store_resume(SimpleUploadedFile("cv.pdf", RESUME))
+        second = store_resume(SimpleUploadedFile("resume.PDF", RESUME))
+
+        assert first.pk == second.pk
+        assert second.ref_count == 2
+        assert first.sha256 == hashlib.sha256(RESUME).hexdigest()
+        assert first.file.name == f"resumes/{first.sha256[:2]}/{first.sha256}.pdf"
+        assert default_storage.exists(first.file.name)
+
+    def test_different_resumes_get_separate_blobs(self):
+        first = store_resume(SimpleUploadedFile("cv.pdf", RESUME))
+        second = store_resume(SimpleUploadedFile("cv.pdf", b"another resume"))
+        assert first.pk != second.pk
+
+    def test_applying_to_many_jobs_stores_the_resume_once(self):
+        api_client = APIClient()
+        api_client.force_authenticate(user=JobSeekerUserFactory())
+        for job in JobFactory.create_batch(2):
+            url = reverse("job-application-list-create", kwargs={"job_pk": job.pk})
+            data = {
+                "cover_letter": "My cover letter",
+                "resume": SimpleUploadedFile("cv.pdf", RESUME),
+            }
+            response = api_client.post(url, data, format="multipart")
+            assert response.status_code == status.HTTP_201_CREATED
+
+        blob = ResumeBlob.objects.get()
+        assert blob.ref_count == 2
+        assert set(Application.objects.values_list("resume", flat=True)) == {
+            blob.file.name
+        }
+
+    def test_rolled_back_application_discards_new_file(self):
+        job_seeker = JobSeekerUserFactory()
+        job = JobFactory()
+        ApplicationFactory(applicant=job_seeker, job=job)
+        api_client = APIClient()
+        api_client.force_authenticate(user=job_seeker)
+
+        url = reverse("job-application-list-create", kwargs={"job_pk": job.pk})
+        data = {"cover_letter": "Again", "resume": SimpleUploadedFile("cv.pdf", RESUME)}
+        response = api_client.post(url, data, format="multipart")
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+        digest = hashlib.sha256(RESUME).hexdigest()
+        assert not ResumeBlob.objects.filter(sha256=digest).exists()
+        assert not default_storage.exists(f"resumes/{digest[:2]}/{digest}.pdf")
+
+    def test_rolled_back_application_keeps_shared_file(self):
+        blob = store_resume(SimpleUploadedFile("cv.pdf", RESUME))
+        job_seeker = JobSeekerUserFactory()
+        job = JobFactory()
+        ApplicationFactory(applicant=job_seeker, job=job)
+        api_client = APIClient()
+        api_client.force_authenticate(user=job_seeker)
+
+        url = reverse("job-application-list-create", kwargs={"job_pk": job.pk})
+        data = {"cover_letter": "Again", "resume": SimpleUploadedFile("cv.pdf", RESUME)}
+        api_client.post(url, data, format="multipart")
+
+        assert default_storage.exists(blob.file.name)
+
+    def test_orphaned_blobs_are_collected(self, django_capture_on_commit_callbacks):
+        blob = store_resume(SimpleUploadedFile("cv.pdf", RESUME))
+        ResumeBlob.objects.filter(pk=blob.pk).update(
+            ref_count=0, updated_at=timezone.now() - timedelta(days=2)
+        )
+
+        with django_capture_on_commit_callbacks(execute=True):
+            assert collect_orphaned_resumes() == 1
+        assert not ResumeBlob.objects.exists()
+        assert not default_storage.exists(blob.file.name)
+
+    def test_referenced_blobs_are_kept(self):
+        blob = store_resume(SimpleUploadedFile("cv.pdf", RESUME))
+        ResumeBlob.objects.filter(pk=blob.pk).update(
+            updated_at=timezone.now() - timedelta(days=2)
+        )
+
+        assert collect_orphaned_resumes() == 0
+        assert ResumeBlob.objects.filter(pk=blob.pk).exists()
+
+
+@pytest.mark.django_db
+class TestJobResumesZipView:
+    def get(self, user, job):
+        api_client = APIClient()
+        api_client.force_authenticate(user=user)
+        url = reverse("job-application-resumes-zip", kwargs={"job_pk": job.pk})
+        return api_client.get(url)
+
+    def test_owner_downloads_all_resumes(self):
+        employer = EmployerUserFactory()
+        job = JobFactory(created_by=employer)
+        first = ApplicationFactory(job=job, resume=SimpleUploadedFile("a.pdf", RESUME))
+        second = ApplicationFactory(job=job, resume=SimpleUploadedFile("b.docx", b"docx"))
+        ApplicationFactory(job=job, status=Application.Status.WITHDRAWN)
+        ApplicationFactory()
+
+        response = self.get(employer, job)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        assert response["Content-Type"] == "application/zip"
+        archive = zipfile.ZipFile(io.BytesIO(b"".join(response.streaming_content)))
+        assert archive.testzip() is None
+        assert sorted(archive.namelist()) == [
+            f"{first.pk}-{first.applicant.username}.pdf",
+            f"{second.pk}-{second.applicant.username}.docx",
+        ]
+        assert archive.read(f"{first.pk}-{first.applicant.username}.pdf") == RESUME
+
+    def test_missing_files_are_skipped(self):
+        employer = EmployerUserFactory()
+        job = JobFactory(created_by=employer)
+        kept = ApplicationFactory(job=job)
+        lost = ApplicationFactory(job=job)
+        default_storage.delete(lost.resume.name)
+
+        response = self.get(employer, job)
+
+        archive = zipfile.ZipFile(io.BytesIO(b"".join(response.streaming_content)))
+        assert archive.namelist() == [f"{kept.pk}-{kept.applicant.username}.pdf"]
+
+    def test_other_employer_is_forbidden(self):
+        job = JobFactory()
+        response = self.get(EmployerUserFactory(), job)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def make_docx(*paragraphs):
+    namespace = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+    body = "".join(f"<w:p><w:r><w:t>{text}</w:t></w:r></w:p>" for text in paragraphs)
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr(
+            "word/document.xml",
+            f'<w:document xmlns:w="{namespace}"><w:body>{body}</w:body></w:document>',
+        )
+    return buffer.getvalue()
+
+
+class TestResumeTextExtraction:
+    def test_extract_txt(self):
+        text = extract_text(io.BytesIO(b"Senior  Python\n\ndeveloper"), "cv.txt")
+        assert text == "Senior Python developer"
+
+    def test_extract_docx(self):
+        docx = make_docx("Jane Doe", "Django and PostgreSQL")
+        assert extract_text(io.BytesIO(docx), "cv.docx") == "Jane Doe Django and PostgreSQL"
+
+
+@pytest.mark.django_db
+class TestExtractResumeTextTask:
+    def test_text_is_stored_on_the_blob(self):
+        blob = store_resume(SimpleUploadedFile("cv.txt", b"Experienced data engineer"))
+        extract_resume_text(blob.pk)
+        blob.refresh_from_db()
+        assert blob.text_status == ResumeBlob.TextStatus.EXTRACTED
+        assert blob.text == "Experienced data engineer"
+
+    def test_blob_is_parsed_only_once(self):
+        blob = store_resume(SimpleUploadedFile("cv.txt", b"Experienced data engineer"))
+        extract_resume_text(blob.pk)
+        store_resume(SimpleUploadedFile("again.txt", b"Experienced data engineer"))
+        with mock.patch("applications.tasks.extract_text") as extract:
+            extract_resume_text(blob.pk)
+        extract.assert_not_called()
+
+    def test_unsupported_format_is_skipped(self):
+        blob = store_resume(SimpleUploadedFile("cv.odt", b"binary"))
+        extract_resume_text(blob.pk)
+        blob.refresh_from_db()
+        assert blob.text_status == ResumeBlob.TextStatus.SKIPPED
+
+    def test_oversized_resume_is_skipped(self):
+        blob = store_resume(SimpleUploadedFile("cv.txt", b"Experienced data engineer"))
+        with mock.patch("applications.tasks.MAX_RESUME_SIZE", 4):
+            extract_resume_text(blob.pk)
+        blob.refresh_from_db()
+        assert blob.text_status == ResumeBlob.TextStatus.SKIPPED
+        assert blob.text == ""
+
+
+@pytest.mark.django_db
+class TestApplicationResumeDownloadView:
+    def get(self, user, application):
+        api_client = APIClient()
+        api_client.force_authenticate(user=user)
+        url = reverse("application-resume-download", kwargs={"pk": application.pk})
+        return api_client.get(url)
+
+    def test_applicant_downloads_resume(self):
+        application = ApplicationFactory(resume=SimpleUploadedFile("cv.pdf", RESUME))
+
+        response = self.get(application.applicant, application)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert b"".join(response.streaming_content) == RESUME
+        assert response["Content-Type"] == "application/pdf"
+        assert response["Content-Disposition"] == (
+            f'attachment; filename="application-{application.pk}.pdf"'
+        )
+
+    def test_job_owner_download_is_offloaded_to_nginx(self, settings):
+        settings.MEDIA_SENDFILE_BACKEND = "nginx"
+        employer = EmployerUserFactory()
+        application = ApplicationFactory(job=JobFactory(created_by=employer))
+
+        response = self.get(employer, application)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.content == b""
+        assert response["X-Accel-Redirect"] == f"/protected-media/{application.resume.name}"
+
+    def test_apache_receives_the_file_path(self, settings):
+        settings.MEDIA_SENDFILE_BACKEND = "apache"
+        application = ApplicationFactory()
+
+        response = self.get(application.applicant, application)
+
+        assert response["X-Sendfile"] == application.resume.path
+
+    def test_other_users_are_forbidden(self):
+        application = ApplicationFactory()
+        for user in (JobSeekerUserFactory(), EmployerUserFactory()):
+            response = self.get(user, application)
+            assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_missing_file_returns_404(self):
+        application = ApplicationFactory()
+        default_storage.delete(application.resume.name)
+
+        response = self.get(application.applicant, application)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_media_url_does_not_serve_resumes(self, client, settings):
+        settings.DEBUG = True
+        importlib.reload(root_urls)
+        clear_url_caches()
+        application = ApplicationFactory()
+
+        response = client.get(f"{settings.MEDIA_URL}{application.resume.name}")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
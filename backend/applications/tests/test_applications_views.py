@@ -1,8 +1,13 @@
+from datetime import timedelta
+
 import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APIClient
 from django.urls import reverse
-from applications.models import Application
+from applications.models import Application, ResumeBlob
+from applications.search import cover_letter_vector, refresh_resume_search_vectors
 from accounts.tests.factories import JobSeekerUserFactory, EmployerUserFactory, AdminUserFactory
 from jobs.tests.factories import JobFactory
 from applications.tests.factories import ApplicationFactory
@@ -147,4 +152,243 @@ class TestApplicationDetailView:
         response = api_client.patch(url, data, format="json")
         assert response.status_code == status.HTTP_200_OK
         application.refresh_from_db()
-        assert application.status == Application.Status.ACCEPTED
\ No newline at end of file
+        assert application.status == Application.Status.ACCEPTED
+
+
+@pytest.mark.django_db
+class TestJobApplicationReviewQueue:
+    def test_applications_are_cursor_paginated(self, authenticated_employer):
+        api_client, employer = authenticated_employer
+        job = JobFactory(created_by=employer)
+        ApplicationFactory.create_batch(3, job=job)
+        url = reverse("job-application-list-create", kwargs={"job_pk": job.pk})
+        response = api_client.get(url, {"page_size": 2})
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["results"]) == 2
+        assert "cursor=" in response.data["next"]
+
+        response = api_client.get(response.data["next"])
+        assert len(response.data["results"]) == 1
+        assert response.data["next"] is None
+
+    def test_filter_by_status(self, authenticated_employer):
+        api_client, employer = authenticated_employer
+        job = JobFactory(created_by=employer)
+        ApplicationFactory.create_batch(2, job=job)
+        shortlisted = ApplicationFactory(job=job, status=Application.Status.SHORTLISTED)
+        url = reverse("job-application-list-create", kwargs={"job_pk": job.pk})
+        response = api_client.get(url, {"status": Application.Status.SHORTLISTED})
+        assert response.status_code == status.HTTP_200_OK
+        assert [app["id"] for app in response.data["results"]] == [shortlisted.pk]
+
+    def test_filter_by_created_range(self, authenticated_employer):
+        api_client, employer = authenticated_employer
+        job = JobFactory(created_by=employer)
+        old = ApplicationFactory(job=job)
+        recent = ApplicationFactory(job=job)
+        Application.objects.filter(pk=old.pk).update(
+            created_at=timezone.now() - timedelta(days=10)
+        )
+        url = reverse("job-application-list-create", kwargs={"job_pk": job.pk})
+        since = (timezone.now() - timedelta(days=1)).isoformat()
+        response = api_client.get(url, {"created_after": since})
+        assert response.status_code == status.HTTP_200_OK
+        assert [app["id"] for app in response.data["results"]] == [recent.pk]
+
+    def test_ordering_by_reviewed_at_lists_reviewed_only(self, authenticated_employer):
+        api_client, employer = authenticated_employer
+        job = JobFactory(created_by=employer)
+        ApplicationFactory(job=job)
+        first = ApplicationFactory(job=job, reviewed_at=timezone.now() - timedelta(hours=2))
+        second = ApplicationFactory(job=job, reviewed_at=timezone.now())
+        url = reverse("job-application-list-create", kwargs={"job_pk": job.pk})
+        response = api_client.get(url, {"ordering": "reviewed_at"})
+        assert response.status_code == status.HTTP_200_OK
+        assert [app["id"] for app in response.data["results"]] == [first.pk, second.pk]
+
+
+@pytest.mark.django_db
+class TestApplicationBulkStatusUpdateView:
+    url = reverse("application-bulk-status")
+
+    def test_employer_can_bulk_update_their_applications(self, authenticated_employer):
+        api_client, employer = authenticated_employer
+        job = JobFactory(created_by=employer)
+        applications = ApplicationFactory.create_batch(3, job=job)
+        ids = [application.pk for application in applications]
+        data = {"application_ids": ids, "status": Application.Status.SHORTLISTED}
+        response = api_client.post(self.url, data, format="json")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["updated"] == sorted(ids)
+        assert response.data["skipped"] == []
+        for application in applications:
+            application.refresh_from_db()
+            assert application.status == Application.Status.SHORTLISTED
+            assert application.reviewed_at is not None
+
+    def test_withdrawn_applications_are_skipped(self, authenticated_employer):
+        api_client, employer = authenticated_employer
+        job = JobFactory(created_by=employer)
+        applied = ApplicationFactory(job=job)
+        withdrawn = ApplicationFactory(job=job, status=Application.Status.WITHDRAWN)
+        data = {
+            "application_ids": [applied.pk, withdrawn.pk],
+            "status": Application.Status.REJECTED,
+        }
+        response = api_client.post(self.url, data, format="json")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["updated"] == [applied.pk]
+        assert response.data["skipped"] == [withdrawn.pk]
+        withdrawn.refresh_from_db()
+        assert withdrawn.status == Application.Status.WITHDRAWN
+
+    def test_batch_with_foreign_application_is_rejected(self, authenticated_employer):
+        api_client, employer = authenticated_employer
+        own = ApplicationFactory(job=JobFactory(created_by=employer))
+        foreign = ApplicationFactory()  # Job created by another employer
+        data = {
+            "application_ids": [own.pk, foreign.pk],
+            "status": Application.Status.REJECTED,
+        }
+        response = api_client.post(self.url, data, format="json")
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        own.refresh_from_db()
+        assert own.status == Application.Status.APPLIED
+
+    def test_withdrawn_is_not_a_valid_target_status(self, authenticated_employer):
+        api_client, employer = authenticated_employer
+        application = ApplicationFactory(job=JobFactory(created_by=employer))
+        data = {
+            "application_ids": [application.pk],
+            "status": Application.Status.WITHDRAWN,
+        }
+        response = api_client.post(self.url, data, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_job_seeker_cannot_bulk_update(self, authenticated_job_seeker):
+        api_client, job_seeker = authenticated_job_seeker
+        application = ApplicationFactory(applicant=job_seeker)
+        data = {
+            "application_ids": [application.pk],
+            "status": Application.Status.ACCEPTED,
+        }
+        response = api_client.post(self.url, data, format="json")
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+class TestApplicationSubmission:
+    def apply(self, api_client, job, **extra):
+        url = reverse("job-application-list-create", kwargs={"job_pk": job.pk})
+        data = {
+            "cover_letter": "My cover letter",
+            "resume": SimpleUploadedFile("resume.pdf", b"%PDF-1.4 resume"),
+        }
+        return api_client.post(url, data, format="multipart", **extra)
+
+    def test_response_links_resume_download(self, authenticated_job_seeker):
+        api_client, _ = authenticated_job_seeker
+        response = self.apply(api_client, JobFactory())
+
+        assert response.status_code == status.HTTP_201_CREATED
+        url = reverse("application-resume-download", kwargs={"pk": response.data["id"]})
+        assert response.data["resume"] == f"http://testserver{url}"
+
+    def test_duplicate_application_returns_conflict(self, authenticated_job_seeker):
+        api_client, job_seeker = authenticated_job_seeker
+        job = JobFactory()
+        ApplicationFactory(applicant=job_seeker, job=job)
+        response = self.apply(api_client, job)
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert Application.objects.filter(applicant=job_seeker, job=job).count() == 1
+
+    # The foreign key is checked when the insert commits, so this test must not
+    # run inside the per-test transaction.
+    @pytest.mark.django_db(transaction=True)
+    def test_missing_job_returns_not_found(self, authenticated_job_seeker):
+        api_client, _ = authenticated_job_seeker
+        job = JobFactory()
+        job_pk = job.pk
+        job.delete()
+        url = reverse("job-application-list-create", kwargs={"job_pk": job_pk})
+        data = {
+            "cover_letter": "My cover letter",
+            "resume": SimpleUploadedFile("resume.pdf", b"%PDF-1.4 resume"),
+        }
+        response = api_client.post(url, data, format="multipart")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_retry_with_idempotency_key_returns_original_response(
+        self, authenticated_job_seeker
+    ):
+        api_client, job_seeker = authenticated_job_seeker
+        job = JobFactory()
+        first = self.apply(api_client, job, HTTP_IDEMPOTENCY_KEY="apply-1")
+        assert first.status_code == status.HTTP_201_CREATED
+
+        retry = self.apply(api_client, job, HTTP_IDEMPOTENCY_KEY="apply-1")
+        assert retry.status_code == status.HTTP_201_CREATED
+        assert retry.data == first.data
+        assert Application.objects.filter(applicant=job_seeker, job=job).count() == 1
+
+    def test_retry_without_idempotency_key_conflicts(self, authenticated_job_seeker):
+        api_client, _ = authenticated_job_seeker
+        job = JobFactory()
+        assert self.apply(api_client, job).status_code == status.HTTP_201_CREATED
+        assert self.apply(api_client, job).status_code == status.HTTP_409_CONFLICT
+
+
+@pytest.mark.django_db
+class TestApplicationSearch:
+    def test_search_cover_letters_and_resume_text(self, authenticated_employer):
+        api_client, employer = authenticated_employer
+        job = JobFactory(created_by=employer)
+        by_letter = ApplicationFactory(job=job, cover_letter="I love building Django APIs.")
+        by_resume = ApplicationFactory(job=job, cover_letter="Please consider me.")
+        ApplicationFactory(job=job, cover_letter="I am a graphic designer.")
+        Application.objects.filter(job=job).update(search_vector=cover_letter_vector())
+        blob = ResumeBlob.objects.create(
+            sha256="0" * 64,
+            file="resumes/cv.txt",
+            size=1,
+            ref_count=1,
+            text="Five years of Django development",
+        )
+        Application.objects.filter(pk=by_resume.pk).update(resume_blob=blob)
+        refresh_resume_search_vectors(blob)
+
+        url = reverse("job-application-list-create", kwargs={"job_pk": job.pk})
+        response = api_client.get(url, {"q": "django"})
+        assert response.status_code == status.HTTP_200_OK
+        results = response.data["results"]
+        # Cover letter matches (weight A) outrank resume matches (weight B).
+        assert [app["id"] for app in results] == [by_letter.pk, by_resume.pk]
+        assert "<b>Django</b>" in results[0]["snippet"]
+        assert results[0]["rank"] > results[1]["rank"]
+
+    def test_search_pages_by_rank(self, authenticated_employer):
+        api_client, employer = authenticated_employer
+        job = JobFactory(created_by=employer)
+        for repeat in range(1, 4):
+            ApplicationFactory(job=job, cover_letter=" ".join(["python"] * repeat))
+        Application.objects.filter(job=job).update(search_vector=cover_letter_vector())
+        url = reverse("job-application-list-create", kwargs={"job_pk": job.pk})
+
+        response = api_client.get(url, {"q": "python", "page_size": 2})
+        ids = [app["id"] for app in response.data["results"]]
+        response = api_client.get(response.data["next"])
+        ids += [app["id"] for app in response.data["results"]]
+        assert len(set(ids)) == 3
+        assert response.data["next"] is None
+
+    def test_applying_indexes_the_cover_letter(self, authenticated_job_seeker):
+        api_client, job_seeker = authenticated_job_seeker
+        job = JobFactory()
+        url = reverse("job-application-list-create", kwargs={"job_pk": job.pk})
+        data = {
+            "cover_letter": "Experienced Kubernetes operator",
+            "resume": SimpleUploadedFile("resume.pdf", b"%PDF-1.4 resume"),
+        }
+        response = api_client.post(url, data, format="multipart")
+        assert response.status_code == status.HTTP_201_CREATED
+        assert Application.objects.filter(search_vector="kubernetes").exists()
@@ -1,7 +1,10 @@
 from django.urls import path
 
 from .views import (
+    ApplicationBulkStatusUpdateView,
     ApplicationDetailView,
+    ApplicationResumeDownloadView,
+    ArchivedApplicationListView,
     MyApplicationListView,
 )
 
@@ -11,9 +14,24 @@ urlpatterns = [
         MyApplicationListView.as_view(),
         name="my-application-list",
     ),
+    path(
+        "my-applications/archived/",
+        ArchivedApplicationListView.as_view(),
+        name="my-archived-application-list",
+    ),
+    path(
+        "bulk-status/",
+        ApplicationBulkStatusUpdateView.as_view(),
+        name="application-bulk-status",
+    ),
     path(
         "<int:pk>/",
         ApplicationDetailView.as_view(),
         name="application-detail",
     ),
+    path(
+        "<int:pk>/resume/",
+        ApplicationResumeDownloadView.as_view(),
+        name="application-resume-download",
+    ),
 ]
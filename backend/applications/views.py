@@ -1,13 +1,38 @@
-from drf_spectacular.utils import extend_schema
-from rest_framework import generics
+import os
+
+from django.db import IntegrityError, transaction
+from django.http import StreamingHttpResponse
+from django_filters.rest_framework import DjangoFilterBackend
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework import filters, generics, status
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from core.throttling import ApplyThrottle
 
-from .models import Application
-from .permissions import IsAdmin, IsApplicantOwner, IsJobOwner, IsJobSeeker
+from .analytics import job_funnel
+from .exceptions import ApplicationConflict
+from .filters import ApplicationFilter, ApplicationSearchFilter
+from .models import Application, ArchivedApplication
+from .pagination import ApplicationCursorPagination
+from .permissions import IsAdmin, IsApplicantOwner, IsEmployer, IsJobOwner, IsJobSeeker
+from .resumes import discard_resumes_on_error, resume_response, stream_resumes_zip
 from .serializers import (
+    ApplicationAnalyticsQuerySerializer,
+    ApplicationBulkStatusUpdateSerializer,
     ApplicationCreateSerializer,
     ApplicationReadSerializer,
+    ApplicationSearchResultSerializer,
     ApplicationStatusUpdateSerializer,
+    ArchivedApplicationSerializer,
+)
+from .services import (
+    bulk_update_application_status,
+    get_idempotent_response,
+    set_idempotent_response,
+    update_application_status,
+    withdraw_application,
 )
 
 
@@ -22,22 +47,67 @@ This endpoint is nested under a specific job: `/api/v1/jobs/{job_pk}/application
 - **Access:**
   - **Job Seeker:** Can see only their own application for this job.
   - **Job Owner/Admin:** Can see all applications for this job.
-- **Response:** List of application objects.
+- **Filtering:**
+  - `status`
+  - `created_after` / `created_before` (ISO 8601 datetimes)
+- **Search:**
+  - `q` – full-text search over cover letters and resume text (web search syntax, e.g. `django -php "data engineer"`)
+  - Results include a relevance `rank` and a highlighted `snippet`, and are ordered by relevance by default.
+- **Ordering:**
+  - `created_at` (default: newest first)
+  - `reviewed_at` (only reviewed applications are listed)
+  - `match_score` – fit between the applicant and the job posting, e.g. `?ordering=-match_score` (only scored applications are listed; scores are computed shortly after applying)
+- **Pagination:** Cursor based; follow the `next` / `previous` links.
+- **Response:** Paginated list of application objects.
 
 ### POST
 - **Purpose:** Submit a new application for the specified job.
 - **Access:** Authenticated Job Seeker only.
-- **Behavior:** Automatically assigns the authenticated user as the applicant.
+- **Behavior:**
+  - Automatically assigns the authenticated user as the applicant.
+  - Applying twice to the same job returns `409 Conflict`.
+  - Send an `Idempotency-Key` header to make retries safe: a repeated request with the same key returns the original response for 10 minutes.
+  - Submissions are rate limited per user (`429` with `Retry-After`).
 - **Response:** Newly created application object.
 """,
+    parameters=[
+        OpenApiParameter(
+            name="Idempotency-Key",
+            location=OpenApiParameter.HEADER,
+            required=False,
+            description="Client-generated key identifying a single application submission.",
+        )
+    ],
 )
 class JobApplicationListCreateView(generics.ListCreateAPIView):
+    pagination_class = ApplicationCursorPagination
+    filter_backends = [
+        DjangoFilterBackend,
+        ApplicationSearchFilter,
+        filters.OrderingFilter,
+    ]
+    filterset_class = ApplicationFilter
+    ordering_fields = ["created_at", "reviewed_at", "match_score"]
+
+    @property
+    def is_search(self):
+        return bool(self.request.query_params.get("q", "").strip())
+
+    @property
+    def ordering(self):
+        # Search results are ranked by relevance unless asked otherwise.
+        if self.is_search:
+            return ["-rank"]
+        return ["-created_at"]
+
     def get_queryset(self):
         job_pk = self.kwargs.get("job_pk")
         user = self.request.user
 
         # Base queryset for the specified job
-        queryset = Application.objects.filter(job_id=job_pk)
+        queryset = Application.objects.filter(job_id=job_pk).select_related(
+            "applicant", "job"
+        )
 
         # If the user is a job seeker, only show their own application
         if user.is_authenticated and user.is_job_seeker():
@@ -46,11 +116,26 @@ class JobApplicationListCreateView(generics.ListCreateAPIView):
         # For employers or admins, return all applications for the job (permission class handles access)
         return queryset
 
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+
+        # Cursors cannot be positioned on NULL values, so ordering by review
+        # date or match score only lists reviewed or scored applications.
+        ordering = self.request.query_params.get("ordering", "")
+        for field in ("reviewed_at", "match_score"):
+            if field in ordering:
+                queryset = queryset.filter(**{f"{field}__isnull": False})
+        return queryset
+
     def get_serializer_class(self):
         if self.request.method == "POST":
             return ApplicationCreateSerializer
+        if self.is_search:
+            return ApplicationSearchResultSerializer
         return ApplicationReadSerializer
 
+    throttle_classes = [ApplyThrottle]
+
     def get_permissions(self):
         if self.request.method == "POST":
             # Only job seekers can apply
@@ -63,8 +148,44 @@ class JobApplicationListCreateView(generics.ListCreateAPIView):
             ]
         return super().get_permissions()
 
+    def create(self, request, *args, **kwargs):
+        job_pk = self.kwargs.get("job_pk")
+        idempotency_key = request.headers.get("Idempotency-Key")
+        if not idempotency_key:
+            return super().create(request, *args, **kwargs)
+
+        cached = get_idempotent_response(request.user.pk, job_pk, idempotency_key)
+        if cached is None:
+            try:
+                response = super().create(request, *args, **kwargs)
+            except ApplicationConflict:
+                # A concurrent retry with the same key may have won the insert.
+                cached = get_idempotent_response(
+                    request.user.pk, job_pk, idempotency_key
+                )
+                if cached is None:
+                    raise
+            else:
+                set_idempotent_response(
+                    request.user.pk, job_pk, idempotency_key, dict(response.data)
+                )
+                return response
+
+        return Response(cached, status=status.HTTP_201_CREATED)
+
     def perform_create(self, serializer):
-        serializer.save(applicant=self.request.user, job_id=self.kwargs.get("job_pk"))
+        job_pk = self.kwargs.get("job_pk")
+        try:
+            # A single INSERT: the (applicant, job) unique constraint rejects
+            # duplicates, including concurrent submissions.
+            with discard_resumes_on_error(), transaction.atomic():
+                serializer.save(applicant=self.request.user, job_id=job_pk)
+        except IntegrityError:
+            if Application.objects.filter(
+                applicant=self.request.user, job_id=job_pk
+            ).exists():
+                raise ApplicationConflict()
+            raise NotFound("Job not found.")
 
 
 @extend_schema(
@@ -109,7 +230,7 @@ class MyApplicationListView(generics.ListAPIView):
 **DELETE**
 - **Purpose:** Withdraw an application (soft delete).
 - **Access:** Applicant only.
-- **Behavior:** Marks the application status as `WITHDRAWN` instead of deleting the record.
+- **Behavior:** Marks the application status as `WITHDRAWN` instead of deleting the record. Only `APPLIED` applications can be withdrawn.
 - **Response:** Updated application object with `WITHDRAWN` status.
 """,
 )
@@ -133,7 +254,187 @@ class ApplicationDetailView(generics.RetrieveUpdateDestroyAPIView):
             ]
         return super().get_permissions()
 
+    def perform_update(self, serializer):
+        # Status changes go through the service so the transition is logged
+        new_status = serializer.validated_data.get("status")
+        if new_status is None:
+            return
+        try:
+            update_application_status(serializer.instance, new_status)
+        except ValueError as e:
+            raise ValidationError(str(e))
+
     def perform_destroy(self, instance):
         # Instead of deleting, we mark as withdrawn
-        instance.status = Application.Status.WITHDRAWN
-        instance.save()
+        try:
+            withdraw_application(instance)
+        except ValueError as e:
+            raise ValidationError(str(e))
+
+
+@extend_schema(
+    tags=["Applications"],
+    summary="Bulk Update Application Statuses",
+    description="""
+### POST /api/v1/applications/bulk-status/
+
+- **Purpose:** Move many applications to the same status in one request (e.g. shortlist or reject a batch of candidates).
+- **Access:** Job Owner or Admin. Every application in the batch must belong to one of the employer's jobs, otherwise nothing is updated.
+- **Behavior:**
+  - Ownership of the whole batch is validated with a single query.
+  - Withdrawn applications are left untouched and reported as `skipped`.
+  - Sets `reviewed_at` on updated applications and notifies their applicants.
+- **Response:** The target status with the `updated` and `skipped` application ids.
+""",
+    responses={200: {"description": "Statuses updated"}},
+)
+class ApplicationBulkStatusUpdateView(generics.GenericAPIView):
+    serializer_class = ApplicationBulkStatusUpdateSerializer
+    permission_classes = [IsAuthenticated, IsEmployer | IsAdmin]
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        new_status = serializer.validated_data["status"]
+        updated, skipped = bulk_update_application_status(
+            request.user,
+            serializer.validated_data["application_ids"],
+            new_status,
+        )
+        return Response({"status": new_status, "updated": updated, "skipped": skipped})
+
+
+@extend_schema(
+    tags=["Applications"],
+    summary="Application Funnel Analytics for a Job",
+    description="""
+### GET /api/v1/jobs/{job_pk}/applications/analytics/
+
+- **Purpose:** Conversion funnel and time spent in each stage for a job's applications.
+- **Access:** Job Owner or Admin.
+- **Filtering:** `since` / `until` (dates, inclusive).
+- **Response:** For each status: applications that `entered` it, `conversion` relative to `APPLIED`, and `avg_seconds_in_status` for applications that have left it.
+- **Behavior:** Read from daily rollups refreshed every few minutes, so the latest transitions may not be included yet.
+""",
+    parameters=[ApplicationAnalyticsQuerySerializer],
+)
+class JobApplicationAnalyticsView(generics.GenericAPIView):
+    permission_classes = [IsAuthenticated, IsJobOwner | IsAdmin]
+
+    def get(self, request, *args, **kwargs):
+        query = ApplicationAnalyticsQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+
+        job_pk = self.kwargs["job_pk"]
+        return Response(
+            {
+                "job": job_pk,
+                "funnel": job_funnel(
+                    job_pk,
+                    since=query.validated_data.get("since"),
+                    until=query.validated_data.get("until"),
+                ),
+            }
+        )
+
+
+@extend_schema(
+    tags=["Applications"],
+    summary="Download an Application's Resume",
+    description="""
+### GET /api/v1/applications/{id}/resume/
+
+- **Purpose:** Download the resume attached to an application.
+- **Access:** The applicant, the Job Owner, or an Admin.
+- **Response:** The resume file as an attachment, named `application-<id><ext>`.
+- **Behavior:** After the access check the transfer is handed to the front proxy (`X-Accel-Redirect` / `X-Sendfile`) when one is configured.
+""",
+    responses={(200, "application/octet-stream"): bytes},
+)
+class ApplicationResumeDownloadView(generics.GenericAPIView):
+    queryset = Application.objects.only("id", "resume", "applicant_id", "job_id")
+    permission_classes = [IsAuthenticated, IsApplicantOwner | IsJobOwner | IsAdmin]
+
+    def get(self, request, *args, **kwargs):
+        application = self.get_object()
+        if not application.resume:
+            raise NotFound("This application has no resume.")
+
+        filename = f"application-{application.pk}{os.path.splitext(application.resume.name)[1]}"
+        try:
+            return resume_response(application.resume, filename)
+        except FileNotFoundError:
+            raise NotFound("The resume file is missing.")
+
+
+@extend_schema(
+    tags=["Applications"],
+    summary="Download All Resumes for a Job",
+    description="""
+### GET /api/v1/jobs/{job_pk}/applications/resumes.zip
+
+- **Purpose:** Download the resumes of every active application for a job as one ZIP archive.
+- **Access:** Job Owner or Admin.
+- **Response:** `application/zip`, streamed as it is built. Entries are named `<application id>-<applicant username><ext>`.
+- **Behavior:** Withdrawn applications are left out. The archive has no `Content-Length`, so clients should not expect a progress total.
+""",
+    responses={(200, "application/zip"): bytes},
+)
+class JobApplicationResumesZipView(generics.GenericAPIView):
+    permission_classes = [IsAuthenticated, IsJobOwner | IsAdmin]
+
+    def get(self, request, *args, **kwargs):
+        job_pk = self.kwargs["job_pk"]
+        applications = (
+            Application.objects.filter(job_id=job_pk)
+            .exclude(status=Application.Status.WITHDRAWN)
+            .select_related("applicant")
+            .only("id", "resume", "applicant__username")
+            .order_by("id")
+        )
+        entries = (
+            (
+                f"{application.pk}-{application.applicant.username}"
+                f"{os.path.splitext(application.resume.name)[1]}",
+                application.resume,
+            )
+            for application in applications.iterator(chunk_size=500)
+            if application.resume
+        )
+
+        response = StreamingHttpResponse(stream_resumes_zip(entries), content_type="application/zip")
+        response["Content-Disposition"] = f'attachment; filename="job-{job_pk}-resumes.zip"'
+        return response
+
+
+@extend_schema(
+    tags=["Applications"],
+    summary="List Archived Applications",
+    description="""
+### GET /api/v1/applications/my-applications/archived/
+- **Access:** Job Seeker; lists their own archived applications.
+
+### GET /api/v1/jobs/{job_pk}/applications/archived/
+- **Access:** Job Owner or Admin; lists the job's archived applications.
+
+- **Purpose:** Read-only access to applications moved to cold storage. Withdrawn and rejected applications, and all applications of closed jobs, are archived a year after their last change.
+- **Response:** Paginated (cursor) list including each application's `status_history`, newest first.
+""",
+)
+class ArchivedApplicationListView(generics.ListAPIView):
+    serializer_class = ArchivedApplicationSerializer
+    pagination_class = ApplicationCursorPagination
+
+    def get_permissions(self):
+        if "job_pk" in self.kwargs:
+            self.permission_classes = [IsAuthenticated, IsJobOwner | IsAdmin]
+        else:
+            self.permission_classes = [IsAuthenticated, IsJobSeeker]
+        return super().get_permissions()
+
+    def get_queryset(self):
+        queryset = ArchivedApplication.objects.select_related("applicant", "job")
+        if "job_pk" in self.kwargs:
+            return queryset.filter(job_id=self.kwargs["job_pk"])
+        return queryset.filter(applicant=self.request.user)
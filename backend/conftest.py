@@ -0,0 +1,8 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def memory_stores(settings):
+    # Fresh in-process throttle buckets and token blacklist for every test
+    settings.THROTTLE_URL = "memory://"
+    settings.TOKEN_BLACKLIST_URL = "memory://"
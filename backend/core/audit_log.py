@@ -0,0 +1,111 @@
+"""
+Non-blocking structured audit logging.
+
+RequestAuditMiddleware logs one record per request. Writing it to the sink
+on the request thread would add the sink's latency to every response, so
+AuditQueueHandler only puts the record on a bounded in-memory queue and a
+QueueListener thread formats and writes it. When the sink falls behind and
+the queue fills up, records are dropped rather than waited for; the running
+drop count is included in the records that do get written.
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import sys
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
+MAX_QUEUED_RECORDS = 10000
+STOP_TIMEOUT = 5  # seconds to wait for room for the stop sentinel
+
+
+class AuditFormatter(logging.Formatter):
+    """
+    Render a record and its `audit` fields as one JSON object per line.
+    """
+
+    def format(self, record):
+        payload = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            **getattr(record, "audit", {}),
+        }
+        if getattr(record, "dropped", 0):
+            payload["dropped"] = record.dropped
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str)
+
+
+class AuditQueueListener(QueueListener):
+    def enqueue_sentinel(self):
+        # Unlike records, the stop sentinel waits for room in a full queue
+        self.queue.put(self._sentinel, timeout=STOP_TIMEOUT)
+
+
+class AuditQueueHandler(QueueHandler):
+    """
+    Hand records to a background thread writing them to `target` (JSON lines
+    on stderr by default), dropping them when `maxsize` are already queued.
+    """
+
+    def __init__(self, maxsize=MAX_QUEUED_RECORDS, target=None):
+        super().__init__(queue.Queue(maxsize))
+        if target is None:
+            target = logging.StreamHandler(sys.stderr)
+            target.setFormatter(AuditFormatter())
+        self.target = target
+        self.maxsize = maxsize
+        self.dropped = 0
+        self.drop_lock = threading.Lock()
+        self.listener = None
+        self.listener_pid = None
+        self.start_lock = threading.Lock()
+
+    def start(self):
+        # The listener thread does not survive a fork, so every process
+        # (e.g. each gunicorn worker) starts its own on first use.
+        with self.start_lock:
+            if self.listener_pid == os.getpid():
+                return
+            self.queue = queue.Queue(self.maxsize)
+            self.listener = AuditQueueListener(
+                self.queue, self.target, respect_handler_level=True
+            )
+            self.listener.start()
+            self.listener_pid = os.getpid()
+            atexit.register(self.stop)
+
+    def stop(self):
+        """
+        Write out queued records and stop the listener thread.
+        """
+        with self.start_lock:
+            if self.listener is not None and self.listener_pid == os.getpid():
+                try:
+                    self.listener.stop()
+                except queue.Full:
+                    pass
+            self.listener = None
+            self.listener_pid = None
+
+    def prepare(self, record):
+        # Formatting happens on the listener thread; audit records carry
+        # only plain values, so the record can be queued as is.
+        record.dropped = self.dropped
+        return record
+
+    def enqueue(self, record):
+        if self.listener_pid != os.getpid():
+            self.start()
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self.drop_lock:
+                self.dropped += 1
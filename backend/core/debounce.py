@@ -0,0 +1,65 @@
+"""
+Debounced, coalescing task scheduling keyed by entity.
+
+`debounce(task, *args, key=..., delay=...)` asks for `task` to run `delay`
+seconds after the first request for `key`. Further requests for the same key
+before then are folded into that run, with the latest `args` (last write
+wins). Requests are stored in the caller's transaction, so nothing is lost if
+a worker or the broker is down; the outbox relay releases due tasks into the
+outbox, after which a new request for the key starts a new window.
+"""
+
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from .models import DebouncedTask
+from .outbox import publish
+
+BATCH_SIZE = 500
+
+
+def debounce(task, *args, key=None, delay=30):
+    """
+    Run `task` once for a burst of requests sharing `key`.
+
+    `key` defaults to the task name and arguments, so identical calls
+    coalesce; pass an explicit key to coalesce calls with differing arguments.
+    """
+    if key is None:
+        key = ":".join([task, *map(str, args)])
+
+    # INSERT ... ON CONFLICT (key) DO UPDATE: keeps run_at, replaces args
+    DebouncedTask.objects.bulk_create(
+        [
+            DebouncedTask(
+                key=key,
+                task=task,
+                args=list(args),
+                run_at=timezone.now() + timedelta(seconds=delay),
+            )
+        ],
+        update_conflicts=True,
+        unique_fields=["key"],
+        update_fields=["task", "args"],
+    )
+
+
+def release_due_tasks(batch_size=BATCH_SIZE):
+    """
+    Move debounced tasks whose window has passed to the outbox.
+
+    Returns the number released.
+    """
+    with transaction.atomic():
+        due = list(
+            DebouncedTask.objects.select_for_update(skip_locked=True)
+            .filter(run_at__lte=timezone.now())
+            .order_by("run_at")[:batch_size]
+        )
+        for debounced in due:
+            publish(debounced.task, *debounced.args)
+        DebouncedTask.objects.filter(pk__in=[debounced.pk for debounced in due]).delete()
+
+    return len(due)
@@ -0,0 +1,163 @@
+"""
+Batched transactional email.
+
+Callers queue messages with `queue_email(builder, *object_ids)`, which only
+inserts rows in the caller's transaction. The outbox relay calls
+`schedule_flush()`, which debounces one flush per BATCH_WINDOW while messages
+are due, so messages queued in quick succession are sent together: each
+builder loads all of its objects with one query, and the batch goes out over
+a single backend connection.
+
+A batch is claimed and its results are recorded in two short transactions;
+sending happens in between, outside any transaction. Messages are sent one
+by one on that connection, so a failure only affects the message that
+caused it. Failed messages are retried with exponential backoff and dropped
+after MAX_ATTEMPTS.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import timedelta
+
+from django.core.mail import get_connection
+from django.db import transaction
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .debounce import debounce
+from .models import QueuedEmail
+
+logger = logging.getLogger(__name__)
+
+BATCH_WINDOW = 5  # seconds
+BATCH_SIZE = 500
+MAX_ATTEMPTS = 5
+RETRY_DELAY = timedelta(minutes=1)  # doubled after every failed attempt
+CLAIM_TIMEOUT = timedelta(minutes=10)  # a claimed batch is sent again after this
+
+DEFAULT_FROM_EMAIL = "noreply@jobboard.com"
+
+
+def queue_email(builder, *object_ids):
+    """
+    Queue one message per object id, rendered later by `builder`.
+
+    `builder` is the dotted path of a function taking a list of ids and
+    returning a dict of id -> EmailMessage; ids it leaves out are dropped.
+    """
+    if not object_ids:
+        return
+    QueuedEmail.objects.bulk_create(
+        [QueuedEmail(builder=builder, object_id=object_id) for object_id in object_ids]
+    )
+
+
+def schedule_flush():
+    """
+    Run one flush within BATCH_WINDOW if any message is due.
+
+    Called by the outbox relay rather than by `queue_email`, so queueing mail
+    never waits on the cache or the broker and rolls back with its caller.
+    """
+    if QueuedEmail.objects.filter(next_attempt_at__lte=timezone.now()).exists():
+        debounce("core.tasks.flush_queued_emails", delay=BATCH_WINDOW)
+
+
+def send_queued_emails(batch_size=BATCH_SIZE):
+    """
+    Send up to `batch_size` due messages. Returns the number sent.
+    """
+    queued = _claim(batch_size)
+    if not queued:
+        return 0
+
+    messages = _build_messages(queued)
+    done, failed, sent = [], [], 0
+    try:
+        with get_connection() as connection:
+            for email in queued:
+                message = messages.get(email.pk)
+                if message is None:
+                    # The builder failed, or the object no longer exists
+                    (done if email.pk in messages else failed).append(email)
+                    continue
+                try:
+                    connection.send_messages([message])
+                except Exception:
+                    logger.exception("Failed to send %s", email)
+                    failed.append(email)
+                else:
+                    done.append(email)
+                    sent += 1
+    except Exception:
+        # Opening or closing the connection failed; retry what is left
+        logger.exception("Email backend unavailable")
+        failed = [email for email in queued if email not in done]
+
+    with transaction.atomic():
+        QueuedEmail.objects.filter(pk__in=[email.pk for email in done]).delete()
+        _reschedule(failed)
+
+    return sent
+
+
+def _claim(batch_size):
+    """
+    Lease a batch of due messages by moving them CLAIM_TIMEOUT into the future.
+
+    The claim commits before anything is sent, so no transaction or row lock
+    is held while talking to the mail backend. If the sender dies, the batch
+    comes due again once the lease runs out.
+    """
+    with transaction.atomic():
+        queued = list(
+            QueuedEmail.objects.select_for_update(skip_locked=True)
+            .filter(next_attempt_at__lte=timezone.now())
+            .order_by("id")[:batch_size]
+        )
+        if queued:
+            QueuedEmail.objects.filter(pk__in=[email.pk for email in queued]).update(
+                next_attempt_at=timezone.now() + CLAIM_TIMEOUT
+            )
+    return queued
+
+
+def _build_messages(queued):
+    """
+    Map queued email pks to messages, None for objects that no longer exist.
+
+    Emails whose builder failed are left out, so they are retried.
+    """
+    ids_by_builder = defaultdict(list)
+    for email in queued:
+        ids_by_builder[email.builder].append(email.object_id)
+
+    messages_by_builder = {}
+    for builder, object_ids in ids_by_builder.items():
+        try:
+            messages_by_builder[builder] = import_string(builder)(object_ids)
+        except Exception:
+            logger.exception("Failed to build %s messages", builder)
+
+    return {
+        email.pk: messages_by_builder[email.builder].get(email.object_id)
+        for email in queued
+        if email.builder in messages_by_builder
+    }
+
+
+def _reschedule(failed):
+    retry, give_up = [], []
+    now = timezone.now()
+    for email in failed:
+        email.attempts += 1
+        if email.attempts >= MAX_ATTEMPTS:
+            give_up.append(email.pk)
+        else:
+            email.next_attempt_at = now + RETRY_DELAY * 2 ** (email.attempts - 1)
+            retry.append(email)
+
+    if give_up:
+        logger.error("Giving up on %d queued emails", len(give_up))
+        QueuedEmail.objects.filter(pk__in=give_up).delete()
+    QueuedEmail.objects.bulk_update(retry, ["attempts", "next_attempt_at"])
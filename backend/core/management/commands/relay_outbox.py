@@ -0,0 +1,51 @@
+import logging
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from core.debounce import release_due_tasks
+from core.mail import schedule_flush
+from core.outbox import relay_outbox
+
+logger = logging.getLogger(__name__)
+
+POLL_INTERVAL = 0.5  # seconds
+
+
+class Command(BaseCommand):
+    help = "Publish queued outbox events (and due debounced tasks) to the Celery broker."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Drain the outbox once and exit instead of polling.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=POLL_INTERVAL,
+            help="Seconds to wait when the outbox is empty.",
+        )
+
+    def handle(self, *args, **options):
+        if options["once"]:
+            schedule_flush()
+            release_due_tasks()
+            published = relay_outbox()
+            self.stdout.write(f"Published {published} events.")
+            return
+
+        while True:
+            close_old_connections()
+            try:
+                schedule_flush()
+                release_due_tasks()
+                published = relay_outbox()
+            except Exception:
+                # Broker or database unavailable; events stay queued
+                logger.exception("Outbox relay failed")
+                published = 0
+            if not published:
+                time.sleep(options["interval"])
@@ -0,0 +1,31 @@
+from celery import current_app
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Start a Celery worker with a profile from CELERY_WORKER_PROFILES."
+
+    def add_arguments(self, parser):
+        parser.add_argument("profile", choices=sorted(settings.CELERY_WORKER_PROFILES))
+        parser.add_argument("--loglevel", default="info")
+
+    def handle(self, *args, **options):
+        name = options["profile"]
+        profile = settings.CELERY_WORKER_PROFILES[name]
+
+        argv = [
+            "worker",
+            "--queues",
+            ",".join(profile["queues"]),
+            "--concurrency",
+            str(profile["concurrency"]),
+            "--hostname",
+            f"{name}@%h",
+            "--loglevel",
+            options["loglevel"],
+        ]
+        if "max_tasks_per_child" in profile:
+            argv += ["--max-tasks-per-child", str(profile["max_tasks_per_child"])]
+
+        current_app.worker_main(argv)
@@ -0,0 +1,39 @@
+from celery import current_app
+from django.core.management.base import BaseCommand
+
+from core.task_metrics import queue_depths, reset, snapshot
+
+
+class Command(BaseCommand):
+    help = "Show Celery task latency, runtime and outcome metrics, and queue depths."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Clear all recorded task metrics.",
+        )
+
+    def handle(self, *args, **options):
+        if options["reset"]:
+            reset(current_app)
+            self.stdout.write("Task metrics cleared.")
+            return
+
+        self.stdout.write(
+            f"{'task':<55} {'ok':>7} {'failed':>7} {'retried':>7} "
+            f"{'avg wait':>9} {'avg run':>9}"
+        )
+        for name, task in snapshot(current_app).items():
+            self.stdout.write(
+                f"{name:<55} {task['succeeded']:>7} {task['failed']:>7} {task['retried']:>7} "
+                f"{self._seconds(task['latency']['avg_seconds']):>9} "
+                f"{self._seconds(task['runtime']['avg_seconds']):>9}"
+            )
+
+        self.stdout.write("")
+        for queue, depth in queue_depths(current_app).items():
+            self.stdout.write(f"queue {queue}: {'unavailable' if depth is None else depth}")
+
+    def _seconds(self, value):
+        return "-" if value is None else f"{value:.3f}s"
@@ -1,3 +1,65 @@
 from django.db import models
+from django.utils import timezone
 
-# Create your models here.
+
+class QueuedEmail(models.Model):
+    """
+    Transactional email waiting to be sent in a batch by core.mail.
+
+    `builder` is the dotted path of a function that turns a list of object
+    ids into messages, so rows stay small and content is rendered at send time.
+    """
+
+    builder = models.CharField(max_length=255)
+    object_id = models.BigIntegerField()
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["next_attempt_at", "id"]),
+        ]
+
+    def __str__(self):
+        return f"{self.builder}({self.object_id})"
+
+
+class OutboxEvent(models.Model):
+    """
+    Celery task waiting to be published by the outbox relay (core.outbox).
+
+    Written in the same transaction as the change that triggers it, so the
+    task is published only if, and after, that change commits.
+    """
+
+    task = models.CharField(max_length=255)
+    args = models.JSONField(default=list)
+    countdown = models.PositiveIntegerField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.task}{tuple(self.args)}"
+
+
+class DebouncedTask(models.Model):
+    """
+    Celery task waiting for its debounce window to pass (core.debounce).
+
+    One row per key: repeated requests within the window replace `args`
+    but keep `run_at`, so a burst collapses into a single run.
+    """
+
+    key = models.CharField(max_length=255, unique=True)
+    task = models.CharField(max_length=255)
+    args = models.JSONField(default=list)
+    run_at = models.DateTimeField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["run_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.key} @ {self.run_at:%H:%M:%S}"
@@ -0,0 +1,62 @@
+"""
+Transactional outbox for Celery tasks.
+
+`publish()` stores the task as an OutboxEvent row in the caller's transaction
+instead of talking to the broker, so tasks never run before the data they
+need is committed and requests never wait on the broker. The relay
+(`manage.py relay_outbox`) drains the table in batches, publishing each batch
+over one broker connection and deleting the rows in the same transaction.
+
+Delivery is at least once: if the relay dies between publishing and
+committing, the batch is published again, so tasks must be idempotent.
+"""
+
+from celery import current_app
+from django.db import transaction
+
+from .models import OutboxEvent
+
+BATCH_SIZE = 500
+
+
+def publish(task, *args, countdown=None):
+    """
+    Queue `task` (its registered name) with positional `args` for the relay.
+    """
+    OutboxEvent.objects.create(task=task, args=list(args), countdown=countdown)
+
+
+def relay_batch(batch_size=BATCH_SIZE):
+    """
+    Publish up to `batch_size` events, oldest first. Returns the number published.
+    """
+    with transaction.atomic():
+        events = list(
+            OutboxEvent.objects.select_for_update(skip_locked=True).order_by("id")[:batch_size]
+        )
+        if not events:
+            return 0
+
+        with current_app.producer_or_acquire() as producer:
+            for event in events:
+                current_app.send_task(
+                    event.task,
+                    args=event.args,
+                    countdown=event.countdown,
+                    producer=producer,
+                )
+        OutboxEvent.objects.filter(pk__in=[event.pk for event in events]).delete()
+
+    return len(events)
+
+
+def relay_outbox(batch_size=BATCH_SIZE):
+    """
+    Publish everything currently in the outbox. Returns the number published.
+    """
+    published = 0
+    while True:
+        batch = relay_batch(batch_size)
+        published += batch
+        if batch < batch_size:
+            return published
@@ -0,0 +1,169 @@
+"""
+Per-task Celery metrics collected from Celery's signals.
+
+Publishers stamp each message with an `enqueued_at` header; workers record
+how long the task waited before starting (latency) and how long it ran
+(runtime) as histograms, and count outcomes. Counters live in the shared
+cache so every worker contributes to the same figures and any process can
+read them; a snapshot is a single `get_many`.
+"""
+
+import logging
+import math
+import time
+from datetime import datetime
+
+from celery import signals
+from django.core.cache import cache
+
+from .task_routing import queue_names
+from .utils.cache_keys import task_metric_key
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket upper bounds, in seconds
+BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300, math.inf)
+HISTOGRAMS = ("latency", "runtime")
+OUTCOMES = {"SUCCESS": "succeeded", "FAILURE": "failed", "RETRY": "retried"}
+
+# Task id -> monotonic start time, for tasks running in this worker process
+_started = {}
+
+
+def _bucket_label(bound):
+    return "+Inf" if bound == math.inf else str(bound)
+
+
+def _metric_names():
+    return [
+        *OUTCOMES.values(),
+        *(
+            f"{histogram}:{suffix}"
+            for histogram in HISTOGRAMS
+            for suffix in ("sum_ms", *map(_bucket_label, BUCKETS))
+        ),
+    ]
+
+
+def _incr(key, delta=1):
+    try:
+        cache.incr(key, delta)
+    except ValueError:
+        cache.add(key, 0, timeout=None)
+        cache.incr(key, delta)
+
+
+def observe(task_name, histogram, seconds):
+    bound = next(bound for bound in BUCKETS if seconds <= bound)
+    _incr(task_metric_key(task_name, f"{histogram}:{_bucket_label(bound)}"))
+    _incr(task_metric_key(task_name, f"{histogram}:sum_ms"), round(seconds * 1000))
+
+
+def count(task_name, outcome):
+    _incr(task_metric_key(task_name, outcome))
+
+
+@signals.before_task_publish.connect
+def stamp_enqueued_at(headers=None, **kwargs):
+    if headers is not None:
+        headers.setdefault("enqueued_at", time.time())
+
+
+@signals.task_prerun.connect
+def task_started(task_id=None, task=None, **kwargs):
+    _started[task_id] = time.monotonic()
+    enqueued_at = getattr(task.request, "enqueued_at", None)
+    if enqueued_at is None:
+        return  # called eagerly or published without the header
+    # Deliberate delays (countdown/eta) are not queueing latency
+    eta = task.request.eta
+    if eta:
+        if isinstance(eta, str):
+            eta = datetime.fromisoformat(eta)
+        enqueued_at = max(enqueued_at, eta.timestamp())
+    try:
+        observe(task.name, "latency", max(time.time() - enqueued_at, 0))
+    except Exception:
+        logger.exception("Failed to record latency for %s", task.name)
+
+
+@signals.task_postrun.connect
+def task_finished(task_id=None, task=None, state=None, **kwargs):
+    started = _started.pop(task_id, None)
+    try:
+        if started is not None:
+            observe(task.name, "runtime", time.monotonic() - started)
+        if state in OUTCOMES:
+            count(task.name, OUTCOMES[state])
+    except Exception:
+        logger.exception("Failed to record metrics for %s", task.name)
+
+
+def task_names(app):
+    app.loader.import_default_modules()
+    return sorted(name for name in app.tasks if not name.startswith("celery."))
+
+
+def snapshot(app):
+    """
+    Return metrics for every task registered on `app`.
+
+    Histogram buckets are cumulative (each counts observations <= its bound).
+    """
+    names = task_names(app)
+    keys = {
+        (name, metric): task_metric_key(name, metric)
+        for name in names
+        for metric in _metric_names()
+    }
+    values = cache.get_many(keys.values())
+
+    def value(name, metric):
+        return values.get(keys[name, metric], 0)
+
+    metrics = {}
+    for name in names:
+        task = {outcome: value(name, outcome) for outcome in OUTCOMES.values()}
+        for histogram in HISTOGRAMS:
+            buckets, total = {}, 0
+            for bound in BUCKETS:
+                label = _bucket_label(bound)
+                total += value(name, f"{histogram}:{label}")
+                buckets[label] = total
+            sum_seconds = value(name, f"{histogram}:sum_ms") / 1000
+            task[histogram] = {
+                "count": total,
+                "avg_seconds": round(sum_seconds / total, 3) if total else None,
+                "buckets": buckets,
+            }
+        metrics[name] = task
+    return metrics
+
+
+def queue_depths(app):
+    """
+    Return the number of messages waiting in each known queue.
+
+    Depths are None when the broker cannot be reached.
+    """
+    names = queue_names(app)
+    try:
+        with app.connection_for_read() as connection:
+            channel = connection.default_channel
+            depths = {}
+            for name in names:
+                try:
+                    depths[name] = channel.queue_declare(queue=name, passive=True).message_count
+                except connection.channel_errors:
+                    depths[name] = 0  # the broker drops empty queues
+                    channel = connection.channel()
+            return depths
+    except Exception:
+        logger.exception("Failed to read queue depths")
+        return dict.fromkeys(names)
+
+
+def reset(app):
+    cache.delete_many(
+        [task_metric_key(name, metric) for name in task_names(app) for metric in _metric_names()]
+    )
@@ -0,0 +1,50 @@
+"""
+Named task queues and the router that sends each task to its queue.
+
+Tasks declare their queue (and, optionally, a rate limit) where they are
+defined, e.g. `@shared_task(queue=BULK, rate_limit="10/m")`; undeclared tasks
+go to the default queue. Workers are started per queue with the concurrency
+profiles in CELERY_WORKER_PROFILES (`manage.py run_worker <profile>`), so a
+burst of bulk work never occupies the workers that serve interactive tasks.
+"""
+
+from celery import current_app
+
+# Users are waiting on these (confirmation and welcome emails)
+INTERACTIVE = "interactive"
+DEFAULT = "default"
+# Heavy or periodic work that may lag behind
+BULK = "bulk"
+# Resume parsing; CPU-bound, with its own worker pool
+RESUMES = "resumes"
+
+
+def _registered_task(app, name):
+    if name not in app.tasks:
+        # Publishers such as the outbox relay send tasks by name and may not
+        # have imported the task modules yet.
+        app.loader.import_default_modules()
+    return app.tasks.get(name)
+
+
+def route_task(name, args, kwargs, options, task=None, **kw):
+    """
+    Celery router: use the queue the task declared, if any.
+    """
+    if task is None:
+        task = _registered_task(current_app, name)
+    queue = getattr(task, "queue", None)
+    if queue:
+        return {"queue": queue}
+    return None
+
+
+def queue_names(app):
+    """
+    Every queue a task of `app` can be routed to.
+    """
+    app.loader.import_default_modules()
+    return sorted(
+        {app.conf.task_default_queue}
+        | {task.queue for task in app.tasks.values() if getattr(task, "queue", None)}
+    )
@@ -0,0 +1,15 @@
+from celery import shared_task
+
+from .mail import BATCH_SIZE, send_queued_emails
+from .task_routing import INTERACTIVE
+
+
+@shared_task(queue=INTERACTIVE)
+def flush_queued_emails():
+    sent = 0
+    while True:
+        batch = send_queued_emails()
+        sent += batch
+        # A short batch means nothing else is due (or the rest is failing)
+        if batch < BATCH_SIZE:
+            return sent
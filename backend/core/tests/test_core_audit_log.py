@@ -0,0 +1,90 @@
+import json
+import logging
+import threading
+
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from accounts.tests.factories import JobSeekerUserFactory
+from core.audit_log import AuditFormatter, AuditQueueHandler
+
+
+class BlockingHandler(logging.Handler):
+    """
+    A sink that holds every write until released.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.unblocked = threading.Event()
+        self.records = []
+
+    def emit(self, record):
+        self.unblocked.wait(timeout=5)
+        self.records.append(record)
+
+
+@pytest.fixture
+def audit_records():
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    logger = logging.getLogger("core.middleware.request_audit")
+    logger.addHandler(handler)
+    yield records
+    logger.removeHandler(handler)
+
+
+class TestAuditQueueHandler:
+    def test_slow_sink_does_not_block_and_drops_overflow(self):
+        target = BlockingHandler()
+        handler = AuditQueueHandler(maxsize=2, target=target)
+        logger = logging.Logger("audit-test")
+        logger.addHandler(handler)
+
+        for i in range(10):
+            logger.info("record %s", i)
+
+        # One record is held by the sink, two are queued
+        assert handler.dropped >= 7
+        target.unblocked.set()
+        handler.stop()
+        assert 1 <= len(target.records) <= 3
+        assert handler.dropped + len(target.records) == 10
+
+    def test_records_are_written_as_json(self):
+        record = logging.LogRecord("audit", logging.INFO, __file__, 1, "request", (), None)
+        record.audit = {"route": "api/v1/jobs/", "status": 200}
+        record.dropped = 3
+
+        payload = json.loads(AuditFormatter().format(record))
+
+        assert payload["route"] == "api/v1/jobs/"
+        assert payload["status"] == 200
+        assert payload["dropped"] == 3
+
+
+@pytest.mark.django_db
+class TestRequestAuditMiddleware:
+    def test_records_route_user_and_db_time(self, audit_records):
+        user = JobSeekerUserFactory()
+        api_client = APIClient()
+        api_client.force_authenticate(user=user)
+
+        api_client.get(reverse("my-application-list"))
+
+        (record,) = audit_records
+        assert record.audit["route"] == "api/v1/applications/my-applications/"
+        assert record.audit["view"] == "my-application-list"
+        assert record.audit["user_id"] == user.pk
+        assert record.audit["status"] == 200
+        assert record.audit["db_queries"] >= 1
+        assert record.audit["db_ms"] >= 0
+
+    def test_anonymous_request(self, audit_records):
+        APIClient().get(reverse("job-list-create"))
+
+        (record,) = audit_records
+        assert record.audit["user_id"] is None
+        assert record.audit["route"] == "api/v1/jobs/"
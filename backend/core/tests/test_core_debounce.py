@@ -0,0 +1,76 @@
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from core.debounce import debounce, release_due_tasks
+from core.models import DebouncedTask, OutboxEvent
+from jobs.tests.factories import JobFactory
+
+RESCORE = "applications.tasks.rescore_job_applications"
+
+
+def make_due():
+    DebouncedTask.objects.update(run_at=timezone.now() - timedelta(seconds=1))
+
+
+@pytest.mark.django_db
+class TestDebounce:
+    def test_burst_collapses_into_one_task(self):
+        for _ in range(5):
+            debounce(RESCORE, 42)
+
+        debounced = DebouncedTask.objects.get()
+        assert debounced.key == f"{RESCORE}:42"
+        assert debounced.args == [42]
+
+    def test_last_write_wins_and_window_is_not_extended(self):
+        debounce("core.tasks.reindex", 1, key="reindex", delay=30)
+        run_at = DebouncedTask.objects.get().run_at
+
+        debounce("core.tasks.reindex", 2, key="reindex", delay=30)
+
+        debounced = DebouncedTask.objects.get()
+        assert debounced.args == [2]
+        assert debounced.run_at == run_at
+
+    def test_tasks_are_released_once_due(self):
+        debounce(RESCORE, 42)
+        assert release_due_tasks() == 0
+
+        make_due()
+        assert release_due_tasks() == 1
+
+        assert not DebouncedTask.objects.exists()
+        assert OutboxEvent.objects.filter(task=RESCORE, args=[42]).count() == 1
+
+    def test_requests_after_release_start_a_new_window(self):
+        debounce(RESCORE, 42)
+        make_due()
+        release_due_tasks()
+
+        debounce(RESCORE, 42)
+
+        assert DebouncedTask.objects.get().run_at > timezone.now()
+
+    def test_editing_a_job_repeatedly_rescores_once(self):
+        job = JobFactory()
+        OutboxEvent.objects.all().delete()
+        for n in range(5):
+            job.title = f"Backend engineer {n}"
+            job.save()
+
+        make_due()
+        release_due_tasks()
+
+        assert OutboxEvent.objects.filter(task=RESCORE, args=[job.pk]).count() == 1
+
+    def test_relay_command_releases_due_tasks(self):
+        debounce(RESCORE, 42)
+        make_due()
+        with mock.patch("core.management.commands.relay_outbox.relay_outbox", return_value=0):
+            call_command("relay_outbox", "--once", stdout=mock.Mock())
+
+        assert OutboxEvent.objects.filter(task=RESCORE).exists()
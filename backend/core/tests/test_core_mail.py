@@ -0,0 +1,112 @@
+from datetime import timedelta
+from smtplib import SMTPException
+from unittest import mock
+
+import pytest
+from django.core import mail
+from django.core.mail import get_connection
+from django.core.mail.backends.locmem import EmailBackend
+from django.utils import timezone
+
+from accounts.tests.factories import JobSeekerUserFactory
+from core.mail import BATCH_WINDOW, MAX_ATTEMPTS, schedule_flush, send_queued_emails
+from core.models import DebouncedTask, OutboxEvent, QueuedEmail
+
+
+class FlakyBackend(EmailBackend):
+    def send_messages(self, messages):
+        if any(address.startswith("bounce") for m in messages for address in m.to):
+            raise SMTPException("mailbox unavailable")
+        return super().send_messages(messages)
+
+
+@pytest.mark.django_db
+class TestBatchedEmail:
+    def test_queued_messages_are_sent_over_one_connection(self, django_assert_num_queries):
+        users = JobSeekerUserFactory.create_batch(3)
+
+        # claim: savepoint, lock batch, lease, release; load users;
+        # record: savepoint, delete sent rows, release
+        with django_assert_num_queries(8), mock.patch(
+            "core.mail.get_connection", wraps=get_connection
+        ) as connection:
+            assert send_queued_emails() == 3
+
+        connection.assert_called_once()
+        assert sorted(m.to[0] for m in mail.outbox) == sorted(u.email for u in users)
+        assert mail.outbox[0].subject == "Welcome to Job Board"
+        assert not QueuedEmail.objects.exists()
+
+    def test_queueing_only_writes_to_the_database(self):
+        with mock.patch("core.mail.debounce") as debounce:
+            JobSeekerUserFactory.create_batch(3)
+
+        debounce.assert_not_called()
+        assert QueuedEmail.objects.count() == 3
+        assert not OutboxEvent.objects.exists()
+
+    def test_one_flush_is_scheduled_per_window(self):
+        JobSeekerUserFactory.create_batch(3)
+
+        schedule_flush()
+        schedule_flush()
+
+        flush = DebouncedTask.objects.get()
+        assert flush.task == "core.tasks.flush_queued_emails"
+        assert flush.run_at <= timezone.now() + timedelta(seconds=BATCH_WINDOW)
+
+    def test_no_flush_without_due_messages(self):
+        JobSeekerUserFactory()
+        QueuedEmail.objects.update(next_attempt_at=timezone.now() + timedelta(minutes=1))
+
+        schedule_flush()
+
+        assert not DebouncedTask.objects.exists()
+
+    def test_batch_is_claimed_before_sending(self):
+        JobSeekerUserFactory.create_batch(2)
+        due_while_sending = []
+
+        class RecordingBackend(EmailBackend):
+            def send_messages(self, messages):
+                due_while_sending.append(
+                    QueuedEmail.objects.filter(next_attempt_at__lte=timezone.now()).count()
+                )
+                return super().send_messages(messages)
+
+        with mock.patch("core.mail.get_connection", return_value=RecordingBackend()):
+            assert send_queued_emails() == 2
+
+        assert due_while_sending == [0, 0]
+
+    def test_failed_message_is_retried_alone(self):
+        JobSeekerUserFactory(email="bounce@example.com")
+        JobSeekerUserFactory(email="ok@example.com")
+
+        with mock.patch("core.mail.get_connection", return_value=FlakyBackend()):
+            assert send_queued_emails() == 1
+
+        assert [m.to for m in mail.outbox] == [["ok@example.com"]]
+        failed = QueuedEmail.objects.get()
+        assert failed.attempts == 1
+        assert failed.next_attempt_at > timezone.now()
+        # not due yet
+        assert send_queued_emails() == 0
+
+    def test_message_is_dropped_after_max_attempts(self):
+        JobSeekerUserFactory(email="bounce@example.com")
+        QueuedEmail.objects.update(
+            attempts=MAX_ATTEMPTS - 1, next_attempt_at=timezone.now() - timedelta(seconds=1)
+        )
+
+        with mock.patch("core.mail.get_connection", return_value=FlakyBackend()):
+            assert send_queued_emails() == 0
+        assert not QueuedEmail.objects.exists()
+
+    def test_deleted_objects_are_skipped(self):
+        user = JobSeekerUserFactory()
+        user.delete()
+
+        assert send_queued_emails() == 0
+        assert mail.outbox == []
+        assert not QueuedEmail.objects.exists()
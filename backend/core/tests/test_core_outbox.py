@@ -0,0 +1,72 @@
+from io import StringIO
+from unittest import mock
+
+import pytest
+from django.core.management import call_command
+from django.db import transaction
+
+from applications.tests.factories import ApplicationFactory
+from core.models import OutboxEvent
+from core.outbox import current_app, publish, relay_batch
+
+
+@pytest.fixture
+def broker():
+    with mock.patch.object(current_app, "producer_or_acquire") as acquire, mock.patch.object(
+        current_app, "send_task"
+    ) as send_task:
+        yield acquire.return_value.__enter__.return_value, send_task
+
+
+@pytest.mark.django_db
+class TestOutbox:
+    def test_signals_write_events_instead_of_publishing(self, broker):
+        _, send_task = broker
+        application = ApplicationFactory()
+
+        assert OutboxEvent.objects.filter(
+            task="applications.tasks.score_application", args=[application.pk]
+        ).exists()
+        send_task.assert_not_called()
+
+    def test_events_roll_back_with_the_transaction(self):
+        with pytest.raises(RuntimeError), transaction.atomic():
+            publish("applications.tasks.score_application", 1)
+            raise RuntimeError
+
+        assert not OutboxEvent.objects.exists()
+
+    def test_relay_publishes_a_batch_over_one_producer(self, broker):
+        producer, send_task = broker
+        OutboxEvent.objects.all().delete()
+        publish("applications.tasks.score_application", 1)
+        publish("applications.tasks.score_application", 2)
+        publish("core.tasks.flush_queued_emails", countdown=5)
+
+        assert relay_batch() == 3
+
+        assert send_task.call_args_list == [
+            mock.call("applications.tasks.score_application", args=[1], countdown=None, producer=producer),
+            mock.call("applications.tasks.score_application", args=[2], countdown=None, producer=producer),
+            mock.call("core.tasks.flush_queued_emails", args=[], countdown=5, producer=producer),
+        ]
+        assert not OutboxEvent.objects.exists()
+
+    def test_events_are_kept_when_the_broker_fails(self, broker):
+        _, send_task = broker
+        send_task.side_effect = OSError("broker unavailable")
+        publish("applications.tasks.score_application", 1)
+
+        with pytest.raises(OSError):
+            relay_batch()
+        assert OutboxEvent.objects.filter(task="applications.tasks.score_application").exists()
+
+    def test_command_drains_the_outbox(self, broker):
+        OutboxEvent.objects.all().delete()
+        publish("applications.tasks.score_application", 1)
+        out = StringIO()
+
+        call_command("relay_outbox", "--once", stdout=out)
+
+        assert out.getvalue().strip() == "Published 1 events."
+        assert not OutboxEvent.objects.exists()
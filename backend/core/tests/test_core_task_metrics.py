@@ -0,0 +1,117 @@
+from io import StringIO
+
+import pytest
+from celery import Celery, current_app
+from celery.contrib.testing.worker import start_worker
+from django.core.cache import cache
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from accounts.tests.factories import AdminUserFactory, EmployerUserFactory
+from core.task_metrics import observe, queue_depths, snapshot
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+
+
+@pytest.fixture
+def celery_app():
+    app = Celery(
+        "metrics-test", broker="memory://", backend="cache+memory://", set_as_current=False
+    )
+    app.conf.task_default_queue = "metrics-test"
+    app.conf.broker_transport_options = {"polling_interval": 0.01}
+
+    @app.task(name="metrics.add")
+    def add(x, y):
+        return x + y
+
+    @app.task(name="metrics.fail")
+    def fail():
+        raise ValueError("boom")
+
+    @app.task(name="metrics.flaky", bind=True, max_retries=1, default_retry_delay=0)
+    def flaky(self):
+        if not self.request.retries:
+            raise self.retry()
+        return "ok"
+
+    # start_worker makes its app the current one; put the project app back
+    previous = current_app._get_current_object()
+    yield app
+    previous.set_current()
+
+
+class TestTaskMetrics:
+    def test_worker_records_latency_runtime_and_outcomes(self, celery_app):
+        with start_worker(celery_app, pool="solo", perform_ping_check=False):
+            assert celery_app.tasks["metrics.add"].delay(1, 2).get(timeout=10) == 3
+            assert celery_app.tasks["metrics.add"].delay(2, 3).get(timeout=10) == 5
+            with pytest.raises(ValueError):
+                celery_app.tasks["metrics.fail"].delay().get(timeout=10)
+            assert celery_app.tasks["metrics.flaky"].delay().get(timeout=10) == "ok"
+
+        metrics = snapshot(celery_app)
+
+        add = metrics["metrics.add"]
+        assert add["succeeded"] == 2
+        assert add["latency"]["count"] == 2
+        assert add["runtime"]["count"] == 2
+        assert add["runtime"]["buckets"]["+Inf"] == 2
+        assert metrics["metrics.fail"]["failed"] == 1
+        assert metrics["metrics.flaky"]["retried"] == 1
+        assert metrics["metrics.flaky"]["succeeded"] == 1
+
+    def test_queue_depth(self, celery_app):
+        celery_app.tasks["metrics.add"].delay(1, 2)
+        celery_app.tasks["metrics.add"].delay(3, 4)
+
+        assert queue_depths(celery_app)["metrics-test"] == 2
+
+    def test_histogram_buckets_are_cumulative(self, celery_app):
+        observe("metrics.add", "runtime", 0.2)
+        observe("metrics.add", "runtime", 3)
+
+        runtime = snapshot(celery_app)["metrics.add"]["runtime"]
+
+        assert runtime["buckets"]["0.1"] == 0
+        assert runtime["buckets"]["0.25"] == 1
+        assert runtime["buckets"]["5"] == 2
+        assert runtime["avg_seconds"] == 1.6
+
+
+@pytest.mark.django_db
+class TestTaskMetricsEndpoint:
+    def test_admin_reads_metrics(self):
+        observe("applications.tasks.score_application", "runtime", 0.5)
+        api_client = APIClient()
+        api_client.force_authenticate(user=AdminUserFactory())
+
+        response = api_client.get(reverse("task-metrics"))
+
+        assert response.status_code == status.HTTP_200_OK
+        score = response.data["tasks"]["applications.tasks.score_application"]
+        assert score["runtime"]["count"] == 1
+        assert "queues" in response.data
+
+    def test_non_admin_is_forbidden(self):
+        api_client = APIClient()
+        api_client.force_authenticate(user=EmployerUserFactory())
+        response = api_client.get(reverse("task-metrics"))
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_command_prints_a_table(self):
+        observe("applications.tasks.score_application", "runtime", 0.5)
+        out = StringIO()
+
+        call_command("task_metrics", stdout=out)
+
+        line = next(
+            line for line in out.getvalue().splitlines()
+            if line.startswith("applications.tasks.score_application")
+        )
+        assert line.split()[-1] == "0.500s"
@@ -0,0 +1,101 @@
+import threading
+import time
+from unittest import mock
+
+from celery import Celery, current_app
+from celery.contrib.testing.worker import start_worker
+from django.conf import settings
+from django.core.management import call_command
+
+from core.task_routing import BULK, DEFAULT, INTERACTIVE, RESUMES, queue_names
+
+
+def routed_queue(name):
+    return current_app.amqp.router.route({}, name, (), {})["queue"].name
+
+
+class TestTaskRouting:
+    def test_tasks_are_routed_to_their_declared_queue(self):
+        assert routed_queue("core.tasks.flush_queued_emails") == INTERACTIVE
+        assert routed_queue("applications.tasks.rescore_job_applications") == BULK
+        assert routed_queue("applications.tasks.extract_resume_text") == RESUMES
+
+    def test_undeclared_tasks_use_the_default_queue(self):
+        assert routed_queue("applications.tasks.score_application") == DEFAULT
+
+    def test_rate_limits_are_declared_on_the_task(self):
+        assert current_app.tasks["applications.tasks.rescore_job_applications"].rate_limit == "10/m"
+
+    def test_every_queue_has_a_worker_profile(self):
+        served = {
+            queue
+            for profile in settings.CELERY_WORKER_PROFILES.values()
+            for queue in profile["queues"]
+        }
+        assert set(queue_names(current_app)) <= served
+
+    def test_run_worker_uses_the_profile(self):
+        with mock.patch.object(current_app, "worker_main") as worker_main:
+            call_command("run_worker", "resumes")
+
+        worker_main.assert_called_once_with(
+            [
+                "worker",
+                "--queues",
+                "resumes",
+                "--concurrency",
+                "2",
+                "--hostname",
+                "resumes@%h",
+                "--loglevel",
+                "info",
+                "--max-tasks-per-child",
+                "100",
+            ]
+        )
+
+
+class TestQueueFairness:
+    def test_interactive_task_does_not_wait_behind_a_bulk_backlog(self):
+        app = Celery("fairness-test", broker="memory://", set_as_current=False)
+        app.conf.update(
+            task_default_queue=settings.CELERY_TASK_DEFAULT_QUEUE,
+            task_routes=settings.CELERY_TASK_ROUTES,
+            worker_prefetch_multiplier=settings.CELERY_WORKER_PREFETCH_MULTIPLIER,
+            broker_transport_options={"polling_interval": 0.01},
+        )
+        executed = []
+        done = threading.Event()
+
+        @app.task(name="fairness.bulk", queue=BULK)
+        def bulk(n):
+            time.sleep(0.02)
+            executed.append(f"bulk-{n}")
+
+        @app.task(name="fairness.interactive", queue=INTERACTIVE)
+        def interactive():
+            executed.append("interactive")
+            done.set()
+
+        for n in range(30):
+            bulk.delay(n)
+        interactive.delay()
+
+        # One worker serving both queues is the worst case; dedicated
+        # interactive workers never see bulk tasks at all.
+        previous = current_app._get_current_object()
+        try:
+            with start_worker(
+                app,
+                pool="solo",
+                queues=[BULK, INTERACTIVE],
+                perform_ping_check=False,
+                shutdown_timeout=1,
+            ):
+                assert done.wait(timeout=10)
+        finally:
+            previous.set_current()
+
+        # Queues are consumed round-robin, so the interactive task waits for
+        # at most one bulk task, not the whole backlog.
+        assert executed.index("interactive") <= 1
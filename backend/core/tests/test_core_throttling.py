@@ -0,0 +1,125 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from accounts.tests.factories import JobSeekerUserFactory
+from core.throttling import LocalBuckets, parse_rate
+from jobs.tests.factories import JobFactory
+
+
+@pytest.fixture
+def rates(settings):
+    def configure(**scopes):
+        settings.REST_FRAMEWORK = {
+            **settings.REST_FRAMEWORK,
+            "DEFAULT_THROTTLE_RATES": {
+                **settings.REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"],
+                **scopes,
+            },
+        }
+
+    return configure
+
+
+def test_parse_rate():
+    assert parse_rate("5/min") == (5, 5 / 60)
+    assert parse_rate("10/hour") == (10, 10 / 3600)
+
+
+class TestLocalBuckets:
+    def test_bucket_allows_bursts_up_to_capacity(self):
+        buckets = LocalBuckets()
+        bucket = [("key", 2, 1 / 60)]
+
+        assert buckets.take(bucket) == 0
+        assert buckets.take(bucket) == 0
+        assert buckets.take(bucket) == pytest.approx(60, abs=1)
+
+    def test_tokens_are_taken_from_all_buckets_or_none(self):
+        buckets = LocalBuckets()
+        buckets.take([("username", 1, 1 / 60)])
+
+        assert buckets.take([("ip", 5, 1), ("username", 1, 1 / 60)]) > 0
+        assert "ip" not in buckets.buckets
+
+    def test_buckets_refill(self, monkeypatch):
+        buckets = LocalBuckets()
+        clock = iter([100.0, 100.0, 101.0])
+        monkeypatch.setattr("core.throttling.time.monotonic", lambda: next(clock))
+        bucket = [("key", 1, 1)]
+
+        assert buckets.take(bucket) == 0
+        assert buckets.take(bucket) > 0
+        assert buckets.take(bucket) == 0
+
+
+@pytest.mark.django_db
+class TestThrottledEndpoints:
+    def test_anonymous_search_is_limited(self, rates):
+        rates(search_anon="2/min")
+        api_client = APIClient()
+        url = reverse("job-list-create")
+
+        for _ in range(2):
+            assert api_client.get(url, {"search": "python"}).status_code == status.HTTP_200_OK
+        response = api_client.get(url, {"search": "python"})
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert 0 < int(response["Retry-After"]) <= 30
+        # Browsing without a search query is not limited
+        assert api_client.get(url).status_code == status.HTTP_200_OK
+
+    def test_login_is_limited_per_username(self, rates):
+        rates(login_username="2/min")
+        user = JobSeekerUserFactory()
+        url = "/api/v1/accounts/login/"
+
+        for ip in ("10.0.0.1", "10.0.0.2"):
+            APIClient(REMOTE_ADDR=ip).post(url, {"username": user.username, "password": "x"})
+        response = APIClient(REMOTE_ADDR="10.0.0.3").post(
+            url, {"username": user.username.upper(), "password": "password123"}
+        )
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert "Retry-After" in response
+
+    def test_login_is_limited_per_ip(self, rates):
+        rates(login_ip="1/min")
+        api_client = APIClient()
+        url = "/api/v1/accounts/login/"
+
+        api_client.post(url, {"username": "a", "password": "x"})
+        response = api_client.post(url, {"username": "b", "password": "x"})
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+    def test_forwarded_for_header_does_not_reset_ip_bucket(self, rates):
+        rates(login_ip="1/min")
+        url = "/api/v1/accounts/login/"
+
+        APIClient(HTTP_X_FORWARDED_FOR="203.0.113.1").post(
+            url, {"username": "a", "password": "x"}
+        )
+        response = APIClient(HTTP_X_FORWARDED_FOR="203.0.113.2").post(
+            url, {"username": "b", "password": "x"}
+        )
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+    def test_applications_are_limited_per_user(self, rates):
+        rates(apply="1/hour")
+        api_client = APIClient()
+        api_client.force_authenticate(user=JobSeekerUserFactory())
+
+        first = api_client.post(
+            reverse("job-application-list-create", kwargs={"job_pk": JobFactory().pk}),
+            {"cover_letter": "Hello"},
+        )
+        second = api_client.post(
+            reverse("job-application-list-create", kwargs={"job_pk": JobFactory().pk}),
+            {"cover_letter": "Hello"},
+        )
+
+        assert first.status_code != status.HTTP_429_TOO_MANY_REQUESTS
+        assert second.status_code == status.HTTP_429_TOO_MANY_REQUESTS
@@ -0,0 +1,202 @@
+"""
+Token-bucket request throttling.
+
+Each throttle scope is a bucket per client (IP, username or user) holding up
+to N tokens and refilling at N per period, from the DRF-style rate in
+REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"] ("5/min"). A request takes one token
+from every bucket that applies to it, or is refused with 429 and Retry-After
+set to when the emptiest bucket next holds a token.
+
+THROTTLE_URL selects the store. With Redis, all buckets of a request are
+checked and taken by one Lua script, so throttling costs one round trip and
+concurrent requests cannot both take the last token. "memory://" keeps the
+buckets in the process, for tests and single-process development. If Redis is
+unreachable, requests are let through rather than failed.
+"""
+
+import logging
+import threading
+import time
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+from core.utils.cache_keys import throttle_key
+
+logger = logging.getLogger(__name__)
+
+PERIODS = {"s": 1, "m": 60, "h": 60 * 60, "d": 24 * 60 * 60}
+
+# KEYS: bucket keys. ARGV: capacity and refill rate (tokens per second) of
+# each bucket in turn. Returns the seconds to wait, "0" when tokens were taken.
+TAKE_SCRIPT = """
+local now = redis.call('TIME')
+now = tonumber(now[1]) + tonumber(now[2]) / 1000000
+local tokens = {}
+local wait = 0
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[2 * i - 1])
+    local rate = tonumber(ARGV[2 * i])
+    local state = redis.call('HMGET', key, 'tokens', 'ts')
+    local available = tonumber(state[1]) or capacity
+    local elapsed = math.max(0, now - (tonumber(state[2]) or now))
+    tokens[i] = math.min(capacity, available + elapsed * rate)
+    if tokens[i] < 1 then
+        wait = math.max(wait, (1 - tokens[i]) / rate)
+    end
+end
+if wait > 0 then
+    return tostring(wait)
+end
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[2 * i - 1])
+    local rate = tonumber(ARGV[2 * i])
+    redis.call('HSET', key, 'tokens', tokens[i] - 1, 'ts', now)
+    redis.call('EXPIRE', key, math.ceil(capacity / rate))
+end
+return '0'
+"""
+
+
+def parse_rate(rate):
+    """
+    "5/min" -> (capacity 5, refill 5/60 tokens per second)
+    """
+    count, period = rate.split("/")
+    count = int(count)
+    return count, count / PERIODS[period[0]]
+
+
+class RedisBuckets:
+    def __init__(self, url):
+        import redis
+
+        self.client = redis.Redis.from_url(url, socket_timeout=0.1)
+        self.script = self.client.register_script(TAKE_SCRIPT)
+
+    def take(self, buckets):
+        """
+        Take a token from every (key, capacity, rate) bucket, or from none.
+
+        Returns 0 on success, otherwise the seconds until all have a token.
+        """
+        args = [value for _, capacity, rate in buckets for value in (capacity, rate)]
+        try:
+            return float(self.script(keys=[key for key, _, _ in buckets], args=args))
+        except Exception:
+            logger.warning("Throttle store unavailable; allowing request", exc_info=True)
+            return 0
+
+
+class LocalBuckets:
+    """
+    In-process stand-in for RedisBuckets.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.buckets = {}  # key -> (tokens, timestamp)
+
+    def take(self, buckets):
+        now = time.monotonic()
+        with self.lock:
+            tokens = []
+            for key, capacity, rate in buckets:
+                available, ts = self.buckets.get(key, (capacity, now))
+                tokens.append(min(capacity, available + (now - ts) * rate))
+            wait = max(
+                ((1 - available) / rate for available, (_, _, rate) in zip(tokens, buckets)),
+                default=0,
+            )
+            if wait > 0:
+                return wait
+            for available, (key, _, _) in zip(tokens, buckets):
+                self.buckets[key] = (available - 1, now)
+            return 0
+
+
+@lru_cache(maxsize=None)
+def get_buckets():
+    url = settings.THROTTLE_URL
+    if url.startswith("memory://"):
+        return LocalBuckets()
+    return RedisBuckets(url)
+
+
+@receiver(setting_changed)
+def reset_buckets(setting, **kwargs):
+    if setting == "THROTTLE_URL":
+        get_buckets.cache_clear()
+
+
+class BucketThrottle(BaseThrottle):
+    """
+    Throttle taking one token per applicable scope in a single store call.
+
+    Subclasses return (scope, ident) pairs from `get_idents`; pairs with no
+    ident or no configured rate are skipped.
+    """
+
+    def get_idents(self, request, view):
+        raise NotImplementedError
+
+    def allow_request(self, request, view):
+        rates = api_settings.DEFAULT_THROTTLE_RATES
+        buckets = [
+            (throttle_key(scope, ident), *parse_rate(rates[scope]))
+            for scope, ident in self.get_idents(request, view)
+            if ident and rates.get(scope)
+        ]
+        self.wait_seconds = get_buckets().take(buckets) if buckets else 0
+        return self.wait_seconds == 0
+
+    def wait(self):
+        return self.wait_seconds
+
+
+class AnonSearchThrottle(BucketThrottle):
+    """
+    Anonymous searches, per IP.
+    """
+
+    def get_idents(self, request, view):
+        if request.user.is_authenticated or not request.query_params.get("search"):
+            return []
+        return [("search_anon", self.get_ident(request))]
+
+
+class LoginThrottle(BucketThrottle):
+    """
+    Login attempts, per IP and per username.
+    """
+
+    def get_idents(self, request, view):
+        username = request.data.get("username")
+        return [
+            ("login_ip", self.get_ident(request)),
+            ("login_username", username.lower() if isinstance(username, str) else None),
+        ]
+
+
+class RegisterThrottle(BucketThrottle):
+    """
+    Account registrations, per IP.
+    """
+
+    def get_idents(self, request, view):
+        return [("register", self.get_ident(request))]
+
+
+class ApplyThrottle(BucketThrottle):
+    """
+    Job applications, per user.
+    """
+
+    def get_idents(self, request, view):
+        if request.method != "POST":
+            return []
+        return [("apply", str(request.user.pk))]
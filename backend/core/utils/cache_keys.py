@@ -4,3 +4,31 @@ def job_list_key():
 
 def job_detail_key(job_id: int):
     return f"jobs:detail:{job_id}"
+
+
+def application_idempotency_key(user_id: int, job_id: int, key: str):
+    return f"applications:idempotency:{user_id}:{job_id}:{key}"
+
+
+def task_metric_key(task_name: str, metric: str):
+    return f"celery:metrics:{task_name}:{metric}"
+
+
+def user_token_version_key(user_id: int):
+    return f"accounts:token-version:{user_id}"
+
+
+def token_blacklist_key(jti: str):
+    return f"accounts:token-blacklist:{jti}"
+
+
+def token_blacklist_bloom_key(day: int):
+    return f"accounts:token-blacklist:bloom:{day}"
+
+
+def token_blacklist_count_key(day: int):
+    return f"accounts:token-blacklist:count:{day}"
+
+
+def throttle_key(scope: str, ident: str):
+    return f"throttle:{scope}:{ident}"
@@ -1,3 +1,34 @@
-from django.shortcuts import render
+from celery import current_app
+from drf_spectacular.utils import extend_schema
+from rest_framework import generics, permissions
+from rest_framework.response import Response
 
-# Create your views here.
+from accounts.permissions import IsAdmin
+
+from .task_metrics import queue_depths, snapshot
+
+
+@extend_schema(
+    tags=["Metrics"],
+    summary="Background Task Metrics",
+    description="""
+### GET /api/v1/metrics/tasks/
+
+- **Purpose:** Health of the Celery background tasks.
+- **Access:** Admin only.
+- **Response:**
+  - `tasks` – for every task: `succeeded` / `failed` / `retried` counts, and `latency` (waiting in the queue before starting) and `runtime` histograms with cumulative `buckets` in seconds.
+  - `queues` – messages currently waiting in each broker queue (`null` if the broker is unreachable).
+""",
+    responses={200: dict},
+)
+class TaskMetricsView(generics.GenericAPIView):
+    permission_classes = [permissions.IsAuthenticated, IsAdmin]
+
+    def get(self, request, *args, **kwargs):
+        return Response(
+            {
+                "tasks": snapshot(current_app),
+                "queues": queue_depths(current_app),
+            }
+        )
@@ -8,3 +8,6 @@ app = Celery("job_board")
 
 app.config_from_object("django.conf:settings", namespace="CELERY")
 app.autodiscover_tasks()
+
+# Connects the task metrics signal receivers
+import core.task_metrics  # noqa: E402, F401
@@ -14,6 +14,7 @@ from datetime import timedelta
 from pathlib import Path
 
 import environ
+from celery.schedules import crontab
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -44,6 +45,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "rest_framework",
     "drf_spectacular",
     "django_filters",
@@ -149,14 +151,29 @@ AUTH_USER_MODEL = "accounts.User"
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "accounts.authentication.ClaimsJWTAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    # Reverse proxies in front of the app; throttles identify clients by the
+    # X-Forwarded-For hop they appended, or by REMOTE_ADDR when this is 0.
+    # The header itself is client-supplied and never trusted beyond that.
+    "NUM_PROXIES": env.int("NUM_PROXIES", default=0),
+    # Token buckets per scope (core.throttling): capacity/period
+    "DEFAULT_THROTTLE_RATES": {
+        "search_anon": env("THROTTLE_SEARCH_ANON", default="30/min"),
+        "login_ip": env("THROTTLE_LOGIN_IP", default="20/min"),
+        "login_username": env("THROTTLE_LOGIN_USERNAME", default="5/min"),
+        "register": env("THROTTLE_REGISTER", default="10/hour"),
+        "apply": env("THROTTLE_APPLY", default="30/hour"),
+    },
 }
 
+# Throttle buckets (core.throttling); "memory://" keeps them in process
+THROTTLE_URL = env("THROTTLE_URL", default="redis://localhost:6379/3")
+
 # Optional: configure JWT token lifetimes
 
 SIMPLE_JWT = {
@@ -168,8 +185,22 @@ SIMPLE_JWT = {
     ),
     "ROTATE_REFRESH_TOKENS": True,
     "BLACKLIST_AFTER_ROTATION": True,
+    # Tokens carry role, company and token version claims (accounts.authentication)
+    "TOKEN_OBTAIN_SERIALIZER": "accounts.serializers.ClaimsTokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "accounts.serializers.ClaimsTokenRefreshSerializer",
+    "TOKEN_BLACKLIST_SERIALIZER": "accounts.serializers.ClaimsTokenBlacklistSerializer",
 }
 
+# Rotated and logged-out refresh tokens (accounts.token_blacklist);
+# "memory://" keeps the blacklist in process
+TOKEN_BLACKLIST_URL = env("TOKEN_BLACKLIST_URL", default="redis://localhost:6379/2")
+
+# Login password checks per process (accounts.hashing): this many hash at
+# once, this many more wait, and further logins get a 503. Keep the sum below
+# the worker's request threads so logins cannot occupy all of them.
+LOGIN_HASHING_WORKERS = env.int("LOGIN_HASHING_WORKERS", default=2)
+LOGIN_HASHING_QUEUE = env.int("LOGIN_HASHING_QUEUE", default=2)
+
 SPECTACULAR_SETTINGS = {
     "TITLE": "Job Board API",
     "DESCRIPTION": "API for job listings, categories, locations, and authentication",
@@ -180,10 +211,23 @@ SPECTACULAR_SETTINGS = {
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
+# Resumes are served through a permission-checked view. In production the
+# transfer is handed to the front proxy: "nginx" (X-Accel-Redirect to an
+# `internal` location at PROTECTED_MEDIA_URL aliased to MEDIA_ROOT) or
+# "apache" (mod_xsendfile). Leave empty to let Django send the file.
+MEDIA_SENDFILE_BACKEND = env("MEDIA_SENDFILE_BACKEND", default="")
+PROTECTED_MEDIA_URL = "/protected-media/"
+
 
 DATA_UPLOAD_MAX_MEMORY_SIZE = 5 * 1024 * 1024  # 5 MB
 FILE_UPLOAD_MAX_MEMORY_SIZE = 5 * 1024 * 1024  # 5 MB
 
+# Hash uploads while they stream in (used for content-addressed resumes)
+FILE_UPLOAD_HANDLERS = [
+    "core.upload_handlers.HashingMemoryFileUploadHandler",
+    "core.upload_handlers.HashingTemporaryFileUploadHandler",
+]
+
 # =========================
 # CELERY + REDIS
 # =========================
@@ -192,6 +236,55 @@ CELERY_BROKER_URL = "redis://localhost:6379/0"
 CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 
+# CPU-bound resume parsing runs on its own prefork worker pool:
+#   celery -A job_board worker -Q resumes --pool=prefork
+# Tasks declare their queue in @shared_task(queue=...); see core.task_routing
+CELERY_TASK_DEFAULT_QUEUE = "default"
+CELERY_TASK_ROUTES = ("core.task_routing.route_task",)
+# Reserve one message at a time so a worker never sits on a backlog another
+# queue's tasks are waiting behind.
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+
+# Worker profiles for `manage.py run_worker <profile>`
+CELERY_WORKER_PROFILES = {
+    "interactive": {"queues": ["interactive"], "concurrency": 4},
+    # Also drains interactive tasks when that worker is saturated
+    "default": {"queues": ["default", "interactive"], "concurrency": 4},
+    "bulk": {"queues": ["bulk"], "concurrency": 2},
+    # Parsers hold on to memory; recycle processes regularly
+    "resumes": {"queues": ["resumes"], "concurrency": 2, "max_tasks_per_child": 100},
+}
+
+CELERY_BEAT_SCHEDULE = {
+    # Retries failed emails and catches anything a scheduled flush missed
+    "flush-queued-emails": {
+        "task": "core.tasks.flush_queued_emails",
+        "schedule": timedelta(minutes=1),
+    },
+    "collect-orphaned-resume-blobs": {
+        "task": "applications.tasks.collect_orphaned_resume_blobs",
+        "schedule": timedelta(hours=6),
+    },
+    "rollup-application-status-events": {
+        "task": "applications.tasks.rollup_application_status_events",
+        "schedule": timedelta(minutes=5),
+    },
+    "send-hourly-application-digests": {
+        "task": "applications.tasks.send_application_digests",
+        "schedule": crontab(minute=0),
+        "args": ("HOURLY",),
+    },
+    "send-daily-application-digests": {
+        "task": "applications.tasks.send_application_digests",
+        "schedule": crontab(minute=0, hour=8),
+        "args": ("DAILY",),
+    },
+    "archive-old-applications": {
+        "task": "applications.tasks.archive_old_applications",
+        "schedule": timedelta(days=1),
+    },
+}
+
 # =========================
 # CACHE (Redis)
 # =========================
@@ -211,6 +304,18 @@ LOGGING = {
         "console": {
             "class": "logging.StreamHandler",
         },
+        # JSON lines written by a background thread (core.audit_log)
+        "audit": {
+            "()": "core.audit_log.AuditQueueHandler",
+            "maxsize": 10000,
+        },
+    },
+    "loggers": {
+        "core.middleware.request_audit": {
+            "handlers": ["audit"],
+            "level": "INFO",
+            "propagate": False,
+        },
     },
     "root": {
         "handlers": ["console"],
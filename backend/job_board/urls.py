@@ -5,9 +5,6 @@ from drf_spectacular.views import (
     SpectacularSwaggerView,
 )
 
-from django.conf import settings
-from django.conf.urls.static import static
-
 urlpatterns = [
     path("admin/", admin.site.urls),
 
@@ -25,11 +22,9 @@ urlpatterns = [
     path("api/v1/accounts/", include("accounts.urls")),
     path("api/v1/jobs/", include("jobs.urls")),
     path("api/v1/applications/", include("applications.urls")),
+    path("api/v1/metrics/", include("core.urls")),
 ]
 
-
-if settings.DEBUG:
-    urlpatterns += static(
-        settings.MEDIA_URL,
-        document_root=settings.MEDIA_ROOT,
-    )
+# MEDIA_ROOT only holds resumes, which are served by the permission-checked
+# application-resume-download view; it is not mounted at MEDIA_URL, not even
+# with DEBUG on.
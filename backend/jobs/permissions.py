@@ -1,5 +1,7 @@
 from rest_framework.permissions import BasePermission, SAFE_METHODS
 
+from jobs.services.ownership import is_owner
+
 
 class IsAdminOrReadOnly(BasePermission):
     """
@@ -35,7 +37,7 @@ class IsAdminOrOwnerOrReadOnly(BasePermission):
 
         # Write permissions are only allowed to the owner of the company or an admin.
         # Assumes the model instance has a `created_by` attribute.
-        return obj.created_by == request.user or (request.user and request.user.is_authenticated and request.user.is_admin())
+        return is_owner(request, obj) or (request.user and request.user.is_authenticated and request.user.is_admin())
 
 
 class IsAdminOrEmployer(BasePermission):
@@ -56,4 +58,4 @@ class IsAdminOrResourceOwner(BasePermission):
     def has_object_permission(self, request, view, obj):
         return (
             request.user and request.user.is_authenticated and request.user.is_admin()
-        ) or (obj.created_by == request.user)
\ No newline at end of file
+        ) or is_owner(request, obj)
\ No newline at end of file
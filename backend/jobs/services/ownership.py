@@ -0,0 +1,59 @@
+"""
+Request-scoped ownership resolution shared by permission classes.
+
+Ownership is decided by comparing primary keys (`created_by_id`) instead of
+loading related user objects. Job owner lookups are memoized on the
+underlying HttpRequest, so OR-composed permissions such as
+`IsJobSeeker | IsJobOwner | IsAdmin` and the object-level checks that follow
+them never repeat a query within one request.
+"""
+
+from ..models import Job
+
+
+def _ownership_cache(request):
+    # DRF wraps the HttpRequest; memoize on the inner one so the cache is
+    # shared by everything that handles the same request.
+    http_request = getattr(request, "_request", request)
+    cache = getattr(http_request, "_job_owner_ids", None)
+    if cache is None:
+        cache = http_request._job_owner_ids = {}
+    return cache
+
+
+def _user_pk(request):
+    user = getattr(request, "user", None)
+    if user is None or not user.is_authenticated:
+        return None
+    return user.pk
+
+
+def is_owner(request, obj, field="created_by"):
+    """
+    Return True if the authenticated user is referenced by `obj.<field>`.
+    """
+    user_pk = _user_pk(request)
+    return user_pk is not None and getattr(obj, f"{field}_id") == user_pk
+
+
+def job_owner_id(request, job_pk):
+    """
+    Return the id of the user who created the job, or None if it does not exist.
+    """
+    cache = _ownership_cache(request)
+    job_pk = int(job_pk)
+    if job_pk not in cache:
+        cache[job_pk] = (
+            Job.objects.filter(pk=job_pk)
+            .values_list("created_by_id", flat=True)
+            .first()
+        )
+    return cache[job_pk]
+
+
+def is_job_owner(request, job_pk):
+    """
+    Return True if the authenticated user created the job.
+    """
+    user_pk = _user_pk(request)
+    return user_pk is not None and job_owner_id(request, job_pk) == user_pk
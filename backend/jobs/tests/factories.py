@@ -21,7 +21,7 @@ class LocationFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = Location
 
-    name = factory.Sequence(lambda n: f"Location {n}")
+    city = factory.Sequence(lambda n: f"City {n}")
 
 
 class CompanyFactory(factory.django.DjangoModelFactory):
@@ -38,9 +38,8 @@ class JobFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = Job
 
-    title = factory.Faker("job")
+    title = factory.Sequence(lambda n: f"Software Engineer {n}")
     description = factory.Faker("text")
-    requirements = factory.Faker("text")
     salary = factory.Faker("random_int", min=30000, max=150000)
     is_active = True
     created_by = factory.SubFactory(EmployerUserFactory)
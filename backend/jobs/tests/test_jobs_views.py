@@ -1,4 +1,5 @@
 import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
 from rest_framework import status
 from rest_framework.test import APIClient
 from django.urls import reverse
@@ -303,11 +304,11 @@ class TestJobApplicationListCreateView:
         url = reverse("job-application-list-create", kwargs={"job_pk": job.pk})
         data = {
             "cover_letter": "My cover letter",
-            "resume": "http://example.com/resume.pdf",
+            "resume": SimpleUploadedFile("resume.pdf", b"%PDF-1.4 resume"),
         }
-        response = api_client.post(url, data, format="json")
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert "You have already applied to this job." in response.data["non_field_errors"]
+        response = api_client.post(url, data, format="multipart")
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert response.data["detail"] == "You have already applied to this job."
 
     def test_employer_cannot_apply_to_job(self, authenticated_employer):
         api_client, _ = authenticated_employer
@@ -1,5 +1,10 @@
 from django.urls import path
-from applications.views import JobApplicationListCreateView
+from applications.views import (
+    ArchivedApplicationListView,
+    JobApplicationAnalyticsView,
+    JobApplicationListCreateView,
+    JobApplicationResumesZipView,
+)
 
 from jobs.views.category_views import (
     CategoryListCreateView,
@@ -32,6 +37,21 @@ urlpatterns = [
         JobApplicationListCreateView.as_view(),
         name="job-application-list-create",
     ),
+    path(
+        "<int:job_pk>/applications/analytics/",
+        JobApplicationAnalyticsView.as_view(),
+        name="job-application-analytics",
+    ),
+    path(
+        "<int:job_pk>/applications/resumes.zip",
+        JobApplicationResumesZipView.as_view(),
+        name="job-application-resumes-zip",
+    ),
+    path(
+        "<int:job_pk>/applications/archived/",
+        ArchivedApplicationListView.as_view(),
+        name="job-archived-application-list",
+    ),
     # Categories
     path("categories/", CategoryListCreateView.as_view(), name="category-list-create"),
     path(
@@ -3,6 +3,7 @@ from drf_spectacular.utils import extend_schema
 from rest_framework import filters, generics
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
 
+from core.throttling import AnonSearchThrottle
 from jobs.models import Job
 from jobs.permissions import IsAdminOrEmployer, IsAdminOrResourceOwner
 from jobs.serializers import JobSerializer
@@ -28,6 +29,7 @@ from jobs.serializers import JobSerializer
 - **Search:**
   - `title`
   - `description`
+  - Anonymous searches are rate limited per IP (`429` with `Retry-After`).
 - **Ordering:**
   - `created_at`
   - `salary`
@@ -73,6 +75,7 @@ class JobListCreateView(generics.ListCreateAPIView):
     ]
     search_fields = ["title", "description"]
     ordering_fields = ["created_at", "salary"]
+    throttle_classes = [AnonSearchThrottle]
 
     def get_permissions(self):
         if self.request.method == "POST":